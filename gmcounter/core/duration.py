@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+from operator import itemgetter
+
 
 def accumulate_and_trim(
     points: list,
@@ -16,22 +18,21 @@ def accumulate_and_trim(
     Returns (kept_points, new_accum_us, reached).
 
     kept_points   — points whose cumulative arrival time <= target_us.
+                    When nothing is trimmed this is *points* itself, so a
+                    batch handed over from the acquisition queue is passed
+                    on without a copy.
     new_accum_us  — updated accumulator (may exceed target_us on crossing).
     reached       — True if the target was crossed; caller should stop.
 
     target_us == 0 means infinite mode: all points kept, reached always False.
     """
     if target_us == 0:
-        total = accum_us + sum(v for _, v in points)
-        return list(points), total, False
+        total = accum_us + sum(map(itemgetter(1), points))
+        return points, total, False
 
-    kept = []
-    for point in points:
-        _, value = point
+    for i, (_, value) in enumerate(points):
         accum_us += value
-        if accum_us <= target_us:
-            kept.append(point)
-        else:
-            return kept, accum_us, True
+        if accum_us > target_us:
+            return points[:i], accum_us, True
 
-    return kept, accum_us, False
+    return points, accum_us, False
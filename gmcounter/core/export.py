@@ -9,7 +9,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from .models import MeasurementSession
 from .utils import (
@@ -30,7 +30,7 @@ class TabExport:
 
     filename_hint: str  # e.g. "gm_timing"
     columns: list[str]  # CSV header row
-    rows: list[list[str]]  # already-stringified data rows
+    rows: Sequence[Sequence[str]]  # stringified data rows (list or lazy view)
     metadata: dict  # Dublin-Core-style sidecar dict
     filename_tokens: list[str] = field(default_factory=list)
 
@@ -40,16 +40,25 @@ def build_gm_tab_export(
     *,
     tk_designation: str = "TK00",
     extra_metadata: Optional[dict] = None,
+    rows: Optional[Sequence[Sequence[str]]] = None,
 ) -> TabExport:
     """Build a TabExport from a completed GMTiming MeasurementSession.
 
-    This is pure composition — no I/O.
+    This is pure composition — no I/O.  *rows* may be passed by a caller that
+    keeps its samples column-wise (any sized, iterable row sequence);
+    ``session.points`` is then not read.
     """
     columns = ["Index", "Value (µs)", "Time"]
-    rows = [[str(p.index), str(p.value), p.timestamp] for p in session.points]
+    if rows is None:
+        rows = [[str(p.index), str(p.value), p.timestamp] for p in session.points]
 
-    start = session.start_time or datetime.now()
-    end = session.end_time or datetime.now()
+    start = session.start_time
+    end = session.end_time
+    if start is None or end is None:
+        # One clock read for both fallbacks keeps start <= end consistent
+        now = datetime.now()
+        start = start or now
+        end = end or now
 
     group_name = (
         session.group
@@ -83,19 +92,26 @@ def build_gm_tab_export(
     )
 
 
+def save_stamp(when: Optional[datetime] = None) -> str:
+    """Return the ``YYYY_MM_DD`` filename prefix for *when* (default: now)."""
+    return (when or datetime.now()).strftime("%Y_%m_%d")
+
+
 def compose_save_path(
     export: TabExport,
     base_dir: Path,
     *,
     index: int = 1,
     suffix: str = "",
+    stamp: Optional[str] = None,
 ) -> Path:
     """Compose the full save path for a TabExport without touching the filesystem.
 
     Returns an absolute path; the caller (save_service) creates directories and
-    writes the bytes.
+    writes the bytes.  *stamp* is the ``YYYY_MM_DD`` prefix; callers saving
+    several files for one measurement pass it in so it is formatted once.
     """
-    timestamp = datetime.now().strftime("%Y_%m_%d")
+    timestamp = stamp or save_stamp()
     if suffix and not suffix.startswith("-"):
         suffix = "-" + suffix
 
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from itertools import accumulate, groupby, islice, repeat
+from operator import itemgetter, truediv
 from typing import List
 
 
@@ -39,6 +41,7 @@ class IntervalBinner:
         self._counts: List[int] = [0] * self.repeats
         self._deltas: List[List[float]] = [[] for _ in range(self.repeats)]
         self._cum_us: float = 0.0
+        self._total: int = 0  # running sum of _counts
         self._first_feed_done: bool = False
 
     def feed(self, points: list) -> List[int]:
@@ -56,27 +59,53 @@ class IntervalBinner:
         if not self._first_feed_done and points:
             self._first_feed_done = True
             self._counts[0] += 1  # seed event #1 at t=0 into bin 0
-            if 0 not in touched:
-                touched.append(0)
-
-        for _, value in points:
-            self._cum_us += value
-            bin_idx = int(math.floor(self._cum_us / self.width_us))
+            self._total += 1
+            touched.append(0)
+
+        # Running device time after each delta, then each event's bin.  cum_us
+        # only grows, so events of one bin arrive as one consecutive run and
+        # each run is counted and copied into its bin with a single extend.
+        values = list(map(itemgetter(1), points))
+        cums = list(accumulate(values, initial=self._cum_us))
+        self._cum_us = cums[-1]
+        bin_of = map(
+            math.floor, map(truediv, islice(cums, 1, None), repeat(self.width_us))
+        )
+        for bin_idx, run in groupby(zip(bin_of, values), key=itemgetter(0)):
             if bin_idx < self.repeats:
-                self._counts[bin_idx] += 1
-                self._deltas[bin_idx].append(float(value))
-                if bin_idx not in touched:
+                deltas = list(map(float, map(itemgetter(1), run)))
+                self._counts[bin_idx] += len(deltas)
+                self._total += len(deltas)
+                self._deltas[bin_idx].extend(deltas)
+                if not touched or touched[-1] != bin_idx:
                     touched.append(bin_idx)
 
         return touched
 
     def total_count(self) -> int:
-        """True event count == N_deltas + 1 (the +1 seed in bin 0)."""
-        return sum(self._counts)
+        """True event count == N_deltas + 1 (the +1 seed in bin 0).
+
+        Kept as a running total by feed(), so this is O(1).
+        """
+        return self._total
+
+    @property
+    def counts(self) -> List[int]:
+        """Copy of the per-bin event counts — O(repeats), unlike :attr:`bins`."""
+        return list(self._counts)
+
+    @property
+    def cum_us(self) -> float:
+        """Device time of the last processed event in µs."""
+        return self._cum_us
 
     @property
     def bins(self) -> IntervalBins:
-        """Return a snapshot of the current binner state."""
+        """Return a snapshot of the current binner state.
+
+        Copies every per-bin delta list; live views that only need counts
+        use :attr:`counts` / :attr:`cum_us` instead.
+        """
         return IntervalBins(
             width_us=self.width_us,
             repeats=self.repeats,
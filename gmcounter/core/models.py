@@ -2,12 +2,15 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class MeasurementPoint:
-    """A single measurement data point."""
+    """A single measurement data point.
+
+    Slotted (no per-instance __dict__): one is created per exported sample.
+    """
 
     index: int
     value: float  # microseconds
@@ -66,12 +69,14 @@ class DeviceInfo:
     openbis_code: str = ""
 
 
-@dataclass(frozen=True)
-class Frame:
+class Frame(NamedTuple):
     """Immutable bundle passed across thread boundaries via Qt signals.
 
     Carries a single acquired data point from the acquisition thread to
-    the controller (and from there to the active experiment tab).
+    the controller (and from there to the active experiment tab).  A
+    NamedTuple because one is allocated per sample on the GUI thread: tuple
+    construction is done in C, whereas a frozen dataclass runs
+    object.__setattr__ once per field.
     """
 
     index: int
@@ -70,6 +70,7 @@ class ConnectionRetryService:
         reconnect_fn: Callable[[], bool],
         status_callback: Optional[Callable[[str, str], None]] = None,
         abort_flag: Optional[Callable[[], bool]] = None,
+        wait: Optional[Callable[[float], object]] = None,
     ) -> bool:
         """Try *reconnect_fn* up to max_attempts times with backoff.
 
@@ -77,8 +78,12 @@ class ConnectionRetryService:
             reconnect_fn: Returns True on success.
             status_callback: Called with (message, color) on each attempt.
             abort_flag: Callable returning True when the caller wants to stop.
+            wait: Backoff sleep taking seconds (default ``time.sleep``).  Pass
+                an interruptible wait such as ``threading.Event.wait`` so an
+                abort does not have to sit out a long backoff delay.
         """
         self.strategy.reset()
+        wait = wait or time.sleep
 
         while self.strategy.should_retry():
             if abort_flag and abort_flag():
@@ -92,7 +97,10 @@ class ConnectionRetryService:
                 status_callback(f"Wiederverbindung... {info}", "orange")
 
             _log.info("Reconnection %s — delay: %.0f ms", info, delay)
-            time.sleep(delay / 1000.0)
+            wait(delay / 1000.0)
+            if abort_flag and abort_flag():
+                _log.info("Reconnect aborted by caller")
+                return False
 
             try:
                 if reconnect_fn():
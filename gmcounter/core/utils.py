@@ -3,6 +3,7 @@
 import logging
 import re
 import statistics
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -61,10 +62,10 @@ def create_group_name(letter: str) -> str:
 
     Returns a string like "SoSe2024_Mo_A".
     """
-    month = datetime.now().month
-    semester = "WiSe" if 10 <= month <= 12 else "SoSe"
-    day = datetime.now().strftime("%a")[:2]
-    year = datetime.now().year
+    now = datetime.now()
+    semester = "WiSe" if 10 <= now.month <= 12 else "SoSe"
+    day = now.strftime("%a")[:2]
+    year = now.year
 
     if not letter or not re.match(r"^[A-Z]$", letter):
         _log.error("Invalid group letter: %s", letter)
@@ -85,3 +86,107 @@ def calculate_statistics(values: list[float]) -> dict:
         "max": max(values),
         "count": len(values),
     }
+
+
+class RunningStatistics:
+    """Incremental count/mean/std/min/max — O(1) per value and per query.
+
+    Uses Welford's update so the sample standard deviation stays accurate
+    for long runs of large, similar values (µs deltas), where the naive
+    sum/sum-of-squares formula loses precision.  Results match
+    calculate_statistics() on the same values.
+    """
+
+    __slots__ = ("count", "_mean", "_m2", "_min", "_max")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all values."""
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = 0.0
+        self._max = 0.0
+
+    def extend(self, values) -> None:
+        """Fold an iterable of values into the running totals."""
+        n = self.count
+        mean = self._mean
+        m2 = self._m2
+        lo = self._min
+        hi = self._max
+        for v in values:
+            if n == 0:
+                lo = hi = v
+            elif v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+            n += 1
+            delta = v - mean
+            mean += delta / n
+            m2 += delta * (v - mean)
+        self.count = n
+        self._mean = mean
+        self._m2 = m2
+        self._min = lo
+        self._max = hi
+
+    def merge(self, count: int, mean: float, m2: float, lo: float, hi: float) -> None:
+        """Fold in the summary of a separately reduced batch of *count* values.
+
+        *m2* is the batch's sum of squared deviations from its own *mean*.
+        Uses Chan et al.'s pairwise combination, so a caller holding the
+        batch as an array can reduce it in C and merge in O(1).
+        """
+        if count <= 0:
+            return
+        n = self.count
+        if n == 0:
+            self._min, self._max = lo, hi
+        else:
+            self._min = min(self._min, lo)
+            self._max = max(self._max, hi)
+        total = n + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * n * count / total
+        self.count = total
+
+    def as_dict(self) -> dict:
+        """Return the same keys as calculate_statistics()."""
+        if self.count == 0:
+            return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0, "count": 0}
+        std = (self._m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+        return {
+            "mean": self._mean,
+            "std": std,
+            "min": self._min,
+            "max": self._max,
+            "count": self.count,
+        }
+
+
+class TimeOfDayStamper:
+    """Format wall-clock times as ``HH:MM:SS.mmm`` from ``time.time_ns()``.
+
+    The ``HH:MM:SS`` prefix is only rebuilt when the second changes, so a
+    stream of per-batch stamps costs one integer division and an f-string
+    instead of a datetime object plus strftime each.
+    """
+
+    __slots__ = ("_sec", "_prefix")
+
+    def __init__(self) -> None:
+        self._sec = -1
+        self._prefix = ""
+
+    def __call__(self, now_ns: Optional[int] = None) -> str:
+        """Return the stamp for *now_ns* (default: the current time)."""
+        sec, rem = divmod(time.time_ns() if now_ns is None else now_ns, 1_000_000_000)
+        if sec != self._sec:
+            self._sec = sec
+            self._prefix = time.strftime("%H:%M:%S", time.localtime(sec))
+        return f"{self._prefix}.{rem // 1_000_000:03d}"
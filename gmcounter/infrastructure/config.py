@@ -32,7 +32,7 @@ def import_config(language: str = "de") -> dict:
             if config_path.exists():
                 with open(config_path, "r", encoding="utf-8") as f:
                     config = json.load(f)
-                    Debug.debug(f"Config loaded from: {config_path}")
+                    Debug.debug("Config loaded from: %s", config_path)
                     return config.get(language, config.get("de", {}))
         except (FileNotFoundError, json.JSONDecodeError):
             continue
@@ -46,7 +46,7 @@ def import_config(language: str = "de") -> dict:
                 Debug.debug("Config loaded from package resources (fallback).")
                 return config.get(language, config.get("de", {}))
     except Exception as e:  # pylint: disable=broad-except
-        Debug.debug(f"Failed to load config from package resources: {e}")
+        Debug.debug("Failed to load config from package resources: %s", e)
 
     Debug.error("config.json not found. Please ensure it exists in the project root.")
     return {}
@@ -34,7 +34,6 @@ import tempfile
 from datetime import datetime
 import sys
 import traceback
-import inspect
 
 
 class Debug:
@@ -49,6 +48,8 @@ class Debug:
         logger: The logger used for debug output
         DEBUG_LEVEL: Current debug level (0-3)
         LOG_FILE: Path to the log file
+        enabled_debug: True if debug() output reaches any handler; hot paths
+            can test it before building log arguments
     """
 
     # Debug level constants
@@ -61,6 +62,7 @@ class Debug:
     DEBUG_LEVEL = DEBUG_OFF
     LOG_FILE = None
     logger = None
+    enabled_debug = False
 
     @classmethod
     def init(cls, debug_level=DEBUG_LEVEL, log_dir=None, app_name="Application"):
@@ -74,6 +76,8 @@ class Debug:
             app_name: Application name used for the log file
         """
         cls.DEBUG_LEVEL = debug_level
+        # The file handler records DEBUG whenever logging is on at all
+        cls.enabled_debug = debug_level != cls.DEBUG_OFF
 
         # Use the "gmcounter" logger — parent of every gmcounter.* module logger.
         # This ensures all logging.getLogger(__name__) calls in the package
@@ -183,12 +187,21 @@ class Debug:
         cls.logger.info(message)
 
     @classmethod
-    def debug(cls, message):
+    def debug(cls, message, *args):
         """Log detailed debug information.
 
+        Formatting is deferred: ``message % args`` is only evaluated when debug
+        output is enabled, so pass arguments instead of an f-string.
+
         Args:
-            message: Debug information to log
+            message: Debug information to log (%-style format if args given)
+            *args: Values substituted into *message*
         """
+        if not cls.enabled_debug:
+            return
+        if args:
+            message = message % args
+
         # Klassennamen und Funktionsnamen ermitteln
         if cls.DEBUG_LEVEL >= cls.DEBUG_VERBOSE:
             prefix = cls._get_caller_info()
@@ -264,16 +277,16 @@ class Debug:
         Returns:
             str: Formatted information about the caller in the format [Class.Function]
         """
-        # Inspiziere den Stack, um Aufruferinformationen zu erhalten
-        stack = inspect.stack()
-
-        # Position 0 is this method
-        # Position 1 is the calling debug method (debug, info, error, etc.)
-        # Position 2 is the actual caller we want to identify
-        if len(stack) > 2:
-            caller = stack[2]
-            frame = caller.frame
-
+        # Walk the frame chain directly: inspect.stack() would build a
+        # FrameInfo (and read source context) for every frame on each call.
+        # Depth 0 is this method, 1 the calling debug method (debug, info,
+        # error, etc.), 2 the actual caller we want to identify.
+        try:
+            frame = sys._getframe(2)
+        except ValueError:
+            frame = None
+
+        if frame is not None:
             # Try to determine the class name
             class_name = ""
             if "self" in frame.f_locals:
@@ -281,7 +294,7 @@ class Debug:
                 class_name = instance.__class__.__name__
 
             # Get the function name
-            function_name = caller.function
+            function_name = frame.f_code.co_name
 
             # Create the formatted caller information
             if class_name:
@@ -3,8 +3,14 @@
 # Pure logic so it is unit-testable without PySide6 or hardware. The acquisition
 # thread (qt_threads.py) owns one of these and feeds it raw serial chunks.
 
+import struct
+from itertools import repeat
+from operator import truediv
 from typing import List, Tuple
 
+# One data packet's tick count, skipping the 0xAA/0x55 framing bytes.
+_PACKET_TICKS = struct.Struct("<xIx")
+
 
 class PacketParser:
     """Incremental decoder for the GM counter binary protocol.
@@ -19,7 +25,10 @@ class PacketParser:
     ``feed()`` appends a chunk and returns every newly completed point as
     ``(index, value_us)`` where ``value_us = ticks / ticks_per_us``.  Partial
     packets and a start marker split across two chunks are carried over.
-    The whole thing is a single O(n) pass — no per-packet reslicing.
+    The whole thing is a single O(n) pass — no per-packet reslicing.  Runs
+    of correctly framed packets (the normal case) are validated with two
+    strided slices and decoded by a single ``struct`` call; the byte-wise
+    loop only handles resync and the end-of-period sentinel.
 
     After ``feed()`` check ``end_of_period`` to see whether the firmware has
     signalled that the counting period is over.  Call ``clear_end_of_period()``
@@ -31,6 +40,15 @@ class PacketParser:
     PACKET_SIZE = 6
     START_MARKER = b"\xff\xff\xff\xff\xff\xff"
     END_OF_PERIOD_MARKER = b"\xee\xee\xee\xee\xee\xee"
+    # Upper bound on one bulk-decoded run, so a framing check after each
+    # resync only scans a bounded window rather than the whole buffer.
+    MAX_RUN = 4096
+    # Precompiled decoders for 1, 2, 4, ... packets.  A run is decoded as the
+    # sum of its power-of-two parts, so the set of formats stays fixed rather
+    # than compiling one per run length.
+    _RUN_BLOCKS = tuple(
+        struct.Struct("<" + "xIx" * (1 << k)) for k in range(MAX_RUN.bit_length())
+    )
 
     def __init__(self, ticks_per_us: float = 48.0) -> None:
         self._scale = float(ticks_per_us) or 1.0
@@ -94,7 +112,20 @@ class PacketParser:
             if buf[i] != self.START_BYTE or buf[i + 5] != self.END_BYTE:
                 i += 1  # resync: slide one byte and retry framing
                 continue
-            ticks = buf[i + 1] | buf[i + 2] << 8 | buf[i + 3] << 16 | buf[i + 4] << 24
+            run = self._framed_run(buf, i)
+            if run > 1:
+                ticks = self._unpack_run(buf, i, run)
+                first = self._index + 1
+                self._index += run
+                points.extend(
+                    zip(
+                        range(first, self._index + 1),
+                        map(truediv, ticks, repeat(scale)),
+                    )
+                )
+                i += run * self.PACKET_SIZE
+                continue
+            (ticks,) = _PACKET_TICKS.unpack_from(buf, i)
             self._index += 1
             points.append((self._index, ticks / scale))
             i += self.PACKET_SIZE
@@ -102,3 +133,26 @@ class PacketParser:
         if i:
             del buf[:i]
         return points
+
+    @classmethod
+    def _unpack_run(cls, buf: bytearray, i: int, run: int) -> List[int]:
+        """Tick counts of the *run* framed packets starting at *i*."""
+        ticks: List[int] = []
+        for k in range(run.bit_length() - 1, -1, -1):
+            if run >> k & 1:
+                block = cls._RUN_BLOCKS[k]
+                ticks.extend(block.unpack_from(buf, i))
+                i += block.size
+        return ticks
+
+    @classmethod
+    def _framed_run(cls, buf: bytearray, i: int) -> int:
+        """Number of consecutive well-framed packets starting at *i*."""
+        span = min(len(buf) - i, cls.MAX_RUN * cls.PACKET_SIZE)
+        end = i + span // cls.PACKET_SIZE * cls.PACKET_SIZE
+        starts = buf[i : end : cls.PACKET_SIZE]
+        ends = buf[i + 5 : end : cls.PACKET_SIZE]
+        return min(
+            len(starts) - len(starts.lstrip(b"\xaa")),
+            len(ends) - len(ends.lstrip(b"\x55")),
+        )
@@ -4,11 +4,15 @@
 import threading
 import time
 import logging
-from typing import Optional, Callable
+from collections import deque
+from typing import Deque, Optional, Callable
 
 from PySide6.QtCore import QThread, Signal  # pylint: disable=no-name-in-module
 
+from .config import import_config
 from .packet_parser import PacketParser
+from .session_journal import find_orphan_journals
+from ..core.reconnect_service import ConnectionRetryService
 
 _log = logging.getLogger(__name__)
 
@@ -23,16 +27,19 @@ class DataAcquisitionThread(QThread):
     - Measurement start marker: 0xFF × 6 (discards all data before it)
 
     Performance: each read cycle parses *all* complete packets in one pass over a
-    persistent ``bytearray`` (no per-packet reslicing) and emits a single
-    ``data_batch`` signal carrying the whole list.  At 10 kHz this replaces ~10k
-    queued cross-thread signals/s with a handful, which is the dominant host-side
-    cost — see docs.
+    persistent ``bytearray`` (no per-packet reslicing).  Short reads are
+    coalesced until ``emit_min_points`` are pending or ``emit_interval_ms`` has
+    elapsed, and the batch is then appended to a ready queue.  Only the first
+    batch after a :meth:`drain` raises ``data_available``; the GUI thread pulls
+    everything queued so far in one go.  At 10 kHz this replaces ~10k queued
+    cross-thread signals/s with at most one per GUI event-loop pass, which is
+    the dominant host-side cost — see docs.
     """
 
     CONNECTION_TIMEOUT = 3.0
     START_MARKER_TIMEOUT = 2.0
     # Public signals
-    data_batch = Signal(object)  # list[tuple[int index, float value_us]]
+    data_available = Signal()  # ready queue went non-empty; call drain()
     connection_lost = Signal()
     measurement_complete = Signal()  # firmware end-of-period sentinel (0xEE×6)
 
@@ -45,23 +52,33 @@ class DataAcquisitionThread(QThread):
         super().__init__()
         self.manager = manager
         self._running = False
-        self._last_data_time = time.time()
+        # All acquisition-loop times are time.monotonic() seconds: immune to
+        # wall-clock steps, and one clock read per chunk serves every check.
+        self._last_data_time = time.monotonic()
         self._connection_lost_emitted = False
         self._first_data_received = False
         self._measurement_start_time: Optional[float] = None
+        self._pending: list = []
+        self._last_emit = time.monotonic()
+        # Producer (this thread) appends batches, the GUI thread pops them;
+        # deque append/popleft are atomic, so no lock is needed.
+        self._ready: Deque[list] = deque()
+        self._ready_signalled = False
 
         # Tick → microsecond conversion (firmware sends raw timer ticks).
         try:
-            from .config import import_config
-
             acq = import_config().get("acquisition", {})
             ticks_per_us = float(acq.get("ticks_per_us", 48)) or 1.0
             self._read_chunk = int(acq.get("read_chunk_bytes", 8192))
             self._read_timeout_ms = int(acq.get("read_timeout_ms", 50))
+            self._emit_min_points = int(acq.get("emit_min_points", 32))
+            self._emit_interval_s = float(acq.get("emit_interval_ms", 10)) / 1000.0
         except Exception:  # pragma: no cover - config is best-effort here
             ticks_per_us = 48.0
             self._read_chunk = 8192
             self._read_timeout_ms = 50
+            self._emit_min_points = 32
+            self._emit_interval_s = 0.01
 
         self._parser = PacketParser(ticks_per_us=ticks_per_us)
 
@@ -71,10 +88,11 @@ class DataAcquisitionThread(QThread):
     def run(self) -> None:
         _log.info("DataAcquisitionThread started")
         self._running = True
-        self._last_data_time = time.time()
+        self._last_data_time = time.monotonic()
         self._connection_lost_emitted = False
         self._first_data_received = False
         self._measurement_start_time = None
+        self._pending = []
         self._parser.reset()
 
         while self._running:
@@ -94,11 +112,11 @@ class DataAcquisitionThread(QThread):
                     continue
 
                 if self._measurement_start_time is None:
-                    self._measurement_start_time = time.time()
+                    self._measurement_start_time = time.monotonic()
 
                 # Start-marker timeout — longer for mock devices
                 if not self._first_data_received:
-                    elapsed = time.time() - self._measurement_start_time
+                    elapsed = time.monotonic() - self._measurement_start_time
                     is_mock = getattr(device, "is_mock_device", False)
                     timeout = 30.0 if is_mock else self.START_MARKER_TIMEOUT
                     if elapsed > timeout:
@@ -115,25 +133,28 @@ class DataAcquisitionThread(QThread):
                 )
 
                 if raw:
-                    self._last_data_time = time.time()
+                    now = time.monotonic()
+                    self._last_data_time = now
                     self._connection_lost_emitted = False
                     points = self._parser.feed(raw)
                     if not self._first_data_received and self._parser.synced:
                         self._first_data_received = True
                         _log.info("Start marker found — stream synced")
                     if points:
-                        self.data_batch.emit(points)
+                        self._queue_points(points, now)
                     if self._parser.end_of_period:
                         _log.info(
                             "End-of-period sentinel received — emitting measurement_complete"
                         )
                         self._parser.clear_end_of_period()
+                        self._flush_pending()
                         self.measurement_complete.emit()
 
                 else:
+                    self._flush_pending()
                     if not self.manager.measurement_state.measurement_active:
                         if (
-                            time.time() - self._last_data_time
+                            time.monotonic() - self._last_data_time
                         ) > self.CONNECTION_TIMEOUT:
                             if not self._connection_lost_emitted:
                                 _log.error("Connection timeout — no data")
@@ -151,8 +172,63 @@ class DataAcquisitionThread(QThread):
                     self._connection_lost_emitted = True
                 time.sleep(0.1)
 
+        self._flush_pending()
         _log.info("DataAcquisitionThread stopped")
 
+    def _queue_points(self, points: list, now: Optional[float] = None) -> None:
+        """Add parsed points to the pending batch and emit it when due.
+
+        *now* is the monotonic time the chunk was read, if the caller has it.
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._pending:
+            self._pending.extend(points)
+        else:
+            self._pending = points
+        if (
+            len(self._pending) >= self._emit_min_points
+            or now - self._last_emit >= self._emit_interval_s
+        ):
+            self._flush_pending(now)
+
+    def _flush_pending(self, now: Optional[float] = None) -> None:
+        """Move pending points to the ready queue, signalling if it was idle."""
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self._ready.append(batch)
+            if not self._ready_signalled:
+                self._ready_signalled = True
+                self.data_available.emit()
+        self._last_emit = time.monotonic() if now is None else now
+
+    def drain(self) -> list:
+        """Return every ready ``(index, value_us)`` point (GUI thread).
+
+        The signalled flag is cleared *before* popping, so a batch queued
+        while draining either lands in this call or raises a fresh
+        ``data_available``.  Batches are owned by the queue once flushed, so
+        the first one is returned as is and later ones are appended to it —
+        the usual single-batch drain copies nothing.
+        """
+        self._ready_signalled = False
+        ready = self._ready
+        if not ready:
+            return []
+        points = ready.popleft()
+        while ready:
+            points.extend(ready.popleft())
+        return points
+
+    def discard(self) -> None:
+        """Drop every ready batch without concatenating it (GUI thread).
+
+        Used instead of :meth:`drain` while no measurement is accepting data,
+        so stray points arriving after a stop cost one ``deque.clear()``.
+        """
+        self._ready_signalled = False
+        self._ready.clear()
+
     def reset_connection_lost(self) -> None:
         """Allow connection-loss detection to fire again after a successful reconnect."""
         self._connection_lost_emitted = False
@@ -161,6 +237,8 @@ class DataAcquisitionThread(QThread):
         old = self._parser.index
         self._first_data_received = False
         self._measurement_start_time = None
+        self._pending = []
+        self._ready.clear()
         self._parser.reset()
         _log.info("Acquisition index reset from %d to 0", old)
 
@@ -181,11 +259,18 @@ class StatePollerThread(QThread):
     before any measurement starts so no SCPI command is in-flight when INIT
     is sent.  pause() blocks until the current get_data() call finishes,
     guaranteeing the serial port is fully idle before returning.
+
+    ``data_ready`` only fires when the polled state differs from the last
+    emitted one, for forced polls, on the first poll after resume(), and
+    as a heartbeat on the ``_HEARTBEAT_POLLS``-th poll after the last
+    emission (so an unchanged state is re-sent once per that many polls) —
+    an idle device does not cost the GUI a full LCD refresh every second.
     """
 
     data_ready = Signal(dict)
 
     _POLL_INTERVAL_S = 1.0
+    _HEARTBEAT_POLLS = 5
 
     def __init__(self, manager) -> None:
         super().__init__()
@@ -194,6 +279,8 @@ class StatePollerThread(QThread):
         self._poll_lock = threading.Lock()
         self._enabled = True
         self._wake_event = threading.Event()
+        self._last_data: Optional[dict] = None
+        self._quiet_polls = 0
 
     def pause(self) -> None:
         """Disable polling and wait for any in-flight get_data() to complete."""
@@ -204,14 +291,29 @@ class StatePollerThread(QThread):
         """Re-enable polling after a measurement has stopped."""
         with self._poll_lock:
             self._enabled = True
+            self._last_data = None  # the next poll always reaches the GUI
 
     def force_poll_soon(self) -> None:
         """Wake the poller immediately so a fresh state is fetched without waiting."""
         self._wake_event.set()
 
+    def _publish(self, data: dict, forced: bool = False) -> None:
+        """Emit *data* if it changed, was forced, or the heartbeat is due."""
+        if (
+            forced
+            or data != self._last_data
+            or self._quiet_polls + 1 >= self._HEARTBEAT_POLLS
+        ):
+            self._last_data = data
+            self._quiet_polls = 0
+            self.data_ready.emit(data)
+        else:
+            self._quiet_polls += 1
+
     def run(self) -> None:
         _log.info("StatePollerThread started")
         self._running = True
+        forced = False
         while self._running:
             with self._poll_lock:
                 if (
@@ -223,12 +325,12 @@ class StatePollerThread(QThread):
                     try:
                         data = self.manager.device.get_data()
                         if data:
-                            self.data_ready.emit(data)
+                            self._publish(data, forced)
                     except Exception as exc:
                         _log.debug("State poller error: %s", exc)
             # Use event-based wait so force_poll_soon() wakes the thread
             # immediately instead of waiting up to _POLL_INTERVAL_S.
-            self._wake_event.wait(self._POLL_INTERVAL_S)
+            forced = self._wake_event.wait(self._POLL_INTERVAL_S)
             self._wake_event.clear()
         _log.info("StatePollerThread stopped")
 
@@ -274,14 +376,13 @@ class ReconnectWorker(QThread):
         self._initial_delay_ms = initial_delay_ms
         self._max_delay_ms = max_delay_ms
         self._backoff_factor = backoff_factor
-        self._abort = False
+        # Set by abort(); also wakes the backoff wait between attempts
+        self._abort = threading.Event()
 
     def abort(self) -> None:
-        self._abort = True
+        self._abort.set()
 
     def run(self) -> None:
-        from ..core.reconnect_service import ConnectionRetryService
-
         svc = ConnectionRetryService(
             max_attempts=self._max_attempts,
             initial_delay_ms=self._initial_delay_ms,
@@ -295,10 +396,46 @@ class ReconnectWorker(QThread):
         result = svc.attempt_reconnect(
             self._reconnect_fn,
             status_callback=_status,
-            abort_flag=lambda: self._abort,
+            abort_flag=self._abort.is_set,
+            wait=self._abort.wait,
         )
 
         if result:
             self.succeeded.emit()
         else:
             self.failed.emit()
+
+
+class ShutdownWorker(QThread):
+    """Runs a blocking shutdown callable (thread joins, port close) off the GUI thread.
+
+    Callers continue on the GUI thread from the inherited ``finished`` signal.
+    """
+
+    def __init__(self, shutdown_fn: Callable[[], None], parent=None) -> None:
+        super().__init__(parent)
+        self._shutdown_fn = shutdown_fn
+
+    def run(self) -> None:
+        try:
+            self._shutdown_fn()
+        except Exception as exc:
+            _log.error("Error during shutdown: %s", exc, exc_info=True)
+
+
+class OrphanJournalScanWorker(QThread):
+    """Scans for unfinalized session journals off the GUI thread.
+
+    Journals of crashed sessions can be large; ``found`` delivers the list
+    of orphan paths (possibly empty) once the scan is done.
+    """
+
+    found = Signal(list)
+
+    def run(self) -> None:
+        try:
+            orphans = find_orphan_journals()
+        except Exception as exc:
+            _log.error("Orphan journal scan failed: %s", exc, exc_info=True)
+            orphans = []
+        self.found.emit(orphans)
@@ -10,6 +10,10 @@ from ..core.export import TabExport, compose_save_path
 
 _log = logging.getLogger(__name__)
 
+# Write buffer for export CSVs: large enough that a long session still goes
+# out in a few big writes, small enough that the table is never held whole.
+_WRITE_BUFFER = 1 << 20
+
 
 def write_export(export: TabExport, csv_path: Path) -> Path:
     """Write *export* to *csv_path* + adjacent *_MD.json* sidecar.
@@ -20,7 +24,10 @@ def write_export(export: TabExport, csv_path: Path) -> Path:
     csv_path = Path(csv_path)
     csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as fh:
+    # Stream rows to disk as they are formatted (see _WRITE_BUFFER)
+    with open(
+        csv_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER
+    ) as fh:
         writer = csv.writer(fh)
         writer.writerow(export.columns)
         writer.writerows(export.rows)
@@ -53,11 +60,15 @@ class SaveService:
         self,
         export: TabExport,
         suffix: str = "",
+        stamp: str | None = None,
     ) -> Path:
-        """Write *export* to an auto-composed path and return it."""
+        """Write *export* to an auto-composed path and return it.
+
+        *stamp* is an optional precomputed date prefix (see core.export.save_stamp).
+        """
         self._index += 1
         csv_path = compose_save_path(
-            export, self.base_dir, index=self._index, suffix=suffix
+            export, self.base_dir, index=self._index, suffix=suffix, stamp=stamp
         )
         try:
             write_export(export, csv_path)
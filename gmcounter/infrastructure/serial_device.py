@@ -100,6 +100,14 @@ class SerialDevice:
             self.connected = False
             return False
 
+    def _use_timeout(self, timeout: float) -> None:
+        # pyserial reconfigures the port (tcgetattr/tcsetattr) on every
+        # timeout assignment, even an unchanged one, so only assign on change.
+        # read_fast() leaves its short timeout in place across calls; the
+        # line-based readers switch back to self.timeout before reading.
+        if self.serial.timeout != timeout:
+            self.serial.timeout = timeout
+
     def _wait_for_data(self, timeout: float) -> bool:
         if not self.serial:
             return False
@@ -123,6 +131,7 @@ class SerialDevice:
             if not self._wait_for_data(timeout):
                 _log.debug("Timeout: no data available")
                 return None
+            self._use_timeout(self.timeout)
             raw = self.serial.readline()
             if not raw:
                 return None
@@ -151,19 +160,20 @@ class SerialDevice:
     ) -> Optional[bytes]:
         if not self.serial or not self.serial.is_open:
             return None
-        original = self.serial.timeout
         try:
-            self.serial.timeout = timeout_ms * 0.001
+            self._use_timeout(timeout_ms * 0.001)
             if delimiter:
+                # Byte-wise so nothing past the delimiter is consumed, but
+                # only the newly reachable tail is searched each step.
                 buf = bytearray()
+                tail = len(delimiter) - 1
                 while len(buf) < max_bytes:
                     chunk = self.serial.read(1)
                     if not chunk:
                         break
-                    buf.extend(chunk)
-                    if delimiter in bytes(buf):
-                        pos = buf.find(delimiter)
-                        return bytes(buf[: pos + len(delimiter)])
+                    buf += chunk
+                    if buf.find(delimiter, max(0, len(buf) - tail - 1)) != -1:
+                        return bytes(buf)
                 return bytes(buf)
             buf = self.serial.read(max_bytes)
             return buf if buf else b""
@@ -171,8 +181,6 @@ class SerialDevice:
             _log.error("Serial error in fast read: %s", exc)
             self.connected = False
             return None
-        finally:
-            self.serial.timeout = original
 
     def read_text_response(self, timeout: float = DEFAULT_READ_TIMEOUT) -> str:
         if not self.serial or not self.serial.is_open:
@@ -180,6 +188,7 @@ class SerialDevice:
         parts: list[str] = []
         start = time()
         try:
+            self._use_timeout(self.timeout)
             while (time() - start) < timeout:
                 if not self._wait_for_data(min(0.1, timeout - (time() - start))):
                     if parts:
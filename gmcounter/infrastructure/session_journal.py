@@ -14,9 +14,10 @@ import logging
 import os
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Iterable, Optional, Tuple
 
 _log = logging.getLogger(__name__)
 
@@ -27,7 +28,11 @@ FSYNC_INTERVAL_S = 1.0
 class SessionJournal:
     """Append-only on-disk journal for one measurement session.
 
-    Thread-safe: a background flush loop calls fsync every ~1 s.
+    Thread-safe.  record()/record_batch() only queue rows; a background
+    thread writes them out and calls fsync every ~1 s, so the caller (the
+    GUI thread) never waits on CSV formatting or disk I/O.  The writer
+    sleeps on a condition while nothing is queued instead of waking on a
+    timer.
     """
 
     def __init__(self, session_dir: Optional[Path] = None) -> None:
@@ -39,6 +44,8 @@ class SessionJournal:
         self._writer = csv.writer(self._fh)
         self._lock = threading.Lock()
         self._finalized = False
+        # (epoch_s, [(index, value_us), ...]) batches not yet written
+        self._pending: Deque[Tuple[float, list]] = deque()
 
         # Write header if new file
         if self._path.stat().st_size == 0:
@@ -48,6 +55,8 @@ class SessionJournal:
         self._closed = False
 
         self._stop_event = threading.Event()
+        # Signalled by record_batch() and on stop; the flush thread waits here
+        self._wake = threading.Condition()
         self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
         self._flush_thread.start()
 
@@ -58,14 +67,30 @@ class SessionJournal:
 
     def record(self, index: int, value_us: float) -> None:
         """Append one data point row."""
+        self.record_batch([(index, value_us)])
+
+    def record_batch(self, points: Iterable[Tuple[int, float]]) -> None:
+        """Queue a batch of ``(index, value_us)`` rows sharing one timestamp.
+
+        Returns immediately; the rows reach the file on the next flush.  A
+        list is queued as is (the caller hands it over and must not mutate
+        it afterwards); any other iterable is copied.  Once the journal is
+        finalized or closed the writer thread is gone, so batches are dropped.
+        """
+        if not isinstance(points, list):
+            points = list(points)
         with self._lock:
-            if self._closed:
+            if self._closed or self._finalized:
+                _log.debug("Journal no longer open; dropped %d rows", len(points))
                 return
-            self._writer.writerow([time.time(), "data", index, value_us])
+            self._pending.append((time.time(), points))
+        with self._wake:
+            self._wake.notify()
 
     def mark_gap(self) -> None:
         """Mark a reconnect gap in the journal."""
         with self._lock:
+            self._write_pending()
             self._writer.writerow([time.time(), "gap", "", ""])
             self._fh.flush()
         _log.info("Journal gap marker written")
@@ -75,20 +100,24 @@ class SessionJournal:
         if self._finalized:
             return
         with self._lock:
+            self._write_pending()
             self._writer.writerow([time.time(), "finalized", "", ""])
             self._fh.flush()
             try:
                 os.fsync(self._fh.fileno())
             except OSError:
                 pass
-        self._finalized = True
-        self._stop_event.set()
+            self._finalized = True
+        self._stop()
         _log.info("Journal finalized: %s", self._path)
 
     def close(self) -> None:
         with self._lock:
             self._closed = True
-        self._stop_event.set()
+            self._write_pending()
+        self._stop()
+        # The flush thread fsyncs outside the lock; let it finish first
+        self._flush_thread.join(timeout=2.0)
         try:
             self._fh.flush()
             os.fsync(self._fh.fileno())
@@ -103,18 +132,60 @@ class SessionJournal:
     # ------------------------------------------------------------------
     # Internal
 
+    def _write_pending(self) -> None:
+        """Write queued batches to the file buffer (caller holds the lock)."""
+        pending = self._pending
+        writerows = self._writer.writerows
+        while pending:
+            epoch, points = pending.popleft()
+            writerows([epoch, "data", index, value] for index, value in points)
+
+    def _stop(self) -> None:
+        self._stop_event.set()
+        with self._wake:
+            self._wake.notify()
+
     def _flush_loop(self) -> None:
-        while not self._stop_event.wait(timeout=FSYNC_INTERVAL_S):
-            with self._lock:
-                try:
+        stopped = self._stop_event.is_set
+        while True:
+            with self._wake:
+                self._wake.wait_for(lambda: self._pending or stopped())
+            # Let a second of batches collect so fsync stays at ~1 Hz
+            if self._stop_event.wait(timeout=FSYNC_INTERVAL_S):
+                return
+            try:
+                with self._lock:
+                    self._write_pending()
                     self._fh.flush()
-                    os.fsync(self._fh.fileno())
-                except OSError:
-                    pass
+                # fsync without the lock so record_batch() never waits on disk
+                os.fsync(self._fh.fileno())
+            except OSError:
+                pass
+
+
+def _is_finalized_or_empty(journal: Path) -> bool:
+    """Stream *journal* row by row; True if it has no rows or was finalized.
+
+    A crashed high-rate session can leave millions of rows behind, so the
+    file is never materialized as a list.
+    """
+    has_rows = False
+    with open(journal, "r", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        next(reader, None)  # header
+        for row in reader:
+            has_rows = True
+            if len(row) >= 2 and row[1] == "finalized":
+                return True
+    return not has_rows
 
 
 def find_orphan_journals() -> list[Path]:
-    """Return paths to unfinalized journals from today's sessions."""
+    """Return paths to unfinalized journals from today's sessions.
+
+    Reads every journal of the day; call it off the GUI thread (see
+    qt_threads.OrphanJournalScanWorker).
+    """
     if not JOURNAL_DIR.exists():
         return []
 
@@ -127,10 +198,7 @@ def find_orphan_journals() -> list[Path]:
         if not journal.exists():
             continue
         try:
-            with open(journal, "r", encoding="utf-8") as fh:
-                rows = list(csv.reader(fh))
-            kinds = {row[1] for row in rows[1:] if len(row) >= 2}
-            if "finalized" not in kinds and len(rows) > 1:
+            if not _is_finalized_or_empty(journal):
                 orphans.append(journal)
         except Exception as exc:
             _log.error("Error reading journal %s: %s", journal, exc)
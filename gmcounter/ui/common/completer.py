@@ -0,0 +1,135 @@
+"""Substring completer for the editable sample / detector comboboxes."""
+
+from collections import defaultdict
+from typing import Optional, Sequence
+
+from PySide6.QtCore import (  # pylint: disable=no-name-in-module
+    QEvent,
+    QModelIndex,
+    QObject,
+    QSortFilterProxyModel,
+    QStringListModel,
+)
+from PySide6.QtWidgets import QComboBox, QCompleter  # pylint: disable=no-name-in-module
+
+# Qt 6.9 replaced invalidateFilter() with a begin/endFilterChange() pair.
+_HAS_FILTER_CHANGE = hasattr(QSortFilterProxyModel, "beginFilterChange")
+
+
+class ContainsFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive substring filter over a fixed list of strings.
+
+    The candidates are casefolded once up front and the matching row set is
+    computed in set_needle(), so filterAcceptsRow() is a set lookup instead
+    of Qt's per-row case-folding QString::contains.  When the user extends
+    the previous needle only its matches are re-checked; otherwise needles
+    of three or more characters are narrowed through a trigram index before
+    any substring test runs, so large sample lists stay cheap per keystroke.
+    """
+
+    def __init__(self, items: Sequence[str], parent: Optional[QObject] = None) -> None:
+        """Initialize the proxy over *items*.
+
+        Args:
+            items: Completion candidates in display order
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self._folded = [item.casefold() for item in items]
+        self._trigrams: dict[str, set[int]] = defaultdict(set)
+        for row, text in enumerate(self._folded):
+            for i in range(len(text) - 2):
+                self._trigrams[text[i : i + 3]].add(row)
+        self._needle = ""
+        self._matches: Optional[set[int]] = None  # None = every row
+        self.setSourceModel(QStringListModel(list(items), self))
+
+    def set_needle(self, text: str) -> None:
+        """Filter the candidates down to those containing *text*.
+
+        Args:
+            text: Current editor text (case is ignored)
+        """
+        needle = text.casefold()
+        if needle == self._needle:
+            return
+        matches = self._find_matches(needle)
+        if _HAS_FILTER_CHANGE:
+            self.beginFilterChange()
+            self._needle = needle
+            self._matches = matches
+            self.endFilterChange()
+        else:
+            self._needle = needle
+            self._matches = matches
+            self.invalidateFilter()
+
+    def _find_matches(self, needle: str) -> Optional[set[int]]:
+        """Rows whose text contains *needle*; None for the empty needle."""
+        if not needle:
+            return None
+        folded = self._folded
+        if (
+            self._needle
+            and self._matches is not None
+            and needle.startswith(self._needle)
+        ):
+            # Typing on: anything containing the longer needle contained the
+            # shorter one, so only the previous matches need re-checking.
+            candidates = self._matches
+        elif len(needle) >= 3:
+            sets = sorted(
+                (
+                    self._trigrams.get(needle[i : i + 3], set())
+                    for i in range(len(needle) - 2)
+                ),
+                key=len,
+            )
+            candidates = set.intersection(*sets)
+        else:
+            candidates = range(len(folded))
+        return {row for row in candidates if needle in folded[row]}
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Accept a row when the current needle occurs in its text."""
+        return self._matches is None or source_row in self._matches
+
+
+class _LazyCompleterInstaller(QObject):
+    """Event filter that builds the completer on the combobox's first focus."""
+
+    def __init__(self, combo: QComboBox, items: Sequence[str]) -> None:
+        # No Python reference back to *combo*: the child -> parent cycle would
+        # let deleteLater() free the combo while this child is mid-destruction.
+        super().__init__(combo)
+        self._items = list(items)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.FocusIn:
+            watched.removeEventFilter(self)
+            _build_completer(watched, self._items)
+            self.deleteLater()
+        return False
+
+
+def _build_completer(combo: QComboBox, items: Sequence[str]) -> QCompleter:
+    proxy = ContainsFilterProxyModel(items, combo)
+    completer = QCompleter(proxy, combo)
+    # The proxy already filters; the completer just shows what is left.
+    completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+    combo.setCompleter(completer)
+    combo.lineEdit().textEdited.connect(proxy.set_needle)
+    return completer
+
+
+def install_contains_completer(combo: QComboBox, items: Sequence[str]) -> None:
+    """Attach a case-insensitive substring completer to an editable combobox.
+
+    Construction is deferred until the combobox first receives focus, so
+    window start-up does not pay for models the user may never type into.
+
+    Args:
+        combo: Editable combobox to complete
+        items: Completion candidates
+    """
+    combo.installEventFilter(_LazyCompleterInstaller(combo, items))
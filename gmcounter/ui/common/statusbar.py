@@ -1,14 +1,20 @@
 """Status bar management utilities."""
 
 import re
+from typing import Optional
+
 from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module
     QStatusBar,
     QLabel,
 )
-from PySide6.QtCore import QTimer  # pylint: disable=no-name-in-module
+from PySide6.QtCore import QElapsedTimer, QTimer  # pylint: disable=no-name-in-module
 
 from ...infrastructure.logging import Debug
 
+_BACKGROUND_RE = re.compile(r"background-color:\s*[^;]+;")
+# Identical show_message() calls closer together than this are dropped
+DEDUPE_WINDOW_MS = 100
+
 
 class StatusBarManager:
     """Manager for status bar messages and styles.
@@ -27,6 +33,8 @@ class StatusBarManager:
         self.statusbar = statusbar
         self.old_state: list[str] = []  # [currentMessage, styleSheet]
         self._save_state()
+        self._last_call: Optional[tuple[str, str, int]] = None
+        self._since_last = QElapsedTimer()
 
     def show_message(
         self, message: str, backcolor: str = "", duration: int = 0
@@ -38,12 +46,26 @@ class StatusBarManager:
             backcolor: Background color (CSS format)
             duration: Duration in milliseconds (0 = permanent until next message)
         """
+        # Reconnect retries and state transitions can repeat the same message
+        # in bursts; an identical call within DEDUPE_WINDOW_MS is a no-op.
+        call = (message, backcolor, duration)
+        if (
+            call == self._last_call
+            and self._since_last.isValid()
+            and self._since_last.elapsed() < DEDUPE_WINDOW_MS
+        ):
+            return
+        self._last_call = call
+        self._since_last.start()
+
         new_style = self._update_statusbar_style(backcolor)
-        self.statusbar.setStyleSheet(new_style)
+        # setStyleSheet() re-polishes the whole bar; skip it when unchanged
+        if new_style != self.old_state[1]:
+            self.statusbar.setStyleSheet(new_style)
 
         if duration != 0:
             self.statusbar.showMessage(message, duration)
-            Debug.debug(f"Statusbar message: {message} with duration: {duration}")
+            Debug.debug("Statusbar message: %s with duration: %s", message, duration)
             # reset to old state after duration
             QTimer.singleShot(
                 duration, lambda: self.statusbar.setStyleSheet(self.old_state[1])
@@ -53,7 +75,7 @@ class StatusBarManager:
             )
         else:
             self.statusbar.showMessage(message)
-            Debug.debug(f"Permanent Statusbar message: {message}")
+            Debug.debug("Permanent Statusbar message: %s", message)
 
     def add_permanent_widget(
         self, message: str, index: int = 0, backcolor: str = ""
@@ -72,7 +94,7 @@ class StatusBarManager:
         label = QLabel()
         label.setText(message)
         self.statusbar.insertPermanentWidget(index, label)
-        Debug.debug(f"Permanent Statusbar message: {message} at index: {index}")
+        Debug.debug("Permanent Statusbar message: %s at index: %s", message, index)
 
     def _update_statusbar_style(self, backcolor: str) -> str:
         """Update the style of the status bar.
@@ -88,24 +110,26 @@ class StatusBarManager:
         if backcolor:
             if "background-color:" in self.old_state[1]:
                 # if old style had backcolor, replace it with the new one
-                match = re.search(r"background-color:\s*[^;]+;", self.old_state[1])
+                match = _BACKGROUND_RE.search(self.old_state[1])
                 if match:
                     new_style = self.old_state[1].replace(
                         match.group(0),
                         f"background-color: {backcolor};",
                     )
                     Debug.debug(
-                        f"Statusbar background color updated: {self.old_state[1]} -> {new_style}"
+                        "Statusbar background color updated: %s -> %s",
+                        self.old_state[1],
+                        new_style,
                     )
                 else:
                     new_style = self.old_state[1]
             else:
                 # otherwise append the new backcolor
                 new_style = self.old_state[1] + f"background-color: {backcolor};"
-                Debug.info(f"Statusbar background color set: {new_style}")
+                Debug.debug("Statusbar background color set: %s", new_style)
         else:
             new_style = self.old_state[1]
-            Debug.info("No background color change")
+            Debug.debug("No background color change")
         return new_style
 
     def _save_state(self):
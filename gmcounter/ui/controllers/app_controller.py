@@ -4,10 +4,11 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+import math
+from typing import Callable, Optional, TYPE_CHECKING
 
 from PySide6.QtCore import (  # pylint: disable=no-name-in-module
+    QElapsedTimer,
     QObject,
     QTimer,
     Signal,
@@ -17,13 +18,16 @@ from PySide6.QtCore import (  # pylint: disable=no-name-in-module
 from ...infrastructure.device_manager import DeviceManager
 from ...infrastructure.qt_threads import (
     DataAcquisitionThread,
+    OrphanJournalScanWorker,
     ReconnectWorker,
+    ShutdownWorker,
     StatePollerThread,
 )
 from ...infrastructure.config import import_config
-from ...infrastructure.session_journal import SessionJournal, find_orphan_journals
+from ...infrastructure.session_journal import SessionJournal
 from ...core.models import DesiredState, Frame
 from ...core.duration import accumulate_and_trim
+from ...core.utils import TimeOfDayStamper
 from ..common.statusbar import StatusBarManager
 
 if TYPE_CHECKING:
@@ -32,6 +36,14 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 CONFIG = import_config()
+_COLORS = CONFIG.get("colors", {})
+_MESSAGES = CONFIG.get("messages", {})
+# Status colors resolved once; _notify() sites pass these directly.
+_GREEN = _COLORS.get("green", "green")
+_BLUE = _COLORS.get("blue", "blue")
+_ORANGE = _COLORS.get("orange", "orange")
+_RED = _COLORS.get("red", "red")
+_CONN_CFG = CONFIG.get("connection", {})
 
 
 class AppController(QObject):
@@ -82,12 +94,16 @@ class AppController(QObject):
         self._status_bar = status_bar
         self.event_log: Optional["EventLogPanel"] = None
         self._active_tab: Optional["PlotTabBase"] = None
+        self._tab_links: list = []  # QMetaObject.Connection handles
 
         # Measurement tracking
         self._is_measuring = False
-        self._measurement_start: Optional[datetime] = None
+        # Monotonic run clock for the wall-clock fallback (immune to clock jumps)
+        self._run_clock = QElapsedTimer()
         self._elapsed_s = 0
         self._total_s = 0  # 0 = indeterminate
+        # Run-clock ms after which the wall-clock fallback stops (0 = never)
+        self._fallback_ms = 0
 
         # Delta-based duration: device-time accumulator and target (in µs)
         self._accum_us: float = 0.0
@@ -101,6 +117,18 @@ class AppController(QObject):
         # Journal
         self._journal: Optional[SessionJournal] = None
 
+        # Background shutdown (cleanup_async)
+        self._shutdown_worker: Optional[ShutdownWorker] = None
+        # Background orphan-journal scan (_check_orphan_journals)
+        self._orphan_scan: Optional[OrphanJournalScanWorker] = None
+
+        # Set when new frames reach the active tab; the stats timer skips
+        # get_statistics() and the label refresh while nothing has changed.
+        self._stats_dirty = False
+
+        # HH:MM:SS.mmm stamp shared by all frames of one batch
+        self._stamp = TimeOfDayStamper()
+
         # Acquisition thread
         self._acquire_thread: Optional[DataAcquisitionThread] = None
         self._wire_device_manager()
@@ -115,14 +143,24 @@ class AppController(QObject):
         )
         self._state_poller.start()
 
-        # QTimers
+        # One slow UI timer drives both the progress display and the
+        # statistics refresh: it ticks at the largest interval dividing both
+        # 1 s (progress granularity) and the statistics interval, and emits
+        # statistics every _stats_every-th tick.  QTimer already defaults to
+        # CoarseTimer; whole-second ticks go one step further to
+        # VeryCoarseTimer so their wake-ups coalesce with the OS's own 1 s
+        # housekeeping.
         cfg_t = CONFIG.get("timers", {})
-        self._stats_timer = QTimer(self)
-        self._stats_timer.timeout.connect(self._emit_statistics)
-        self._stats_timer.start(cfg_t.get("statistics_update_interval", 1000))
-
-        self._progress_timer = QTimer(self)
-        self._progress_timer.timeout.connect(self._tick_progress)
+        stats_ms = cfg_t.get("statistics_update_interval", 1000)
+        tick_ms = math.gcd(stats_ms, 1000) or 1000
+        self._stats_every = max(1, stats_ms // tick_ms)
+        self._ui_ticks = 0
+        self._last_progress: Optional[tuple[int, int]] = None
+        self._ui_timer = QTimer(self)
+        if tick_ms % 1000 == 0:
+            self._ui_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._ui_timer.timeout.connect(self._on_ui_tick)
+        self._ui_timer.start(tick_ms)
 
         # Check for orphan journals from previous crashes
         QTimer.singleShot(5000, self._check_orphan_journals)
@@ -140,22 +178,25 @@ class AppController(QObject):
     # Active-tab management
 
     def set_active_tab(self, tab: "PlotTabBase") -> None:
-        if self._active_tab is not None:
-            try:
-                self.frames_ready.disconnect(self._active_tab.on_frames)
-                self.measurement_started.disconnect(
-                    self._active_tab.on_measurement_started
-                )
-                self.measurement_stopped.disconnect(
-                    self._active_tab.on_measurement_stopped
-                )
-            except RuntimeError:
-                pass
+        """Route frames and measurement lifecycle signals to *tab* only.
+
+        The connections made for the previous tab are kept as handles and
+        dropped one by one, so a failed disconnect can never leave a stale
+        slot behind to receive every frame batch twice.
+        """
+        if tab is self._active_tab:
+            return
+        for link in self._tab_links:
+            QObject.disconnect(link)
+        self._tab_links = []
         self._active_tab = tab
+        self._stats_dirty = True
         if tab is not None:
-            self.frames_ready.connect(tab.on_frames)
-            self.measurement_started.connect(tab.on_measurement_started)
-            self.measurement_stopped.connect(tab.on_measurement_stopped)
+            self._tab_links = [
+                self.frames_ready.connect(tab.on_frames),
+                self.measurement_started.connect(tab.on_measurement_started),
+                self.measurement_stopped.connect(tab.on_measurement_stopped),
+            ]
 
     # ------------------------------------------------------------------
     # Measurement control (called by MainWindow)
@@ -179,20 +220,19 @@ class AppController(QObject):
 
         if self.device_manager.start_measurement():
             self._is_measuring = True
-            self._measurement_start = datetime.now()
+            self._run_clock.start()
             self._elapsed_s = 0
             self._total_s = total_seconds
             self._target_us = total_seconds * 1_000_000.0
+            self._fallback_ms = (total_seconds + 3) * 1000 if total_seconds > 0 else 0
             self._accum_us = 0.0
 
             # Open journal
             self._journal = SessionJournal()
 
-            self._progress_timer.start(1000)
+            self._last_progress = None
             self.measurement_started.emit()
-            self._notify(
-                "Messung läuft...", CONFIG.get("colors", {}).get("blue", "blue")
-            )
+            self._notify("Messung läuft...", _BLUE)
             return True
 
         # start failed — restore polling so the idle state display still works
@@ -201,13 +241,11 @@ class AppController(QObject):
 
     def stop_measurement(self) -> None:
         self._is_measuring = False
-        self._progress_timer.stop()
+        self._run_clock.invalidate()
         self.device_manager.stop_measurement()
         self._state_poller.resume()
         self.measurement_stopped.emit()
-        self._notify(
-            "Messung gestoppt.", CONFIG.get("colors", {}).get("green", "green")
-        )
+        self._notify("Messung gestoppt.", _GREEN)
 
     def finalize_journal(self) -> None:
         """Mark the current session journal as cleanly saved."""
@@ -252,20 +290,34 @@ class AppController(QObject):
             _log.warning("Settings not confirmed by device: %s", names)
             self._notify(
                 f"Einstellungen gesendet — warte auf Bestätigung ({names})…",
-                CONFIG.get("colors", {}).get("orange", "orange"),
+                _ORANGE,
             )
             # Schedule a re-check after 3 s; if values match after re-poll
             # the LCD update itself confirms success.
             QTimer.singleShot(3000, lambda: self._warn_unconfirmed(unconfirmed))
         else:
             self._notify(
-                CONFIG.get("messages", {}).get(
-                    "settings_applied", "Einstellungen gesetzt"
-                ),
-                CONFIG.get("colors", {}).get("green", "green"),
+                _MESSAGES.get("settings_applied", "Einstellungen gesetzt"),
+                _GREEN,
             )
-        # Trigger a fresh state poll so LCDs update immediately after Apply.
-        QTimer.singleShot(300, self._state_poller.force_poll_soon)
+        # apply_device_settings() has already waited for the device to settle,
+        # so wake the poller now and the LCDs update right after Apply.
+        self._state_poller.force_poll_soon()
+
+    def fetch_device_info(self) -> None:
+        """Read firmware/openBIS info from the device and fire on_device_info.
+
+        MainWindow schedules this after the window is shown rather than
+        calling it from __init__, so the serial round trip never delays the
+        first paint.  The poller is paused so both share the port cleanly.
+        """
+        if not (self.device_manager.connected and self.device_manager.device):
+            return
+        self._state_poller.pause()
+        try:
+            self.device_manager.fetch_device_info()
+        finally:
+            self._state_poller.resume()
 
     def _warn_unconfirmed(self, unconfirmed: dict) -> None:
         """Called 3 s after apply_settings if settings were not confirmed.
@@ -281,7 +333,7 @@ class AppController(QObject):
         self._notify(
             "Achtung: Einstellungen möglicherweise nicht angewendet — "
             + ", ".join(unconfirmed.keys()),
-            CONFIG.get("colors", {}).get("orange", "orange"),
+            _ORANGE,
         )
         # Force an immediate re-poll so the LCDs reflect actual device state.
         self._state_poller.force_poll_soon()
@@ -290,11 +342,28 @@ class AppController(QObject):
     # Cleanup
 
     def cleanup(self) -> None:
-        """Call from MainWindow.closeEvent() — stop all timers and threads."""
-        for timer in (self._stats_timer, self._progress_timer):
-            if timer.isActive():
-                timer.stop()
+        """Stop all timers and threads and disconnect, blocking until done."""
+        self._stop_timers()
+        self._shutdown_io()
 
+    def cleanup_async(self, on_done: Callable[[], None]) -> None:
+        """Like cleanup(), but without blocking the GUI thread.
+
+        Timers are stopped here; joining the worker threads and closing the
+        serial port (which can take seconds on a wedged USB adapter) run on a
+        ShutdownWorker.  *on_done* is invoked on the GUI thread afterwards.
+        """
+        self._stop_timers()
+        if self._shutdown_worker is not None:
+            return
+        self._shutdown_worker = ShutdownWorker(self._shutdown_io, parent=self)
+        self._shutdown_worker.finished.connect(on_done)
+        self._shutdown_worker.start()
+
+    def _stop_timers(self) -> None:
+        self._ui_timer.stop()  # no-op when already stopped
+
+    def _shutdown_io(self) -> None:
         if self._state_poller and self._state_poller.isRunning():
             self._state_poller.stop()
 
@@ -321,8 +390,10 @@ class AppController(QObject):
         if self._acquire_thread and self._acquire_thread.isRunning():
             return
         self._acquire_thread = DataAcquisitionThread(self.device_manager)
-        self._acquire_thread.data_batch.connect(
-            self._on_data_batch, Qt.ConnectionType.QueuedConnection
+        # Queued, never Direct/BlockingQueued: the producer must not wait on
+        # the GUI, and the slot reaches widgets through frames_ready.
+        self._acquire_thread.data_available.connect(
+            self._drain_acquisition, Qt.ConnectionType.QueuedConnection
         )
         self._acquire_thread.connection_lost.connect(
             self._on_acquire_connection_lost, Qt.ConnectionType.QueuedConnection
@@ -347,6 +418,9 @@ class AppController(QObject):
         """
         if not self._is_measuring:
             return  # already stopped (e.g. ABOR was sent manually)
+        self._drain_acquisition()  # points that preceded the sentinel
+        if not self._is_measuring:
+            return  # the drained points already reached the target
         _log.info(
             "Firmware end-of-period received — stopping measurement "
             "(accumulated %.2f µs)",
@@ -357,6 +431,20 @@ class AppController(QObject):
     # ------------------------------------------------------------------
     # Data batch handler
 
+    def _drain_acquisition(self) -> None:
+        """Pull everything the acquisition thread has queued since last time.
+
+        Between measurements the queued batches are dropped unread — the
+        plain ``_is_measuring`` flag is the only check on that path.
+        """
+        thread = self._acquire_thread
+        if thread is None:
+            return
+        if self._is_measuring:
+            self._on_data_batch(thread.drain())
+        else:
+            thread.discard()
+
     def _on_data_batch(self, points: list) -> None:
         """Handle a batch of (index, value_us) tuples from the acquisition thread.
 
@@ -372,14 +460,12 @@ class AppController(QObject):
         )
 
         if kept:
-            ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            journal = self._journal
-            frames = []
-            for index, value in kept:
-                if journal:
-                    journal.record(index, value)
-                frames.append(Frame(index=index, value=value, timestamp=ts))
-            self.frames_ready.emit(frames)
+            if self._journal:
+                # Only queues the batch; the journal thread does the file I/O
+                self._journal.record_batch(kept)
+            ts = self._stamp()
+            self.frames_ready.emit([Frame(index, value, ts) for index, value in kept])
+            self._stats_dirty = True
 
         if reached:
             self.stop_measurement()
@@ -387,9 +473,18 @@ class AppController(QObject):
     # ------------------------------------------------------------------
     # Timers
 
+    def _on_ui_tick(self) -> None:
+        if self._is_measuring:
+            self._tick_progress()
+        self._ui_ticks += 1
+        if self._ui_ticks >= self._stats_every:
+            self._ui_ticks = 0
+            self._emit_statistics()
+
     def _emit_statistics(self) -> None:
-        if self._active_tab is None:
+        if self._active_tab is None or not self._stats_dirty:
             return
+        self._stats_dirty = False
         try:
             stats = self._active_tab.get_statistics()
             if stats:
@@ -398,23 +493,24 @@ class AppController(QObject):
             _log.debug("Error emitting statistics: %s", exc)
 
     def _tick_progress(self) -> None:
-        elapsed = int(self._accum_us / 1e6)
-        total = int(self._target_us / 1e6)
-        self.progress_updated.emit(elapsed, total)
+        progress = (int(self._accum_us / 1e6), int(self._target_us / 1e6))
+        if progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_updated.emit(*progress)
 
         # Wall-clock fallback for finite-time measurements.
         # The device stops its internal counter when the counting time expires
         # but keeps streaming (no end-of-period marker in the binary protocol),
         # so the delta accumulator may never cross the target at low count rates.
         # If real time exceeds the target by 3 s, stop explicitly.
-        if self._is_measuring and self._target_us > 0 and self._measurement_start:
-            wall_s = (datetime.now() - self._measurement_start).total_seconds()
-            target_s = self._target_us / 1_000_000.0
-            if wall_s >= target_s + 3.0:
+        # The deadline is fixed at start, so a tick is one integer compare.
+        if self._is_measuring and self._fallback_ms and self._run_clock.isValid():
+            elapsed_ms = self._run_clock.elapsed()
+            if elapsed_ms >= self._fallback_ms:
                 _log.info(
                     "Wall-clock fallback: %.1fs elapsed (target %.0fs) — stopping",
-                    wall_s,
-                    target_s,
+                    elapsed_ms / 1000.0,
+                    self._total_s,
                 )
                 self.stop_measurement()
 
@@ -434,20 +530,23 @@ class AppController(QObject):
         if self._is_measuring:
             self.stop_measurement()
 
+        # Keep FETC:STAT? off the port while the worker reopens it and
+        # replays the desired state; resumed when the worker finishes.
+        self._state_poller.pause()
+
         self.device_manager.handle_connection_lost()
 
         self._notify(
             "Verbindung unterbrochen — Wiederverbindung...",
-            CONFIG.get("colors", {}).get("orange", "orange"),
+            _ORANGE,
         )
 
         # Save desired state for replay after reconnect (B5)
         # B2: start non-blocking reconnect worker
-        cfg_conn = CONFIG.get("connection", {})
-        max_att = cfg_conn.get("max_retry_attempts", 8)
-        init_ms = cfg_conn.get("initial_retry_delay_ms", 500)
-        max_ms = cfg_conn.get("max_retry_delay_ms", 16000)
-        factor = cfg_conn.get("backoff_factor", 2.0)
+        max_att = _CONN_CFG.get("max_retry_attempts", 8)
+        init_ms = _CONN_CFG.get("initial_retry_delay_ms", 500)
+        max_ms = _CONN_CFG.get("max_retry_delay_ms", 16000)
+        factor = _CONN_CFG.get("backoff_factor", 2.0)
 
         self._reconnect_worker = ReconnectWorker(
             reconnect_fn=lambda: self.device_manager.attempt_automatic_reconnect(
@@ -459,9 +558,10 @@ class AppController(QObject):
             backoff_factor=factor,
             parent=self,
         )
-        self._reconnect_worker.succeeded.connect(self._on_reconnect_succeeded)
-        self._reconnect_worker.failed.connect(self._on_reconnect_failed)
-        self._reconnect_worker.status_update.connect(self._notify)
+        queued = Qt.ConnectionType.QueuedConnection
+        self._reconnect_worker.succeeded.connect(self._on_reconnect_succeeded, queued)
+        self._reconnect_worker.failed.connect(self._on_reconnect_failed, queued)
+        self._reconnect_worker.status_update.connect(self._notify, queued)
         self._reconnect_worker.start()
 
     def _on_connection_lost_cb(self) -> None:
@@ -474,39 +574,52 @@ class AppController(QObject):
         if self._acquire_thread:
             self._acquire_thread.reset_connection_lost()
         self._start_acquisition()
+        self._state_poller.resume()
+        self._state_poller.force_poll_soon()
 
         if self._journal:
             self._journal.mark_gap()
 
         self.reconnect_succeeded.emit()
-        self._notify("Wiederverbunden", CONFIG.get("colors", {}).get("green", "green"))
+        self._notify("Wiederverbunden", _GREEN)
 
     def _on_reconnect_failed(self) -> None:
         """All retry attempts exhausted (B7) — notify UI and offer journal export."""
         self._reconnect_state = self._DISCONNECTED
+        # The poller's own connected check keeps it idle from here on.
+        self._state_poller.resume()
         self.connection_lost.emit()
 
         if self._journal:
             self._journal.close()
             self._notify(
                 f"Verbindung verloren. Journal gespeichert: {self._journal.path}",
-                CONFIG.get("colors", {}).get("red", "red"),
+                _RED,
             )
         else:
             self._notify(
                 "Verbindung verloren. Alle Wiederverbindungsversuche fehlgeschlagen.",
-                CONFIG.get("colors", {}).get("red", "red"),
+                _RED,
             )
 
     # ------------------------------------------------------------------
     # Orphan journal check
 
     def _check_orphan_journals(self) -> None:
-        orphans = find_orphan_journals()
+        """Start the journal scan; the file reads run on a worker thread."""
+        if self._orphan_scan is not None:
+            return
+        self._orphan_scan = OrphanJournalScanWorker(self)
+        self._orphan_scan.found.connect(
+            self._on_orphan_journals, Qt.ConnectionType.QueuedConnection
+        )
+        self._orphan_scan.start()
+
+    def _on_orphan_journals(self, orphans: list) -> None:
         if orphans:
             paths = "\n".join(str(p) for p in orphans)
             _log.warning("Found %d orphan journal(s):\n%s", len(orphans), paths)
             self._notify(
                 f"{len(orphans)} ungespeichertes Journal gefunden. Daten unter ~/.gmcounter/sessions/",
-                CONFIG.get("colors", {}).get("orange", "orange"),
+                _ORANGE,
             )
@@ -81,10 +81,10 @@ class ConnectionWindow(QDialog):
 
     def status_message(self, message: str, color: str = "white") -> None:
         try:
-            if hasattr(self.ui, "status_msg") and self.ui.status_msg is not None:
-                self.ui.status_msg.setText(message)
-                self.ui.status_msg.setStyleSheet(f"color: {color};")
-                QApplication.processEvents()
+            label = self.ui.status_msg
+            label.setText(message)
+            label.setStyleSheet(f"color: {color};")
+            QApplication.processEvents()
         except Exception as exc:
             _log.error("Failed to set status message: %s", exc)
 
@@ -6,7 +6,7 @@ from __future__ import annotations
 from typing import Optional
 
 from PySide6.QtCore import Signal  # pylint: disable=no-name-in-module
-from PySide6.QtWidgets import QWidget  # pylint: disable=no-name-in-module
+from PySide6.QtWidgets import QVBoxLayout, QWidget  # pylint: disable=no-name-in-module
 
 from ...core.export import TabExport
 from ...core.models import Frame
@@ -67,6 +67,25 @@ class PlotTabBase(QWidget):
     def build(self) -> None:
         """One-time setup after the tab is inserted into the window."""
 
+    @staticmethod
+    def _embed(container: QWidget, widget: QWidget) -> None:
+        """Place *widget* edge-to-edge inside a .ui placeholder *container*.
+
+        A container that was embedded into before keeps its layout and only
+        has its previous widget swapped out (Qt refuses a second layout).
+        """
+        layout = container.layout()
+        if layout is None:
+            layout = QVBoxLayout(container)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(0)
+        else:
+            while (item := layout.takeAt(0)) is not None:
+                old = item.widget()
+                if old is not None and old is not widget:
+                    old.deleteLater()
+        layout.addWidget(widget)
+
     def on_frame(self, frame: Frame) -> None:
         """Process one acquired data point."""
 
@@ -4,30 +4,35 @@
 from __future__ import annotations
 
 import logging
-import queue
-import threading
+from collections import deque
+from collections.abc import Sequence
 from datetime import datetime
-from time import time
-from typing import Optional, List, Tuple
-
-from PySide6.QtCore import QTimer, Signal  # pylint: disable=no-name-in-module
-from PySide6.QtGui import (
-    QStandardItem,
-    QStandardItemModel,
-)  # pylint: disable=no-name-in-module
+from typing import Deque, Iterator, Optional, List, Tuple
+
+import numpy as np
+from PySide6.QtCore import (  # pylint: disable=no-name-in-module
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module
+    QAbstractItemView,
+    QHeaderView,
     QTabWidget,
     QTableView,
     QWidget,
-    QVBoxLayout,
     QLCDNumber,
 )
 
 from .base import PlotTabBase
 from .registry import TabRegistry
+from ..widgets.plot import GeneralPlot, HistogramWidget, PlotConfig
 from ...core.export import TabExport, build_gm_tab_export
-from ...core.models import Frame, MeasurementSession, MeasurementPoint
-from ...core.utils import calculate_statistics
+from ...core.models import Frame, MeasurementSession
+from ...core.utils import RunningStatistics
 from ...infrastructure.config import import_config
 
 _log = logging.getLogger(__name__)
@@ -41,6 +46,202 @@ MAX_HISTORY: int = _DATA_CFG.get("max_history_size", 2000)
 GUI_UPDATE_INTERVAL: int = max(
     500, CONFIG.get("timers", {}).get("gui_update_interval", 500)
 )
+# High-speed trigger, resolved once: the batch sum over the history window
+# that _check_high_speed() compares against, the event rate it corresponds
+# to, and the status text naming that rate.
+_HS_BATCH_SUM: int = HIGH_SPEED_BATCH_THRESHOLD * HIGH_SPEED_BATCH_HISTORY
+HIGH_SPEED_MIN_RATE_HZ: int = int(
+    HIGH_SPEED_BATCH_THRESHOLD * 1000 / GUI_UPDATE_INTERVAL
+)
+_HS_ACTIVATED_MSG: str = (
+    f"⚡ HIGH-SPEED MODE (≥{HIGH_SPEED_MIN_RATE_HZ} Hz) — Plot deaktiviert"
+)
+# Upper bound on rows handed to the plot/table in one GUI tick; beyond this
+# the oldest unshown rows are skipped (the raw store keeps them for export).
+PENDING_LIMIT: int = 10000
+# Rows formatted per step while an export is being written
+EXPORT_CHUNK_ROWS: int = 65536
+# Deliveries at least this large are reduced with NumPy and merged into the
+# running statistics; smaller ones are cheaper to fold in value by value.
+VECTOR_STATS_MIN: int = 64
+
+
+class _SampleRows(Sequence):
+    """Read-only CSV row view over a snapshot of the sample columns.
+
+    Used as TabExport.rows: the export keeps 16 bytes per sample plus a
+    timestamp reference instead of a list of three strings per row, and
+    the strings are only formatted (chunk by chunk) while the CSV is written.
+    """
+
+    __slots__ = ("_idx", "_val", "_ts")
+
+    def __init__(self, idx: np.ndarray, val: np.ndarray, ts: List[str]) -> None:
+        self._idx = idx
+        self._val = val
+        self._ts = ts
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def __getitem__(self, i: int) -> List[str]:
+        return [str(self._idx[i].item()), str(self._val[i].item()), self._ts[i]]
+
+    def __iter__(self) -> Iterator[Tuple[str, str, str]]:
+        for start in range(0, len(self._ts), EXPORT_CHUNK_ROWS):
+            stop = start + EXPORT_CHUNK_ROWS
+            yield from zip(
+                map(str, self._idx[start:stop].tolist()),
+                map(str, self._val[start:stop].tolist()),
+                self._ts[start:stop],
+            )
+
+
+class _SampleColumns:
+    """Unbounded raw sample store as parallel columns (structure of arrays).
+
+    Index and value live in NumPy arrays that grow by doubling, so a long run
+    costs 16 bytes per sample instead of a tuple plus boxed int/float (~100
+    bytes).  Timestamps are per-batch strings; the list only holds references.
+    """
+
+    __slots__ = ("_idx", "_val", "_ts", "_n")
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self._idx = np.empty(capacity, dtype=np.int64)
+        self._val = np.empty(capacity, dtype=np.float64)
+        self._ts: List[str] = []
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def extend(self, idx: List[int], val: List[float], ts: List[str]) -> None:
+        """Append one batch of parallel column values."""
+        k = len(idx)
+        end = self._n + k
+        if end > len(self._val):
+            cap = max(end, 2 * len(self._val))
+            self._idx = np.resize(self._idx, cap)
+            self._val = np.resize(self._val, cap)
+        self._idx[self._n : end] = idx
+        self._val[self._n : end] = val
+        self._ts.extend(ts)
+        self._n = end
+
+    def clear(self) -> None:
+        self._ts.clear()
+        self._n = 0
+
+    def since(self, start: int) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Index/value column views and timestamps from row *start* on."""
+        n = self._n
+        return self._idx[start:n], self._val[start:n], self._ts[start:n]
+
+    def values(self, last: Optional[int] = None) -> np.ndarray:
+        """View of the value column (optionally only the *last* entries)."""
+        start = 0 if last is None else max(0, self._n - last)
+        return self._val[start : self._n]
+
+    def row_view(self) -> _SampleRows:
+        """Snapshot the columns as a lazily formatted row sequence."""
+        n = self._n
+        return _SampleRows(self._idx[:n].copy(), self._val[:n].copy(), list(self._ts))
+
+    def csv_rows(self) -> List[List[str]]:
+        """Rows as strings for TabExport, formatted column-wise."""
+        n = self._n
+        return [
+            [i, v, t]
+            for i, v, t in zip(
+                map(str, self._idx[:n].tolist()),
+                map(str, self._val[:n].tolist()),
+                self._ts,
+            )
+        ]
+
+
+class _HistoryTableModel(QAbstractTableModel):
+    """Bounded (index, value, time) table fed in batches.
+
+    Rows live in fixed-size ring columns (NumPy for index/value), and cells
+    are formatted in data() only when the view asks for them, so there are
+    no per-row Python objects.  append_rows() trims and inserts with one
+    removeRows/insertRows pair per batch, so the view only lays out the
+    rows that actually changed.
+    """
+
+    HEADERS = ("Index", "Wert (µs)", "Zeit")
+
+    def __init__(self, limit: int, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._limit = limit
+        self._idx = np.zeros(limit, dtype=np.int64)
+        self._val = np.zeros(limit, dtype=np.float64)
+        self._ts: List[str] = [""] * limit
+        self._head = 0
+        self._count = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        i = (self._head + index.row()) % self._limit
+        col = index.column()
+        if col == 0:
+            return str(self._idx[i].item())
+        if col == 1:
+            return str(self._val[i].item())
+        return self._ts[i]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def append_rows(self, idx: np.ndarray, values: np.ndarray, ts: List[str]) -> None:
+        """Append a batch of rows, dropping the oldest beyond the limit."""
+        k = min(len(idx), self._limit)
+        if not k:
+            return
+        overflow = self._count + k - self._limit
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self._head = (self._head + overflow) % self._limit
+            self._count -= overflow
+            self.endRemoveRows()
+        first = self._count
+        self.beginInsertRows(QModelIndex(), first, first + k - 1)
+        pos = (self._head + first) % self._limit
+        split = min(k, self._limit - pos)
+        for dst, src in (
+            (self._idx, idx[-k:]),
+            (self._val, values[-k:]),
+            (self._ts, ts[-k:]),
+        ):
+            dst[pos : pos + split] = src[:split]
+            dst[: k - split] = src[split:]
+        self._count += k
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Drop all rows."""
+        self.beginResetModel()
+        self._head = 0
+        self._count = 0
+        self.endResetModel()
 
 
 class GMTimingTab(PlotTabBase):
@@ -67,23 +268,28 @@ class GMTimingTab(PlotTabBase):
         super().__init__(parent)
 
         # Raw data storage (unbounded — for CSV export)
-        self._data_points: List[Tuple[int, float, str]] = []
-        # GUI-limited copy
-        self._gui_points: List[Tuple[int, float, str]] = []
-
-        # Queue from acquisition thread
-        self._queue: queue.Queue = queue.Queue(maxsize=10000)
-        self._queue_lock = threading.Lock()
+        self._samples = _SampleColumns()
+        # Running min/max/mean/std over _samples for the stats timer
+        self._stats = RunningStatistics()
+
+        # Rows of _samples already handed to the plot/table; the GUI tick
+        # shows everything after it as one column batch.  on_frames() and
+        # the _gui_timer both run on the GUI thread, so no lock is needed.
+        self._gui_cursor = 0
         self._overflow_warned = False
 
         # High-speed mode
         self._high_speed = False
-        self._batch_history: List[Tuple[float, int]] = []
+        # Batch sizes of the last HIGH_SPEED_BATCH_HISTORY GUI ticks
+        self._batch_history: Deque[int] = deque(maxlen=HIGH_SPEED_BATCH_HISTORY)
         self._hist_timer: Optional[QTimer] = None
         self._hs_autoswitch: bool = True  # set False during sweep sessions
 
         # GUI update timer
         self._gui_timer: Optional[QTimer] = None
+        # Throttle counters for the LCD and histogram inside the GUI tick
+        self._lcd_counter = 0
+        self._hist_counter = 0
 
         # Injection slots (set by MainWindow after build())
         self._plot_container: Optional[QWidget] = None
@@ -100,7 +306,7 @@ class GMTimingTab(PlotTabBase):
         # Lazily created widgets
         self._plot = None
         self._histogram = None
-        self._table_model: Optional[QStandardItemModel] = None
+        self._table_model: Optional[_HistoryTableModel] = None
 
         # Measurement session tracking for export
         self._session_start: Optional[datetime] = None
@@ -151,9 +357,10 @@ class GMTimingTab(PlotTabBase):
     # PlotTabBase lifecycle
 
     def build(self) -> None:
-        """Create plot/histogram/table inside the .ui containers."""
-        from ..widgets.plot import GeneralPlot, HistogramWidget, PlotConfig
+        """Create the plot and table inside the .ui containers.
 
+        The histogram is built on first use (see _ensure_histogram()).
+        """
         if self._plot_container and self._plot is None:
             bg = (
                 self._plot_container.palette()
@@ -165,27 +372,26 @@ class GMTimingTab(PlotTabBase):
                 ylabel=CONFIG.get("plot", {}).get("y_label", "Zeit (µs)"),
                 max_plot_points=CONFIG.get("plot", {}).get("max_points", 1000),
                 background_color=bg,
+                index_x_axis=True,
+                max_redraw_rate=CONFIG.get("plot", {}).get("max_fps", 25),
             )
             self._plot = GeneralPlot(config=cfg)
-            QVBoxLayout(self._plot_container).addWidget(self._plot)
+            self._plot.set_stream_window(MAX_HISTORY)
+            self._embed(self._plot_container, self._plot)
 
-        if self._hist_container and self._histogram is None:
-            hist_bg = (
-                self._hist_container.palette()
-                .color(self._hist_container.backgroundRole())
-                .name()
-            )
-            self._histogram = HistogramWidget(
-                xlabel=CONFIG.get("histogram", {}).get("x_label", "Zeit (µs)"),
-                ylabel=CONFIG.get("histogram", {}).get("y_label", "Häufigkeit"),
-                background=hist_bg,
-            )
-            QVBoxLayout(self._hist_container).addWidget(self._histogram)
+        if self._tab_widget_ref is not None:
+            self._tab_widget_ref.currentChanged.connect(self._on_view_tab_changed)
 
         if self._table_view is not None and self._table_model is None:
-            self._table_model = QStandardItemModel(0, 3, self._table_view)
-            self._table_model.setHorizontalHeaderLabels(["Index", "Wert (µs)", "Zeit"])
+            self._table_model = _HistoryTableModel(MAX_HISTORY, self._table_view)
             self._table_view.setModel(self._table_model)
+            # Fixed row heights: the view never measures rows one by one
+            vheader = self._table_view.verticalHeader()
+            vheader.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            vheader.setDefaultSectionSize(self._table_view.fontMetrics().height() + 6)
+            self._table_view.setVerticalScrollMode(
+                QAbstractItemView.ScrollMode.ScrollPerPixel
+            )
 
         # GUI update timer
         self._gui_timer = QTimer(self)
@@ -193,76 +399,74 @@ class GMTimingTab(PlotTabBase):
         self._gui_timer.start(GUI_UPDATE_INTERVAL)
 
     def on_frame(self, frame: Frame) -> None:
-        """Enqueue incoming data point (called from main thread via Qt signal)."""
-        try:
-            ts = frame.timestamp
-            self._data_points.append((frame.index, frame.value, ts))
-            with self._queue_lock:
-                self._queue.put_nowait((frame.index, frame.value, ts))
-        except queue.Full:
-            if not self._overflow_warned:
-                _log.warning("Data queue overflow — GUI cannot keep up")
-                self._overflow_warned = True
+        """Buffer a single data point (called from main thread via Qt signal)."""
+        self.on_frames([frame])
 
     def on_frames(self, frames: List[Frame]) -> None:
-        """Batch entrypoint — append a whole batch under one lock acquisition.
+        """Batch entrypoint — only stores the rows; the GUI timer shows them.
 
-        Overrides PlotTabBase.on_frames so a 10 kHz stream costs one lock cycle
-        per GUI-thread delivery instead of one per point.
+        Overrides PlotTabBase.on_frames so a 10 kHz stream costs a few column
+        extends per delivery; plot, table and LCD work happens once per
+        GUI_UPDATE_INTERVAL in _process_queue(), on column views of _samples.
         """
         if not frames:
             return
-        dp = self._data_points
-        q = self._queue
-        with self._queue_lock:
-            for frame in frames:
-                row = (frame.index, frame.value, frame.timestamp)
-                dp.append(row)
-                self._cum_us += (
-                    frame.value
-                )  # always accumulate for device-time tracking
-                try:
-                    q.put_nowait(row)
-                except queue.Full:
-                    if not self._overflow_warned:
-                        _log.warning("Data queue overflow — GUI cannot keep up")
-                        self._overflow_warned = True
-                    break
+        idx = [f.index for f in frames]
+        values = [f.value for f in frames]
+        ts = [f.timestamp for f in frames]
+        self._samples.extend(idx, values, ts)
+        k = len(values)
+        if k >= VECTOR_STATS_MIN:
+            # The batch was just copied into the value column; reduce that
+            # view in C instead of walking the Python list again.
+            batch = self._samples.values(last=k)
+            total = float(batch.sum())
+            mean = total / k
+            dev = batch - mean
+            self._stats.merge(
+                k, mean, float(dev @ dev), float(batch.min()), float(batch.max())
+            )
+        else:
+            self._stats.extend(values)
+            total = sum(values)
+        # always accumulate for device-time tracking
+        self._cum_us += total
 
     def on_reset(self) -> None:
+        # A reset right after another (or before any data) leaves the plot,
+        # histogram and table untouched instead of clearing them again.
+        had_data = bool(self._samples)
         self._deactivate_high_speed()
         self._batch_history.clear()
-        self._data_points.clear()
-        self._gui_points.clear()
+        self._samples.clear()
+        self._stats.reset()
         self._cum_us = 0.0
-        with self._queue_lock:
-            self._queue = queue.Queue(maxsize=10000)
+        self._gui_cursor = 0
         self._overflow_warned = False
-        self._session_start = datetime.now()
+        # Stamped by on_measurement_started(), which always follows the
+        # reset AppController does at start — no clock read here.
+        self._session_start = None
         self._session_end = None
 
-        if self._plot and hasattr(self._plot, "clear_measurement_data"):
-            self._plot.clear_measurement_data()
-        if self._histogram and hasattr(self._histogram, "clear_measurement_data"):
-            self._histogram.clear_measurement_data()
-        if self._count_lcd:
-            self._count_lcd.display(0)
-        if self._rate_lcd:
-            self._rate_lcd.display(0)
-        if self._table_model:
-            while self._table_model.rowCount() > 0:
-                self._table_model.removeRow(0)
+        if had_data:
+            if self._plot is not None:
+                self._plot.clear_measurement_data()
+            if self._histogram is not None:
+                self._histogram.clear_measurement_data()
+            if self._table_model is not None:
+                self._table_model.clear()
+        for lcd in (self._count_lcd, self._rate_lcd):
+            if lcd and lcd.value() != 0:
+                lcd.display(0)
 
-        if self._gui_timer and not self._gui_timer.isActive():
-            self._gui_timer.start(GUI_UPDATE_INTERVAL)
+        self._set_gui_timer(True)
 
     def on_measurement_started(self) -> None:
         self._session_start = datetime.now()
 
     def on_measurement_stopped(self) -> None:
         self._session_end = datetime.now()
-        if self._gui_timer:
-            self._gui_timer.stop()
+        self._set_gui_timer(False)
 
     def contribute_tabs(self, tab_widget: QTabWidget) -> None:
         """Add Zeitverlauf / Histogramm / Liste as top-level tabs.
@@ -274,16 +478,54 @@ class GMTimingTab(PlotTabBase):
         # Store the reference for high-speed auto-switch.
         self._tab_widget_ref = tab_widget
 
+    def _ensure_histogram(self) -> Optional[HistogramWidget]:
+        """Create the histogram in its container on first use.
+
+        Most runs never leave the Zeitverlauf view, so the pyqtgraph widget
+        is only built once the Histogramm tab is shown or needs data.  It
+        starts empty; callers bin the samples they want to show.
+        """
+        if self._histogram is None and self._hist_container is not None:
+            hist_bg = (
+                self._hist_container.palette()
+                .color(self._hist_container.backgroundRole())
+                .name()
+            )
+            self._histogram = HistogramWidget(
+                xlabel=CONFIG.get("histogram", {}).get("x_label", "Zeit (µs)"),
+                ylabel=CONFIG.get("histogram", {}).get("y_label", "Häufigkeit"),
+                background=hist_bg,
+            )
+            self._embed(self._hist_container, self._histogram)
+        return self._histogram
+
+    def _on_view_tab_changed(self, index: int) -> None:
+        # The histogram is only redrawn while its page is on screen, so
+        # bring it up to date whenever the page is shown.
+        if self._tab_widget_ref is None or self._hist_container is None:
+            return
+        page = self._tab_widget_ref.widget(index)
+        if page is not None and (
+            page is self._hist_container or page.isAncestorOf(self._hist_container)
+        ):
+            self._refresh_histogram()
+
+    def _refresh_histogram(self) -> None:
+        """Build the histogram if needed and redraw it from the latest samples."""
+        if self._ensure_histogram() is not None and len(self._samples) > 1:
+            last = 10000 if self._high_speed else MAX_HISTORY
+            self._histogram.update_histogram(self._samples.values(last=last))
+
+    def _histogram_shown(self) -> bool:
+        return self._hist_container is not None and self._hist_container.isVisible()
+
     # ------------------------------------------------------------------
     # Export (§7)
 
     def export(self) -> Optional[TabExport]:
-        if not self._data_points:
+        if not self._samples:
             return None
         session = MeasurementSession(
-            points=[
-                MeasurementPoint(idx, val, ts) for idx, val, ts in self._data_points
-            ],
             start_time=self._session_start,
             end_time=self._session_end or datetime.now(),
             radioactive_sample=self._rad_sample,
@@ -293,16 +535,14 @@ class GMTimingTab(PlotTabBase):
         return build_gm_tab_export(
             session,
             tk_designation=CONFIG.get("save", {}).get("tk_designation", "TK00"),
+            rows=self._samples.row_view(),
         )
 
     def get_statistics(self) -> dict:
-        if not self._data_points:
+        if not self._samples:
             return {}
-        values = [pt[1] for pt in self._data_points]
-        s = calculate_statistics(values)
-        true_count = (
-            len(self._data_points) + 1
-        )  # +1: the event at t=0 before first delta
+        s = self._stats.as_dict()
+        true_count = len(self._samples) + 1  # +1: the event at t=0 before first delta
         return {
             "count": true_count,
             "min": s["min"],
@@ -313,96 +553,72 @@ class GMTimingTab(PlotTabBase):
 
     def get_csv_data(self) -> List[List[str]]:
         """Legacy helper used by save dialogs."""
-        rows = [["Index", "Value (µs)", "Time"]]
-        for idx, val, ts in self._data_points:
-            rows.append([str(idx), str(val), ts])
-        return rows
+        return [["Index", "Value (µs)", "Time"]] + self._samples.csv_rows()
 
     # ------------------------------------------------------------------
     # Internal — GUI update loop
 
     def _process_queue(self) -> None:
-        if self._queue.empty():
+        n = len(self._samples)
+        start = self._gui_cursor
+        if n == start:
             return
-
-        new_points: List[Tuple[int, float, str]] = []
-        now = time()
-
-        with self._queue_lock:
-            while not self._queue.empty():
-                try:
-                    new_points.append(self._queue.get_nowait())
-                except queue.Empty:
-                    break
-
-        if not new_points:
-            return
-
-        for pt in new_points:
-            self._gui_points.append(pt)
-        while len(self._gui_points) > MAX_HISTORY:
-            self._gui_points.pop(0)
-
-        last_idx, last_val, last_ts = new_points[-1]
+        batch_size = n - start
+        if batch_size > PENDING_LIMIT:
+            if not self._overflow_warned:
+                _log.warning("Data queue overflow — GUI cannot keep up")
+                self._overflow_warned = True
+            start = n - PENDING_LIMIT
+        self._gui_cursor = n
+        idx, values, ts = self._samples.since(start)
 
         if not self._high_speed:
-            self._update_plot_and_display(last_val)
-            if len(self._data_points) < 5000:
-                self._update_table(new_points)
-            self._update_rate_display(now)
+            self._update_plot_and_display(idx, values)
+            if n < 5000:
+                self._update_table(idx, values, ts)
+            self._update_rate_display()
         else:
             if self._count_lcd:
-                self._count_lcd.display(last_val)
+                self._count_lcd.display(float(values[-1]))
 
         # High-speed detection
-        self._check_high_speed(len(new_points), now)
+        self._check_high_speed(batch_size)
 
-    def _update_plot_and_display(self, last_val: float) -> None:
-        if self._plot and self._gui_points:
-            self._plot.update_plot_data(self._gui_points, deferred=True)
+    def _update_plot_and_display(self, idx: np.ndarray, values: np.ndarray) -> None:
+        if self._plot:
+            # Only the new points are copied into the plot's streaming window
+            self._plot.append_batch(idx, values)
 
         if self._count_lcd:
-            if not hasattr(self, "_lcd_counter"):
-                self._lcd_counter = 0
             self._lcd_counter += 1
             if self._lcd_counter >= 5:
                 self._lcd_counter = 0
-                true_count = len(self._data_points) + 1 if self._data_points else 0
+                true_count = len(self._samples) + 1 if self._samples else 0
                 self._count_lcd.display(true_count)
 
-        if self._histogram and len(self._gui_points) > 1:
-            if not hasattr(self, "_hist_counter"):
-                self._hist_counter = 0
+        # A hidden histogram is not rebinned; showing its page redraws it.
+        if len(self._samples) > 1 and self._histogram_shown():
             self._hist_counter += 1
             if self._hist_counter >= 10:
                 self._hist_counter = 0
-                values = [pt[1] for pt in self._gui_points]
-                self._histogram.update_histogram(values)
+                # The last MAX_HISTORY values are a view of the sample
+                # column — no separate bounded history to maintain.
+                self._ensure_histogram().update_histogram(
+                    self._samples.values(last=MAX_HISTORY)
+                )
 
-    def _update_table(self, points: List[Tuple[int, float, str]]) -> None:
-        if self._table_model is None:
-            return
-        for idx, val, ts in points:
-            self._table_model.appendRow(
-                [
-                    QStandardItem(str(idx)),
-                    QStandardItem(str(val)),
-                    QStandardItem(ts),
-                ]
-            )
-        while self._table_model.rowCount() > MAX_HISTORY:
-            self._table_model.removeRow(0)
+    def _update_table(self, idx: np.ndarray, values: np.ndarray, ts: List[str]) -> None:
+        if self._table_model is not None:
+            self._table_model.append_rows(idx, values, ts)
 
-    def _check_high_speed(self, batch_size: int, now: float) -> None:
+    def _check_high_speed(self, batch_size: int) -> None:
         if self._high_speed:
             return
-        self._batch_history.append((now, batch_size))
-        if len(self._batch_history) > HIGH_SPEED_BATCH_HISTORY:
-            self._batch_history.pop(0)
+        self._batch_history.append(batch_size)  # maxlen drops the oldest
         if len(self._batch_history) < HIGH_SPEED_BATCH_HISTORY:
             return
-        avg = sum(b[1] for b in self._batch_history) / len(self._batch_history)
-        if avg >= HIGH_SPEED_BATCH_THRESHOLD:
+        # Average >= threshold, without the division
+        if sum(self._batch_history) >= _HS_BATCH_SUM:
             self._activate_high_speed()
 
     def _activate_high_speed(self) -> None:
@@ -410,18 +626,18 @@ class GMTimingTab(PlotTabBase):
             return
         self._high_speed = True
         _log.info("HIGH_SPEED_MODE activated")
-        self.status_message.emit("warning", "⚡ HIGH-SPEED MODE — Plot deaktiviert")
+        self.status_message.emit("warning", _HS_ACTIVATED_MSG)
 
-        if self._gui_timer:
-            self._gui_timer.stop()
+        self._set_gui_timer(False)
 
         # Switch to Histogramm tab (index 1) — skipped during sweep sessions
         if self._tab_widget_ref and self._hs_autoswitch:
             self._tab_widget_ref.setCurrentIndex(1)
 
         # Start histogram-only timer (every 2 s)
-        if self._histogram and self._hist_timer is None:
+        if self._hist_container is not None and self._hist_timer is None:
             self._hist_timer = QTimer(self)
+            self._hist_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
             self._hist_timer.timeout.connect(self._update_histogram_only)
             self._hist_timer.start(2000)
 
@@ -434,25 +650,31 @@ class GMTimingTab(PlotTabBase):
             self._hist_timer.stop()
             self._hist_timer = None
 
-        if self._gui_timer and not self._gui_timer.isActive():
-            self._gui_timer.start(GUI_UPDATE_INTERVAL)
+        self._set_gui_timer(True)
 
-    def _update_rate_display(self, now: float) -> None:
+    def _set_gui_timer(self, on: bool) -> None:
+        """Start or stop the GUI update timer, leaving it alone if already so."""
+        timer = self._gui_timer
+        if timer is not None and timer.isActive() != on:
+            if on:
+                timer.start(GUI_UPDATE_INTERVAL)
+            else:
+                timer.stop()
+
+    def _update_rate_display(self) -> None:
         if not self._rate_lcd:
             return
-        if self._cum_us > 0 and self._data_points:
-            true_count = len(self._data_points) + 1
+        if self._cum_us > 0 and self._samples:
+            true_count = len(self._samples) + 1
             cps = true_count / (self._cum_us / 1e6)
             self._rate_lcd.display(round(cps, 1))
 
     def _update_histogram_only(self) -> None:
-        if not self._high_speed or not self._histogram:
+        if not self._high_speed:
             return
-        now = time()
-        if len(self._data_points) > 1:
-            values = [pt[1] for pt in self._data_points[-10000:]]
-            self._histogram.update_histogram(values)
-        self._update_rate_display(now)
+        if self._histogram_shown():
+            self._refresh_histogram()
+        self._update_rate_display()
 
 
 # Register this experiment at import time
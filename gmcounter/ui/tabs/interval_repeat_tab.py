@@ -7,8 +7,9 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 
+from PySide6.QtCore import QTimer  # pylint: disable=no-name-in-module
 from PySide6.QtGui import (  # pylint: disable=no-name-in-module
     QStandardItem,
     QStandardItemModel,
@@ -19,16 +20,20 @@ from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module
     QLabel,
     QSpinBox,
     QTableView,
-    QVBoxLayout,
     QWidget,
 )
 
 from .base import PlotTabBase
+from ..widgets.plot import GeneralPlot, PlotConfig
 from ...core.export import TabExport
 from ...core.interval_binning import IntervalBinner
 
 _log = logging.getLogger(__name__)
 
+# Plot/table refresh delay after the first batch that touched a bin; later
+# batches inside the window only add to the dirty set.
+REFRESH_INTERVAL_MS: int = 250
+
 
 class IntervalRepeatTab(PlotTabBase):
     """MCS-style interval/repeat measurement tab.
@@ -49,6 +54,14 @@ class IntervalRepeatTab(PlotTabBase):
         self._has_unsaved: bool = False
         self._session_start: Optional[datetime] = None
 
+        # Bins touched since the last refresh; on_frames() only records them
+        # and _refresh_timer redraws plot and table once per window.
+        self._dirty_bins: Set[int] = set()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self._flush_refresh)
+
         # .ui widget references (injected by MainWindow)
         self._plot_container: Optional[QWidget] = None
         self._table_view: Optional[QTableView] = None
@@ -81,8 +94,6 @@ class IntervalRepeatTab(PlotTabBase):
     # PlotTabBase lifecycle
 
     def build(self) -> None:
-        from ..widgets.plot import GeneralPlot, PlotConfig
-
         if self._plot_container and self._plot is None:
             bg = (
                 self._plot_container.palette()
@@ -95,9 +106,7 @@ class IntervalRepeatTab(PlotTabBase):
                 background_color=bg,
             )
             self._plot = GeneralPlot(config=cfg)
-            layout = QVBoxLayout(self._plot_container)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.addWidget(self._plot)
+            self._embed(self._plot_container, self._plot)
 
         if self._table_view is not None and self._table_model is None:
             cols = ["Index", "Anzahl", "cps", "t_start (s)", "t_end (s)"]
@@ -112,9 +121,11 @@ class IntervalRepeatTab(PlotTabBase):
         r = self._repeat_input.value() if self._repeat_input else 10
         self._binner = IntervalBinner(w * 1e6, r)
         self._has_unsaved = False
+        self._refresh_timer.stop()
+        self._dirty_bins.clear()
         if self._table_model:
             self._table_model.removeRows(0, self._table_model.rowCount())
-        if self._plot and hasattr(self._plot, "clear_measurement_data"):
+        if self._plot is not None:
             self._plot.clear_measurement_data()
         self._update_status()
 
@@ -122,6 +133,7 @@ class IntervalRepeatTab(PlotTabBase):
         self._session_start = datetime.now()
 
     def on_measurement_stopped(self) -> None:
+        self._flush_refresh()
         if self._binner and self._binner.total_count() > 0:
             self._has_unsaved = True
         self._update_status()
@@ -132,8 +144,9 @@ class IntervalRepeatTab(PlotTabBase):
         points = [(f.index, f.value) for f in frames]
         touched = self._binner.feed(points)
         if touched:
-            self._refresh_plot()
-            self._refresh_table_incremental(touched)
+            self._dirty_bins.update(touched)
+            if not self._refresh_timer.isActive():
+                self._refresh_timer.start()
 
     # ------------------------------------------------------------------
     # Data model
@@ -164,24 +177,26 @@ class IntervalRepeatTab(PlotTabBase):
     def summary_export(self) -> Optional[TabExport]:
         if not self._binner or not self.has_data():
             return None
-        bins = self._binner.bins
+        binner = self._binner
+        width_us = binner.width_us
+        counts = binner.counts
         cols = ["Index", "Anzahl", "cps", "t_start_s", "t_end_s"]
         rows = []
-        for i in range(bins.repeats):
-            t_start = i * bins.width_us / 1e6
-            t_end = (i + 1) * bins.width_us / 1e6
-            count = bins.counts[i]
-            cps = round(count / (bins.width_us / 1e6), 4) if bins.width_us > 0 else 0.0
+        for i in range(binner.repeats):
+            t_start = i * width_us / 1e6
+            t_end = (i + 1) * width_us / 1e6
+            count = counts[i]
+            cps = round(count / (width_us / 1e6), 4) if width_us > 0 else 0.0
             rows.append(
                 [str(i), str(count), str(cps), f"{t_start:.6f}", f"{t_end:.6f}"]
             )
         metadata = {
             "dc:date": datetime.now().strftime("%Y-%m-%d"),
             "dc:title": "Intervallmessung — Zusammenfassung",
-            "interval_width_s": bins.width_us / 1e6,
-            "repeats": bins.repeats,
-            "true_total_count": self._binner.total_count(),
-            "total_device_time_s": round(bins.cum_us / 1e6, 6),
+            "interval_width_s": width_us / 1e6,
+            "repeats": binner.repeats,
+            "true_total_count": binner.total_count(),
+            "total_device_time_s": round(binner.cum_us / 1e6, 6),
         }
         return TabExport(
             filename_hint="intervalle",
@@ -225,39 +240,50 @@ class IntervalRepeatTab(PlotTabBase):
     # ------------------------------------------------------------------
     # Private helpers
 
-    def _refresh_plot(self) -> None:
-        if not self._plot or not self._binner:
+    def _flush_refresh(self) -> None:
+        """Redraw the plot and the rows of all bins touched since the last flush."""
+        self._refresh_timer.stop()
+        if not self._dirty_bins:
             return
-        bins = self._binner.bins
-        pts = [(i, bins.counts[i]) for i in range(bins.repeats)]
-        self._plot.set_summary_points(pts)
+        touched = sorted(self._dirty_bins)
+        self._dirty_bins.clear()
+        if self._binner is None:
+            return
+        # One O(repeats) counts copy serves both views; the bins snapshot
+        # would also copy every delta recorded so far.
+        counts = self._binner.counts
+        self._refresh_plot(counts)
+        self._refresh_table_incremental(touched, counts)
+
+    def _refresh_plot(self, counts: List[int]) -> None:
+        if not self._plot:
+            return
+        self._plot.set_summary_points(list(enumerate(counts)))
+
+    def _refresh_table_incremental(self, touched: List[int], counts: List[int]) -> None:
+        """Rewrite the rows of the *touched* bins in place.
 
-    def _refresh_table_incremental(self, touched: List[int]) -> None:
-        if self._table_model is None or self._binner is None:
+        A row's items are created once, when its bin (or a later one) is first
+        touched; afterwards refreshes only call setText() on them, and only
+        for cells whose text changed.
+        """
+        model = self._table_model
+        if model is None or self._binner is None:
             return
-        bins = self._binner.bins
+        width_us = self._binner.width_us
         for i in touched:
-            count = bins.counts[i]
-            t_start = i * bins.width_us / 1e6
-            t_end = (i + 1) * bins.width_us / 1e6
-            cps = round(count / (bins.width_us / 1e6), 2) if bins.width_us > 0 else 0.0
-            row_items = [
-                QStandardItem(str(i)),
-                QStandardItem(str(count)),
-                QStandardItem(str(cps)),
-                QStandardItem(f"{t_start:.3f}"),
-                QStandardItem(f"{t_end:.3f}"),
-            ]
-            if i < self._table_model.rowCount():
-                for col, item in enumerate(row_items):
-                    self._table_model.setItem(i, col, item)
-            else:
-                # Fill any missing rows up to and including i
-                while self._table_model.rowCount() <= i:
-                    placeholder = [QStandardItem("0")] * 5
-                    self._table_model.appendRow(placeholder)
-                for col, item in enumerate(row_items):
-                    self._table_model.setItem(i, col, item)
+            count = counts[i]
+            t_start = i * width_us / 1e6
+            t_end = (i + 1) * width_us / 1e6
+            cps = round(count / (width_us / 1e6), 2) if width_us > 0 else 0.0
+            texts = (str(i), str(count), str(cps), f"{t_start:.3f}", f"{t_end:.3f}")
+            # Fill any missing rows up to and including i
+            while model.rowCount() <= i:
+                model.appendRow([QStandardItem("0") for _ in range(len(texts))])
+            for col, text in enumerate(texts):
+                item = model.item(i, col)
+                if item.text() != text:
+                    item.setText(text)
 
     def _update_status(self) -> None:
         if not self._status_label:
@@ -265,9 +291,9 @@ class IntervalRepeatTab(PlotTabBase):
         if not self.has_data():
             self._status_label.setText("Keine Daten.")
         else:
-            bins = self._binner.bins  # type: ignore[union-attr]
-            n = self._binner.total_count()
-            t = round(bins.cum_us / 1e6, 1)
+            binner = self._binner  # type: ignore[union-attr]
+            n = binner.total_count()
+            t = round(binner.cum_us / 1e6, 1)
             self._status_label.setText(
-                f"{n} Ereignisse in {bins.repeats} Intervallen · {t} s"
+                f"{n} Ereignisse in {binner.repeats} Intervallen · {t} s"
             )
@@ -26,11 +26,11 @@ from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module
     QLabel,
     QDoubleSpinBox,
     QSpinBox,
-    QVBoxLayout,
     QHeaderView,
 )
 
 from .base import PlotTabBase
+from ..widgets.plot import GeneralPlot, PlotConfig
 from ...core.export import TabExport
 
 if TYPE_CHECKING:
@@ -134,8 +134,6 @@ class ParameterSweepTabBase(PlotTabBase):
 
     def build(self) -> None:
         """Create GeneralPlot inside the .ui container and wire the table model."""
-        from ..widgets.plot import GeneralPlot, PlotConfig
-
         if self._plot_container and self._plot is None:
             bg = (
                 self._plot_container.palette()
@@ -148,9 +146,7 @@ class ParameterSweepTabBase(PlotTabBase):
                 background_color=bg,
             )
             self._plot = GeneralPlot(config=cfg)
-            layout = QVBoxLayout(self._plot_container)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.addWidget(self._plot)
+            self._embed(self._plot_container, self._plot)
 
         if self._table_view is not None and self._table_model is None:
             cols = [
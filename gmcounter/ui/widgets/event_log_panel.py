@@ -1,13 +1,14 @@
 # Layer: ui/widgets — EventLogPanel dock widget (§9).
 # A dockable timestamped scrollback of every status_message line.
 
-from datetime import datetime
+import html
+import time
 
 from PySide6.QtCore import Qt  # pylint: disable=no-name-in-module
+from PySide6.QtGui import QFontDatabase  # pylint: disable=no-name-in-module
 from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module
     QDockWidget,
-    QListWidget,
-    QListWidgetItem,
+    QPlainTextEdit,
     QWidget,
 )
 
@@ -24,7 +25,12 @@ _MAX_ENTRIES = 500
 
 
 class EventLogPanel(QDockWidget):
-    """Dockable log of status messages fed from AppController.status_message."""
+    """Dockable log of status messages fed from AppController.status_message.
+
+    The scrollback is an append-only read-only QPlainTextEdit bounded by
+    setMaximumBlockCount(), so each message adds one coloured line (oldest
+    lines drop off the top) without touching the rest of the document.
+    """
 
     def __init__(self, parent: QWidget) -> None:
         super().__init__("Ereignisprotokoll", parent)
@@ -32,22 +38,19 @@ class EventLogPanel(QDockWidget):
             Qt.DockWidgetArea.BottomDockWidgetArea
             | Qt.DockWidgetArea.RightDockWidgetArea
         )
-        self._list = QListWidget()
-        self._list.setWordWrap(True)
-        self.setWidget(self._list)
+        self._view = QPlainTextEdit()
+        self._view.setReadOnly(True)
+        self._view.setMaximumBlockCount(_MAX_ENTRIES)
+        self._view.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.setWidget(self._view)
 
     def append(self, text: str, color: str = "") -> None:
-        ts = datetime.now().strftime("%H:%M:%S")
-        item = QListWidgetItem(f"[{ts}] {text}")
-        hex_color = _COLOR_MAP.get(color.lower(), _COLOR_MAP.get("white", "#cccccc"))
-        item.setForeground(Qt.GlobalColor.white)
-        item.setData(Qt.ItemDataRole.ForegroundRole, None)
-        item.setToolTip(text)
-        self._list.insertItem(0, item)
-
-        # Keep list bounded
-        while self._list.count() > _MAX_ENTRIES:
-            self._list.takeItem(self._list.count() - 1)
+        ts = time.strftime("%H:%M:%S")
+        hex_color = _COLOR_MAP.get(color.lower(), _COLOR_MAP["white"])
+        self._view.appendHtml(
+            f'<span style="color:{hex_color}">[{ts}] {html.escape(text)}</span>'
+        )
 
     def clear_log(self) -> None:
-        self._list.clear()
+        if not self._view.document().isEmpty():
+            self._view.clear()
@@ -8,22 +8,42 @@ Classes:
     GeneralPlot: Real-time line plot with configurable axes and update modes
     HistogramWidget: Histogram plot for frequency distribution visualization
     FastPlotCurveItem: Optimized curve item for high-performance plotting
+    FastBarsItem: Histogram bars recorded once per update into a QPicture
 
 Performance Features:
     - Batch data updates to minimize rendering overhead
     - Lazy item creation to avoid unnecessary overhead
     - skipFiniteCheck option for pre-validated data
     - Efficient range calculations with caching
-    - GPU acceleration via OpenGL when available
+
+OpenGL is off by default: for 2D PlotWidget curves it is usually slower
+than the raster painter (the large speedups only apply to the 3D
+pyqtgraph.opengl items). Set GMCOUNTER_USE_OPENGL=1 to opt in. Large-N
+smoothness should come from downsampling (``setDownsampling(mode="peak")``)
+rather than OpenGL.
 """
 
 from __future__ import annotations
 
+import os
 from typing import Iterable, Optional, Tuple, List, Any
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import Signal, Slot, QTimer  # pylint: disable=no-name-in-module
-from PySide6.QtGui import QSurfaceFormat  # pylint: disable=no-name-in-module
+from PySide6.QtCore import (  # pylint: disable=no-name-in-module
+    Q_ARG,
+    QElapsedTimer,
+    QMetaObject,
+    QRectF,
+    Qt,
+    Signal,
+    Slot,
+    QTimer,
+)
+from PySide6.QtGui import (  # pylint: disable=no-name-in-module
+    QPainter,
+    QPicture,
+    QSurfaceFormat,
+)
 from ...infrastructure.logging import Debug
 
 # CRITICAL: Disable vsync for maximum plot update speed
@@ -31,16 +51,21 @@ sfmt = QSurfaceFormat()
 sfmt.setSwapInterval(0)
 QSurfaceFormat.setDefaultFormat(sfmt)
 
-try:  # pragma: no cover - optional dependency during headless tests
-    import OpenGL  # noqa: F401 — presence check before enabling
-
-    pg.setConfigOption("useOpenGL", True)
-    pg.setConfigOption("enableExperimental", True)
-    Debug.info("PyQtGraph OpenGL acceleration ENABLED")
-except ImportError:
-    pg.setConfigOption("useOpenGL", False)
-    pg.setConfigOption("enableExperimental", False)
-    Debug.info("PyQtGraph OpenGL not installed — using software rendering")
+# OpenGL is opt-in only (GMCOUNTER_USE_OPENGL=1) — see module docstring.
+_USE_OPENGL = False
+if os.environ.get("GMCOUNTER_USE_OPENGL") == "1":
+    try:  # pragma: no cover - optional dependency during headless tests
+        import OpenGL  # noqa: F401 — presence check before enabling
+
+        _USE_OPENGL = True
+    except ImportError:
+        Debug.info("GMCOUNTER_USE_OPENGL set but PyOpenGL is not installed")
+pg.setConfigOption("useOpenGL", _USE_OPENGL)
+Debug.info(
+    "PyQtGraph OpenGL acceleration ENABLED"
+    if _USE_OPENGL
+    else "PyQtGraph using software rendering"
+)
 
 # Performance-optimized configuration based on pyqtgraph examples
 # Disable antialiasing for speed (can be enabled per-plot if needed)
@@ -51,6 +76,41 @@ pg.setConfigOption("imageAxisOrder", "row-major")
 pg.setConfigOption("useNumba", True)  # Use numba if available for acceleration
 
 
+def _equal_width_histogram(
+    data: np.ndarray, bins: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Histogram *data* into *bins* equal-width bins over its own min/max.
+
+    Each value is routed to its bin with one float64 multiply and a
+    truncating cast (no edge search), then counted with ``np.bincount``.
+    Like ``np.histogram(data, bins=bins)``, values the multiply rounds
+    across an edge are moved back to the side of that edge they compare
+    to, the last bin is closed, and a zero-width range is widened to ±0.5.
+
+    Args:
+        data: Finite, non-empty values
+        bins: Number of bins (>= 1)
+
+    Returns:
+        Tuple of (counts, bin_edges) with len(bin_edges) == bins + 1
+    """
+    data = np.asarray(data, dtype=np.float64)
+    lo = float(data.min())
+    hi = float(data.max())
+    if lo == hi:
+        lo -= 0.5
+        hi += 0.5
+    edges = np.linspace(lo, hi, bins + 1)
+    idx = ((data - lo) * (bins / (hi - lo))).astype(np.intp)
+    # Values equal to hi land one past the end; fold them into the last bin
+    np.minimum(idx, bins - 1, out=idx)
+    # Undo rounding of the multiply against the actual edges
+    idx[data < edges[idx]] -= 1
+    idx[(data >= edges[idx + 1]) & (idx != bins - 1)] += 1
+    counts = np.bincount(idx, minlength=bins)
+    return counts, edges
+
+
 class PlotConfig:
     """Configuration for GeneralPlot.
 
@@ -62,11 +122,17 @@ class PlotConfig:
         max_plot_points (int): Maximum number of points to display in auto-scroll mode
         background_color (Optional[str]): Background color (CSS format)
         grid_alpha (float): Alpha transparency for grid lines (0.0-1.0)
-        use_opengl (bool): Enable OpenGL rendering (best performance)
+        use_opengl (bool): Render this plot through a QOpenGLWidget viewport
+            (opt-in; slower for 2D curves). Defaults to GMCOUNTER_USE_OPENGL.
         antialias (bool): Enable antialiasing (slower but prettier)
-        skip_finite_check (bool): Skip checking for NaN/inf values (faster if data is pre-validated)
+        skip_finite_check (bool): Trust the caller that data has no NaN/inf and skip the
+            host-side finite mask (pyqtgraph's own check is always skipped)
         pen_width (int): Width of plot line
         symbol_size (int): Size of plot symbols
+        index_x_axis (bool): X values are integer sample indices; stored as int32
+            instead of float32 (exact and half the bytes of float64)
+        max_redraw_rate (int): Upper bound on deferred redraws per second; faster
+            update_plot_data(deferred=True) calls are coalesced into the next one
     """
 
     title: Optional[str] = None
@@ -76,11 +142,13 @@ class PlotConfig:
     max_plot_points: int = 1000
     background_color: Optional[str] = None
     grid_alpha: float = 0.3
-    use_opengl: bool = True
+    use_opengl: bool = _USE_OPENGL
     antialias: bool = False
     skip_finite_check: bool = False
     pen_width: int = 5
     symbol_size: int = 10
+    index_x_axis: bool = False
+    max_redraw_rate: int = 30
 
     def __init__(self, **kwargs):
         for key, value in kwargs.items():
@@ -151,6 +219,88 @@ class FastPlotCurveItem(pg.PlotCurveItem):
         return None
 
 
+class FastBarsItem(pg.GraphicsObject):
+    """Vertical histogram bars replayed from a prebuilt QPicture.
+
+    BarGraphItem rebuilds its drawing state bar by bar on every setOpts().
+    This item records all bars with a single ``QPainter.drawRects`` call per
+    data update and replays the recording with one ``drawPicture`` on paint.
+    """
+
+    def __init__(self, brush: Any = "w", pen: Any = "w") -> None:
+        """Initialize an empty bar item.
+
+        Args:
+            brush: Bar fill (anything accepted by pg.mkBrush)
+            pen: Bar outline (anything accepted by pg.mkPen)
+        """
+        super().__init__()
+        self._brush = pg.mkBrush(brush)
+        self._pen = pg.mkPen(pen)
+        self._picture = QPicture()
+        self._bounds = QRectF()
+
+    def setData(
+        self,
+        x0: np.ndarray,
+        x1: np.ndarray,
+        height: np.ndarray,
+        brush: Any = None,
+        pen: Any = None,
+    ) -> None:
+        """Record new bars spanning [x0, x1] with the given heights.
+
+        Args:
+            x0: Left bar edges
+            x1: Right bar edges
+            height: Bar heights (same length as x0/x1); integer counts are
+                used as-is without a float copy
+            brush: Optional new fill
+            pen: Optional new outline
+        """
+        if brush is not None:
+            self._brush = pg.mkBrush(brush)
+        if pen is not None:
+            self._pen = pg.mkPen(pen)
+
+        left = np.asarray(x0, dtype=np.float64)
+        width = np.asarray(x1, dtype=np.float64) - left
+        heights = np.asarray(height)
+
+        picture = QPicture()
+        painter = QPainter(picture)
+        painter.setPen(self._pen)
+        painter.setBrush(self._brush)
+        painter.drawRects(
+            [
+                QRectF(x, 0.0, w, h)
+                for x, w, h in zip(left.tolist(), width.tolist(), heights.tolist())
+            ]
+        )
+        painter.end()
+
+        self.prepareGeometryChange()
+        self._picture = picture
+        if left.size:
+            x_min = float(left[0])
+            y_min = min(0.0, float(heights.min()))
+            y_max = max(0.0, float(heights.max()))
+            self._bounds = QRectF(
+                x_min, y_min, float(left[-1] + width[-1]) - x_min, y_max - y_min
+            )
+        else:
+            self._bounds = QRectF()
+        self.update()
+
+    def paint(self, painter, *args) -> None:
+        """Replay the recorded bars."""
+        painter.drawPicture(0, 0, self._picture)
+
+    def boundingRect(self) -> QRectF:
+        """Return the cached extent of the recorded bars."""
+        return QRectF(self._bounds)
+
+
 class GeneralPlot(pg.PlotWidget):
     """A high-performance real-time plot widget using pyqtgraph.
 
@@ -159,7 +309,6 @@ class GeneralPlot(pg.PlotWidget):
     - Auto-ranging mode (fits all data automatically)
     - Manual zoom/pan mode
     - Batch data updates for maximum efficiency
-    - GPU acceleration via OpenGL
     - Automatic downsampling for large datasets
     - Pre-validated data support (skipFiniteCheck)
 
@@ -205,6 +354,9 @@ class GeneralPlot(pg.PlotWidget):
             config = PlotConfig()
 
         self.config = config
+        # GraphicsView picked up the global option; honour a per-plot override
+        if config.use_opengl != _USE_OPENGL:
+            self.useOpenGL(config.use_opengl)
 
         # Performance flags
         self._user_interacted = False
@@ -219,11 +371,28 @@ class GeneralPlot(pg.PlotWidget):
         self._last_data_points: List[Tuple[float, float]] = []
         self._is_clearing = False
 
-        # Deferred update mechanism for batch operations
+        # Persistent render buffers — filled in place on every update so no
+        # per-frame array allocation happens; grown if a caller exceeds them.
+        self._x_dtype = np.int32 if self.config.index_x_axis else np.float32
+        self._x_buf = np.empty(self.MAX_RENDER_POINTS, dtype=self._x_dtype)
+        self._y_buf = np.empty(self.MAX_RENDER_POINTS, dtype=np.float32)
+
+        # Deferred update mechanism: the latest snapshot waits here until the
+        # redraw-rate budget allows the next paint (see max_redraw_rate).
         self._update_timer = QTimer()
         self._update_timer.setSingleShot(True)
         self._update_timer.timeout.connect(self._process_deferred_update)
-        self._deferred_data: List[Tuple[float, float]] = []
+        self._deferred_data: Optional[List[Tuple[float, float]]] = None
+        self._since_redraw = QElapsedTimer()
+
+        # Streaming window for append_batch(): points are written at a cursor
+        # into buffers twice the window size, and the newest window is slid
+        # back to the front only when the cursor reaches the end.
+        self._stream_window = self.MAX_RENDER_POINTS
+        self._sx_buf: Optional[np.ndarray] = None
+        self._sy_buf: Optional[np.ndarray] = None
+        self._stream_n = 0
+        self._stream_dirty = False
 
         # Configure plot appearance
         self._configure_appearance()
@@ -270,16 +439,14 @@ class GeneralPlot(pg.PlotWidget):
         Automatically disables auto-range/auto-scroll when user interacts,
         allowing manual control.
         """
-        # Ignore programmatic updates
+        # Ignore programmatic updates, and every further pan/zoom step once
+        # the auto modes are already off
         if self._programmatic_update or self._is_clearing:
             return
-
-        viewbox = self.getViewBox()
-        if not viewbox:
+        if not (self._auto_range_enabled or self._auto_scroll_enabled):
             return
 
-        # Only process if auto modes are active
-        if self._auto_range_enabled or self._auto_scroll_enabled:
+        if self.getViewBox():
             self._auto_range_enabled = False
             self._auto_scroll_enabled = False
             self._user_interacted = True
@@ -304,7 +471,7 @@ class GeneralPlot(pg.PlotWidget):
 
         self.auto_scroll_changed.emit(enabled)
         Debug.debug(
-            f"Auto-scroll: {enabled}, max_points: {self.config.max_plot_points}"
+            "Auto-scroll: %s, max_points: %s", enabled, self.config.max_plot_points
         )
 
     @Slot(bool)
@@ -326,8 +493,7 @@ class GeneralPlot(pg.PlotWidget):
             self._programmatic_update = False
 
         self.auto_range_changed.emit(enabled)
-        state = "enabled" if enabled else "disabled"
-        Debug.debug(f"Auto-range {state}")
+        Debug.debug("Auto-range %s", "enabled" if enabled else "disabled")
 
     @Slot()
     def clear_measurement_data(self) -> None:
@@ -344,7 +510,10 @@ class GeneralPlot(pg.PlotWidget):
                 self._plot_curve = None
 
             self._last_data_points.clear()
-            self._deferred_data.clear()
+            self._deferred_data = None
+            self._stream_n = 0
+            self._stream_dirty = False
+            self._update_timer.stop()
             self._scroll_counter = 0
             self._user_interacted = False
 
@@ -367,34 +536,110 @@ class GeneralPlot(pg.PlotWidget):
 
         PERFORMANCE TIPS:
         - Pass lists of tuples for fastest updates
-        - Use deferred=True for burst updates (batches them together)
+        - Use deferred=True for streaming: repaints are capped at
+          config.max_redraw_rate and only the newest snapshot is drawn
         - Use use_symbols=True only for <200 points
-        - Use skipFiniteCheck=True only if data is pre-validated
+        - NaN/inf points are dropped once before handing data to pyqtgraph
 
         Args:
             data_points: List of (x, y) tuples
             use_symbols: Display symbols at points (slower)
-            deferred: If True, batch updates together (for streaming data)
+            deferred: If True, coalesce with other deferred updates (streaming)
         """
         if not data_points:
             return
 
         if deferred:
-            # Batch updates together to reduce rendering overhead
-            self._deferred_data.extend(data_points)
-            if not self._update_timer.isActive():
-                self._update_timer.start(16)  # ~60 FPS
+            # Each call carries the full series, so a newer snapshot simply
+            # supersedes one that has not been drawn yet.
+            self._deferred_data = data_points
+            self._schedule_redraw()
             return
 
         # Immediate update
         self._perform_plot_update(data_points, use_symbols)
 
+    def set_stream_window(self, window: int) -> None:
+        """Set how many of the most recent append_batch() points are shown.
+
+        Args:
+            window: Number of points kept in the streaming window
+        """
+        self._stream_window = max(1, int(window))
+        self._sx_buf = None
+        self._sy_buf = None
+        self._stream_n = 0
+
+    def append_batch(self, xs: Iterable[float], ys: Iterable[float]) -> None:
+        """Append new points to the streaming window and schedule a redraw.
+
+        Unlike update_plot_data(), which re-reads the whole series, only the
+        new points are copied; the redraw hands pyqtgraph a view of the
+        preallocated buffers.  Redraws obey config.max_redraw_rate.
+
+        Args:
+            xs: X coordinates of the new points
+            ys: Y coordinates of the new points (same length as xs)
+        """
+        xs = np.asarray(xs, dtype=self._x_dtype)
+        ys = np.asarray(ys, dtype=np.float32)
+        k = xs.size
+        if k == 0:
+            return
+
+        window = self._stream_window
+        if self._sx_buf is None:
+            self._sx_buf = np.empty(2 * window, dtype=self._x_dtype)
+            self._sy_buf = np.empty(2 * window, dtype=np.float32)
+        if k >= window:
+            xs = xs[-window:]
+            ys = ys[-window:]
+            k = window
+            self._stream_n = 0
+
+        n = self._stream_n
+        if n + k > self._sx_buf.size:
+            # Slide the newest (window - k) points to the front
+            keep = window - k
+            self._sx_buf[:keep] = self._sx_buf[n - keep : n]
+            self._sy_buf[:keep] = self._sy_buf[n - keep : n]
+            n = keep
+        self._sx_buf[n : n + k] = xs
+        self._sy_buf[n : n + k] = ys
+        self._stream_n = n + k
+
+        self._stream_dirty = True
+        self._schedule_redraw()
+
+    def flush(self) -> None:
+        """Draw the streaming window now (normally done by the redraw timer)."""
+        self._stream_dirty = False
+        n = self._stream_n
+        if n == 0 or self._sx_buf is None:
+            return
+        start = max(0, n - self._stream_window)
+        self._render_arrays(self._sx_buf[start:n], self._sy_buf[start:n], False)
+
+    def _schedule_redraw(self) -> None:
+        """Start the redraw timer, spacing paints by config.max_redraw_rate."""
+        if self._update_timer.isActive():
+            return
+        min_interval = 1000 // max(1, self.config.max_redraw_rate)
+        wait = 0
+        if self._since_redraw.isValid():
+            wait = max(0, min_interval - self._since_redraw.elapsed())
+        self._update_timer.start(wait)
+
     def _process_deferred_update(self) -> None:
         """Process batched deferred updates."""
-        if self._deferred_data:
-            data = self._deferred_data[:]
-            self._deferred_data.clear()
+        data = self._deferred_data
+        self._deferred_data = None
+        if data:
+            self._since_redraw.start()
             self._perform_plot_update(data, use_symbols=False)
+        elif self._stream_dirty:
+            self._since_redraw.start()
+            self.flush()
 
     def _perform_plot_update(
         self, data_points: List[Tuple[float, float]], use_symbols: bool = False
@@ -411,13 +656,39 @@ class GeneralPlot(pg.PlotWidget):
         # Store current data
         self._last_data_points = data_points.copy()
 
-        # Extract arrays for plotting
-        x_arr = np.array([p[0] for p in data_points], dtype=np.float32)
-        y_arr = np.array([p[1] for p in data_points], dtype=np.float32)
+        # Fill the persistent buffers and plot views of them
+        n = len(data_points)
+        if n > self._x_buf.size:
+            size = max(n, 2 * self._x_buf.size)
+            self._x_buf = np.empty(size, dtype=self._x_dtype)
+            self._y_buf = np.empty(size, dtype=np.float32)
+        x_arr = self._x_buf[:n]
+        y_arr = self._y_buf[:n]
+        x_arr[:] = [p[0] for p in data_points]
+        y_arr[:] = [p[1] for p in data_points]
 
-        # Determine rendering mode
         # Increased threshold to 1000 points for better visibility on Windows
-        show_symbols = use_symbols and len(data_points) < 1000
+        self._render_arrays(x_arr, y_arr, use_symbols and n < 1000)
+
+    def _render_arrays(
+        self, x_arr: np.ndarray, y_arr: np.ndarray, show_symbols: bool
+    ) -> None:
+        """Hand x/y arrays to the curve item and refresh the view range.
+
+        Args:
+            x_arr: X data array
+            y_arr: Y data array
+            show_symbols: Display symbols at points
+        """
+        # Drop NaN/inf once here so pyqtgraph can skip its own finite scan
+        # in arrayToQPath (skipFiniteCheck=True below).
+        if not self.config.skip_finite_check:
+            finite = np.isfinite(x_arr) & np.isfinite(y_arr)
+            if not finite.all():
+                x_arr = x_arr[finite]
+                y_arr = y_arr[finite]
+                if x_arr.size == 0:
+                    return
 
         # Create or update plot curve item
         if self._plot_curve is None:
@@ -426,10 +697,10 @@ class GeneralPlot(pg.PlotWidget):
             self._update_plot_curve(x_arr, y_arr, show_symbols)
 
         # Update range based on current mode
-        self._update_view_range(data_points)
+        self._update_view_range(x_arr, y_arr)
 
         # Emit signal
-        self.plot_updated.emit(len(data_points))
+        self.plot_updated.emit(int(x_arr.size))
 
     def _create_plot_curve(
         self, x_arr: np.ndarray, y_arr: np.ndarray, show_symbols: bool
@@ -442,7 +713,7 @@ class GeneralPlot(pg.PlotWidget):
             show_symbols: Whether to show symbols at points
         """
         Debug.debug(
-            f"Creating plot curve ({len(x_arr)} points, symbols={show_symbols})"
+            "Creating plot curve (%d points, symbols=%s)", len(x_arr), show_symbols
         )
 
         # Create optimized curve item
@@ -458,7 +729,7 @@ class GeneralPlot(pg.PlotWidget):
                 symbolBrush=pg.mkBrush("#FF3333"),  # Bright red symbols
                 symbolPen=pg.mkPen("#FF3333", width=2),  # Bright red border
                 antialias=self.config.antialias,
-                skipFiniteCheck=self.config.skip_finite_check,
+                skipFiniteCheck=True,
             )
         else:
             self._plot_curve.setData(
@@ -466,7 +737,7 @@ class GeneralPlot(pg.PlotWidget):
                 y_arr,
                 pen=pg.mkPen(width=self.config.pen_width, color="#0099FF"),  # Cyan line
                 antialias=self.config.antialias,
-                skipFiniteCheck=self.config.skip_finite_check,
+                skipFiniteCheck=True,
             )
 
         self.addItem(self._plot_curve)
@@ -491,18 +762,17 @@ class GeneralPlot(pg.PlotWidget):
                 y_arr,
                 symbol="o",
                 symbolSize=self.config.symbol_size,
-                skipFiniteCheck=self.config.skip_finite_check,
+                skipFiniteCheck=True,
             )
         else:
-            self._plot_curve.setData(
-                x_arr, y_arr, skipFiniteCheck=self.config.skip_finite_check
-            )
+            self._plot_curve.setData(x_arr, y_arr, skipFiniteCheck=True)
 
-    def _update_view_range(self, data_points: List[Tuple[float, float]]) -> None:
+    def _update_view_range(self, x_arr: np.ndarray, y_arr: np.ndarray) -> None:
         """Update plot range based on current mode.
 
         Args:
-            data_points: All data points for range calculation
+            x_arr: X data array (as passed to the curve)
+            y_arr: Y data array (as passed to the curve)
         """
         viewbox = self.getViewBox()
         if not viewbox or not self._plot_curve:
@@ -519,81 +789,53 @@ class GeneralPlot(pg.PlotWidget):
             self._scroll_counter += 1
             if self._scroll_counter >= self.SCROLL_UPDATE_INTERVAL:
                 self._scroll_counter = 0
-                self._apply_scroll_view(data_points, viewbox)
+                self._apply_view_range(x_arr, y_arr, viewbox, padding=0)
 
         elif not self._user_interacted:
             # Initial range (manual mode, no user interaction yet)
-            self._apply_initial_view(data_points, viewbox)
+            self._apply_view_range(x_arr, y_arr, viewbox, padding=0.05)
 
-    def _apply_scroll_view(
-        self, data_points: List[Tuple[float, float]], viewbox: Any
+    def _apply_view_range(
+        self, x_arr: np.ndarray, y_arr: np.ndarray, viewbox: Any, padding: float
     ) -> None:
-        """Apply scrolling view showing last N points.
+        """Show the last ``max_plot_points`` points of the curve.
 
-        Args:
-            data_points: All data points
-            viewbox: PyQtGraph ViewBox instance
-        """
-        # Select data for display
-        max_pts = self.config.max_plot_points
-        display_data = (
-            data_points[-max_pts:] if len(data_points) > max_pts else data_points
-        )
-
-        if not display_data:
-            return
-
-        x_range, y_range = self._calculate_range(display_data)
-
-        self._programmatic_update = True
-        viewbox.enableAutoRange(enable=False)
-        viewbox.setRange(xRange=x_range, yRange=y_range, padding=0)
-        self._programmatic_update = False
-
-    def _apply_initial_view(
-        self, data_points: List[Tuple[float, float]], viewbox: Any
-    ) -> None:
-        """Apply initial range for manual mode.
+        Shared by auto-scroll and the initial manual-mode view; operates on
+        the arrays already built in _perform_plot_update (no second pass).
 
         Args:
-            data_points: All data points
+            x_arr: X data array
+            y_arr: Y data array
             viewbox: PyQtGraph ViewBox instance
+            padding: Extra ViewBox padding passed to setRange
         """
-        max_pts = self.config.max_plot_points
-        display_data = (
-            data_points[-max_pts:] if len(data_points) > max_pts else data_points
-        )
-
-        if not display_data:
+        if x_arr.size == 0:
             return
 
-        x_range, y_range = self._calculate_range(display_data)
+        max_pts = self.config.max_plot_points
+        x_range, y_range = self._compute_range(x_arr[-max_pts:], y_arr[-max_pts:])
 
         self._programmatic_update = True
         viewbox.enableAutoRange(enable=False)
-        viewbox.setRange(xRange=x_range, yRange=y_range, padding=0.05)
+        viewbox.setRange(xRange=x_range, yRange=y_range, padding=padding)
         self._programmatic_update = False
 
     @staticmethod
-    def _calculate_range(
-        data_points: List[Tuple[float, float]],
-    ) -> Tuple[List[float], List[float]]:
+    def _compute_range(x: np.ndarray, y: np.ndarray) -> Tuple[List[float], List[float]]:
         """Calculate axis ranges for data with smart padding.
 
         Args:
-            data_points: Data points
+            x: X values
+            y: Y values
 
         Returns:
             Tuple of (x_range, y_range) as [[min, max], [min, max]]
         """
-        if not data_points:
+        if x.size == 0:
             return [0, 1], [0, 1]
 
-        x_vals = np.array([p[0] for p in data_points], dtype=np.float32)
-        y_vals = np.array([p[1] for p in data_points], dtype=np.float32)
-
-        x_min, x_max = float(x_vals.min()), float(x_vals.max())
-        y_min, y_max = float(y_vals.min()), float(y_vals.max())
+        x_min, x_max = float(x.min()), float(x.max())
+        y_min, y_max = float(y.min()), float(y.max())
 
         # Smart padding
         def pad_range(vmin: float, vmax: float) -> Tuple[float, float]:
@@ -628,23 +870,16 @@ class GeneralPlot(pg.PlotWidget):
         self.update_plot_data(sorted_pts, use_symbols=True)
 
     def append_data(self, x: float, y: float) -> None:
-        """Append a single data point (streaming mode).
+        """Append a single data point to the streaming window.
 
-        More efficient than update_plot_data for single-point updates.
+        Shorthand for ``append_batch([x], [y])``: only the new point is
+        copied, and redraws are coalesced by the redraw timer.
 
         Args:
             x: X coordinate
             y: Y coordinate
         """
-        if self._last_data_points:
-            # Append to existing data
-            self._last_data_points.append((x, y))
-        else:
-            # First point
-            self._last_data_points = [(x, y)]
-
-        # Use deferred update for efficiency in streaming
-        self.update_plot_data([(x, y)], deferred=True)
+        self.append_batch((x,), (y,))
 
     @Slot(str, str)
     def reconfigure(
@@ -667,7 +902,7 @@ class GeneralPlot(pg.PlotWidget):
             return
 
         setattr(self.config, key, value)
-        Debug.debug(f"Plot reconfigured: {key}={value}")
+        Debug.debug("Plot reconfigured: %s=%s", key, value)
 
         # Apply changes
         if key == "title":
@@ -692,7 +927,9 @@ class HistogramWidget(pg.PlotWidget):
     Uses PlotConfig for consistent configuration with GeneralPlot.
 
     Signals:
-        histogram_updated: Emitted after update (int: number of bins)
+        histogram_updated: Emitted after update (int: number of bins). The
+            emit is queued to the next event-loop iteration so connected
+            slots never run on the histogram update stack.
         histogram_cleared: Emitted when histogram is cleared
 
     Slots:
@@ -764,7 +1001,7 @@ class HistogramWidget(pg.PlotWidget):
                 self.config.grid_alpha = grid_alpha
 
         # Internal state
-        self._hist_item: Optional[pg.BarGraphItem] = None
+        self._hist_item: Optional[FastBarsItem] = None
         self._is_clearing = False
         self._pending_update = False
         self._update_timer = QTimer()
@@ -774,6 +1011,10 @@ class HistogramWidget(pg.PlotWidget):
 
         # Performance: Track last bin count for optimization
         self._last_bin_count = 0
+        # Last drawn bars — an identical update skips the redraw entirely
+        self._prev_hist: Optional[np.ndarray] = None
+        self._prev_edges: Optional[np.ndarray] = None
+        self._prev_color: Optional[str] = None
 
         # Configure appearance (matches GeneralPlot pattern)
         self._configure_appearance()
@@ -798,8 +1039,9 @@ class HistogramWidget(pg.PlotWidget):
             self.setTitle(self.config.title)
 
         Debug.debug(
-            f"Histogram appearance configured: title={self.config.title}, "
-            f"alpha={self.config.grid_alpha}"
+            "Histogram appearance configured: title=%s, alpha=%s",
+            self.config.title,
+            self.config.grid_alpha,
         )
 
     @Slot()
@@ -815,6 +1057,8 @@ class HistogramWidget(pg.PlotWidget):
             if self._hist_item is not None:
                 self.removeItem(self._hist_item)
                 self._hist_item = None
+            self._prev_hist = None
+            self._prev_edges = None
 
         finally:
             self._is_clearing = False
@@ -838,45 +1082,55 @@ class HistogramWidget(pg.PlotWidget):
             return
 
         try:
-            # Calculate histogram using numpy (vectorized, very fast)
-            hist, bin_edges = np.histogram(data_arr, bins=bins)
+            # Equal-width bins: route values arithmetically (no edge search)
+            hist, bin_edges = _equal_width_histogram(data_arr, bins)
+
+            # Idle frames (no new data since last update) cost nothing
+            if (
+                self._hist_item is not None
+                and color == self._prev_color
+                and np.array_equal(hist, self._prev_hist)
+                and np.array_equal(bin_edges, self._prev_edges)
+            ):
+                return
+            self._prev_hist = hist
+            self._prev_edges = bin_edges
+            self._prev_color = color
 
-            # Reuse or create bar graph item (lazy initialization)
+            # Reuse or create bar item (lazy initialization)
             if self._hist_item is None:
-                # First time: create new item
-                # Use x0 and x1 (bin edges) for precise bar placement
-                self._hist_item = pg.BarGraphItem(
-                    x0=bin_edges[:-1],
-                    x1=bin_edges[1:],
-                    height=hist,
-                    brush=color,
-                    pen="w",
-                )
+                self._hist_item = FastBarsItem(brush=color, pen="w")
                 self.addItem(self._hist_item)
-                Debug.debug(f"Histogram created with {bins} bins")
-            else:
-                # Update existing item (no allocation, just data update)
-                self._hist_item.setOpts(
-                    x0=bin_edges[:-1],
-                    x1=bin_edges[1:],
-                    height=hist,
-                    brush=color,
-                    pen="w",
-                )
+                Debug.debug("Histogram created with %d bins", bins)
+
+            # Use x0 and x1 (bin edges) for precise bar placement
+            self._hist_item.setData(
+                bin_edges[:-1], bin_edges[1:], hist, brush=color, pen="w"
+            )
 
             # Auto-range only if bin count changed (optimization)
             if bins != self._last_bin_count:
                 self.autoRange()
                 self._last_bin_count = bins
 
-            # Emit signal
-            self.histogram_updated.emit(bins)
+            # Emit signal via the event loop (see class docstring)
+            QMetaObject.invokeMethod(
+                self,
+                "_emit_histogram_updated",
+                Qt.ConnectionType.QueuedConnection,
+                Q_ARG(int, bins),
+            )
 
         except Exception as e:  # pylint: disable=broad-except
             Debug.error(f"Error updating histogram: {e}")
         finally:
             self._pending_update = False
 
+    @Slot(int)
+    def _emit_histogram_updated(self, bins: int) -> None:
+        """Emit histogram_updated (invoked queued from the update path)."""
+        self.histogram_updated.emit(bins)
+
     @Slot(list, int, str)
     def update_histogram(
         self,
@@ -899,7 +1153,7 @@ class HistogramWidget(pg.PlotWidget):
             color: Bar color (default: white)
             deferred: If True, batch updates together (16ms intervals)
         """
-        if not data:
+        if data.size == 0 if isinstance(data, np.ndarray) else not data:
             Debug.debug("update_histogram called with empty data")
             return
 
@@ -944,7 +1198,7 @@ class HistogramWidget(pg.PlotWidget):
             # Legacy call: reconfigure(title_value)
             self.config.title = key
             self.setTitle(key)
-            Debug.debug(f"Histogram reconfigured (legacy): title={key}")
+            Debug.debug("Histogram reconfigured (legacy): title=%s", key)
             return
 
         # New unified signature
@@ -957,7 +1211,7 @@ class HistogramWidget(pg.PlotWidget):
             return
 
         setattr(self.config, key, value)
-        Debug.debug(f"Histogram reconfigured: {key}={value}")
+        Debug.debug("Histogram reconfigured: %s=%s", key, value)
 
         # Apply changes
         if key == "title":
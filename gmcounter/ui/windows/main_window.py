@@ -7,12 +7,13 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-import gmcounter
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QMainWindow, QCompleter
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer
+from PySide6.QtWidgets import QMainWindow
 
+from ... import __version__ as _GUI_VERSION
 from ...infrastructure.config import import_config
 from ...infrastructure.device_manager import DeviceManager
+from ...infrastructure.save_service import write_export
 from ...infrastructure.modules.registry import ModuleRegistry
 from ...core.services import SaveState
 from ..controllers.app_controller import AppController
@@ -25,12 +26,22 @@ from ..tabs.interval_repeat_tab import (
 )  # explicitly wired interval tab
 from ..widgets.event_log_panel import EventLogPanel
 from ..common import dialogs as MessageHelper
+from ..common.completer import install_contains_completer
 from ..common.file_dialogs import FileDialogManager
 from ..common.statusbar import StatusBarManager
 from ...pyqt.ui_mainwindow import Ui_MainWindow
 
 _log = logging.getLogger(__name__)
 CONFIG = import_config()
+_MESSAGES = CONFIG.get("messages", {})
+_GM_CFG = CONFIG.get("gm_counter", {})
+# cMode text indexed by bool(repeat)
+_REPEAT_LABELS = (
+    _GM_CFG.get("label_map", {}).get("repeat_off", "Repeat Off"),
+    _GM_CFG.get("label_map", {}).get("repeat_on", "Repeat On"),
+)
+# progressTimer texts for the first hour, indexed by elapsed seconds
+_SECOND_LABELS = tuple(f"{i}s" for i in range(3601))
 
 # Named color values for the status LED
 _LED_COLORS = {
@@ -41,6 +52,13 @@ _LED_COLORS = {
     "red": "rgb(255, 11, 3)",
     "gray": "rgb(128, 128, 128)",
 }
+# Finished statusLED stylesheets per named color, built once
+_LED_STYLES = {
+    name: f"background-color: {rgb}; border: 0px; padding: 4px; border-radius: 10px"
+    for name, rgb in _LED_COLORS.items()
+}
+# Status bar / event log color per tab status level
+_TAB_STATUS_COLORS = {"info": "green", "warning": "orange", "error": "red"}
 
 
 class MainWindow(QMainWindow):
@@ -141,6 +159,27 @@ class MainWindow(QMainWindow):
         self._interval_session: bool = False
         self._active_interval_tab: Optional[IntervalRepeatTab] = None
 
+        # Close is two-phase: the first closeEvent starts the background
+        # shutdown, the second (after it finishes) actually closes.
+        self._shutting_down = False
+        self._shutdown_done = False
+
+        # Last progress-bar pixel position drawn (-1 = none yet)
+        self._progress_px: int = -1
+        # Last elapsed second written to progressTimer (-1 = none yet)
+        self._progress_s: int = -1
+        # Last statistics label texts, to skip identical setText() rounds
+        self._stats_texts: tuple = ()
+        # Last (status, color) shown by the status LED and text
+        self._status_indicator: tuple = ()
+        # (state key, LCD) pairs refreshed on every device poll
+        self._state_lcds = (
+            ("count", self.ui.currentCount),
+            ("last_count", self.ui.lastCount),
+            ("voltage", self.ui.cVoltage),
+            ("counting_time", self.ui.cDuration),
+        )
+
         # Measurement lifecycle is forwarded to the active sweep tab inside
         # _on_measurement_started / _on_measurement_stopped (below), which
         # fire after GMTimingTab via the AppController signal ordering.
@@ -174,17 +213,15 @@ class MainWindow(QMainWindow):
         self._setup_voltage_warning()
         self._setup_global_distance_visibility()
 
-        # Initial device info — set callback before fetch so it fires on initial connect
+        # Initial device info — set callback before fetch so it fires on initial
+        # connect; the serial round trip itself waits until the window is up.
         device_manager.on_device_info = self._on_device_info
-        if device_manager.device and device_manager.connected:
-            device_manager.fetch_device_info()
+        QTimer.singleShot(50, self._ctrl.fetch_device_info)
 
         # Initial status
         self._set_status_indicator("Bereit", "green")
         self._status_bar.show_message(
-            CONFIG.get("messages", {})
-            .get("connected", "Verbunden mit {0}")
-            .format(device_manager.port),
+            _MESSAGES.get("connected", "Verbunden mit {0}").format(device_manager.port),
             duration=3000,
         )
 
@@ -212,16 +249,24 @@ class MainWindow(QMainWindow):
         self.ui.buttonReset.clicked.connect(self._handle_reset)
         self.ui.buttonSetting.clicked.connect(self._handle_apply_settings)
 
-        self.ui.buttonStart.setEnabled(True)
-        self.ui.buttonStop.setEnabled(False)
-        self.ui.buttonSave.setEnabled(False)
-        self.ui.buttonReset.setEnabled(False)
+        # Device-settings inputs locked for the duration of a measurement
+        ui = self.ui
+        self._setting_inputs = (
+            ui.sVoltage,
+            ui.sDuration,
+            ui.sModeMulti,
+            ui.sQModeAuto,
+            ui.sQModeMan,
+        )
+        self._apply_button_state(start=True, stop=False, save=False, reset=False)
 
         # Allow typing a custom duration in seconds directly into the combobox
         self.ui.sDuration.setEditable(True)
 
         # autoSave — gates incremental backup; reflect true initial state
-        self.ui.autoSave.setChecked(False)
+        # without a toggled() round-trip (the .ui default may be checked)
+        with QSignalBlocker(self.ui.autoSave):
+            self.ui.autoSave.setChecked(False)
         self.ui.autoSave.toggled.connect(self._on_auto_save_toggled)
 
         self.ui.autoScroll.toggled.connect(self._on_auto_scroll_toggled)
@@ -234,10 +279,8 @@ class MainWindow(QMainWindow):
             )
 
         # Bug fix §6: enable auto-query radios (were disabled in .ui)
-        if hasattr(self.ui, "sQModeMan"):
-            self.ui.sQModeMan.setEnabled(True)
-        if hasattr(self.ui, "sQModeAuto"):
-            self.ui.sQModeAuto.setEnabled(True)
+        self.ui.sQModeMan.setEnabled(True)
+        self.ui.sQModeAuto.setEnabled(True)
 
         if self.ui.autoScroll.isChecked():
             self._on_auto_scroll_toggled(True)
@@ -247,20 +290,14 @@ class MainWindow(QMainWindow):
         self.ui.radSample.clear()
         self.ui.radSample.addItems(samples)
         self.ui.radSample.setCurrentIndex(-1)
-        completer = QCompleter(samples)
-        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        self.ui.radSample.setCompleter(completer)
+        install_contains_completer(self.ui.radSample, samples)
 
     def _setup_detector_code_input(self) -> None:
         codes = CONFIG.get("detektor_codes", [])
         self.ui.detectorCode.clear()
         self.ui.detectorCode.addItems(codes)
         self.ui.detectorCode.setCurrentIndex(-1)
-        completer = QCompleter(codes)
-        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        self.ui.detectorCode.setCompleter(completer)
+        install_contains_completer(self.ui.detectorCode, codes)
 
     def _setup_global_distance_visibility(self) -> None:
         self.ui.tabWidget.currentChanged.connect(self._on_tab_changed)
@@ -288,44 +325,27 @@ class MainWindow(QMainWindow):
             self._ctrl.set_active_tab(self._gm_tab)
 
     def _on_tab_status(self, level: str, text: str) -> None:
-        color = {"info": "green", "warning": "orange", "error": "red"}.get(
-            level, "white"
-        )
+        color = _TAB_STATUS_COLORS.get(level, "white")
         self._status_bar.show_message(text, backcolor=color)
         self._event_log.append(text, color)
 
     def _on_measurement_started(self) -> None:
-        self.ui.buttonStart.setEnabled(False)
-        self.ui.buttonStop.setEnabled(True)
-        self.ui.buttonSave.setEnabled(False)
-        self.ui.buttonReset.setEnabled(False)
         # Lock all device-settings controls — only binary acquisition runs now
-        self.ui.buttonSetting.setEnabled(False)
-        self.ui.sVoltage.setEnabled(False)
-        self.ui.sDuration.setEnabled(False)
-        self.ui.sModeMulti.setEnabled(False)
-        if hasattr(self.ui, "sQModeAuto"):
-            self.ui.sQModeAuto.setEnabled(False)
-        if hasattr(self.ui, "sQModeMan"):
-            self.ui.sQModeMan.setEnabled(False)
+        self._apply_button_state(
+            start=False, stop=True, save=False, reset=False, setting=False, inputs=False
+        )
         self._set_status_indicator("Messung", "blue")
+        self._progress_px = -1
+        self._progress_s = -1
         # Forward to the active sweep tab so it can record _session_start
         if self._active_sweep_tab is not None:
             self._active_sweep_tab.on_measurement_started()
 
     def _on_measurement_stopped(self) -> None:
-        self.ui.buttonStop.setEnabled(False)
-        self.ui.buttonSave.setEnabled(True)
-        self.ui.buttonReset.setEnabled(True)
         # Restore all device-settings controls
-        self.ui.buttonSetting.setEnabled(True)
-        self.ui.sVoltage.setEnabled(True)
-        self.ui.sDuration.setEnabled(True)
-        self.ui.sModeMulti.setEnabled(True)
-        if hasattr(self.ui, "sQModeAuto"):
-            self.ui.sQModeAuto.setEnabled(True)
-        if hasattr(self.ui, "sQModeMan"):
-            self.ui.sQModeMan.setEnabled(True)
+        self._apply_button_state(
+            stop=False, save=True, reset=True, setting=True, inputs=True
+        )
         self._set_status_indicator("Gestoppt", "yellow")
         self.ui.progressBar.setMaximum(1)
         self.ui.progressBar.setValue(0)
@@ -339,14 +359,14 @@ class MainWindow(QMainWindow):
             # In a sweep session Start stays enabled so the user can fire the
             # next measurement point immediately; unsaved state is tracked by
             # the sweep tab, not _save_state.
-            self.ui.buttonStart.setEnabled(True)
+            self._apply_button_state(start=True)
         elif self._interval_session:
             # Interval session: Start disabled until data is saved or reset.
             # interval_tab.on_measurement_stopped() fires via the ctrl signal.
-            self.ui.buttonStart.setEnabled(False)
+            self._apply_button_state(start=False)
         else:
             # Normal mode: Start disabled until data is saved/reset.
-            self.ui.buttonStart.setEnabled(False)
+            self._apply_button_state(start=False)
             self._save_state.mark_unsaved()
 
     def _on_device_state_updated(self, data: dict) -> None:
@@ -355,36 +375,62 @@ class MainWindow(QMainWindow):
         # measurement stops when binary bytes might still be in the RX buffer).
         if data.get("error"):
             return
-        label_map = CONFIG.get("gm_counter", {}).get("label_map", {})
-        self.ui.currentCount.display(data.get("count", 0))
-        self.ui.lastCount.display(data.get("last_count", 0))
-        self.ui.cVoltage.display(data.get("voltage", 0))
-        self.ui.cDuration.display(data.get("counting_time", 0))
-        repeat = data.get("repeat", False)
-        self.ui.cMode.setText(
-            label_map.get("repeat_on", "Repeat On")
-            if repeat
-            else label_map.get("repeat_off", "Repeat Off")
-        )
+        # Most polls repeat the last state; only touch widgets whose shown
+        # value differs (the GM tab also writes to the count LCDs).
+        for key, lcd in self._state_lcds:
+            value = data.get(key, 0)
+            if lcd.value() != value:
+                lcd.display(value)
+        mode = _REPEAT_LABELS[bool(data.get("repeat", False))]
+        if self.ui.cMode.text() != mode:
+            self.ui.cMode.setText(mode)
 
     def _on_statistics_updated(self, stats: dict) -> None:
         if stats.get("count", 0) > 1:
-            self.ui.cStatPoints.setText(f"{stats.get('count', 0):.0f}")
-            self.ui.cStatMin.setText(f"{stats.get('min', 0):.0f}")
-            self.ui.cStatMax.setText(f"{stats.get('max', 0):.0f}")
-            self.ui.cStatAvg.setText(f"{stats.get('avg', 0):.0f}")
-            self.ui.cStatSD.setText(f"{stats.get('stdev', 0):.0f}")
+            # str(round(x)) renders the same text as f"{x:.0f}" (both round
+            # half to even) without going through the format-spec parser.
+            texts = tuple(
+                str(round(stats.get(key, 0)))
+                for key in ("count", "min", "max", "avg", "stdev")
+            )
+            if texts == self._stats_texts:
+                return
+            self._stats_texts = texts
+            for label, text in zip(
+                (
+                    self.ui.cStatPoints,
+                    self.ui.cStatMin,
+                    self.ui.cStatMax,
+                    self.ui.cStatAvg,
+                    self.ui.cStatSD,
+                ),
+                texts,
+            ):
+                label.setText(text)
 
     def _on_progress_updated(self, elapsed: int, total: int) -> None:
-        self.ui.progressTimer.setText(f"{elapsed}s")
+        if elapsed != self._progress_s:
+            self._progress_s = elapsed
+            self.ui.progressTimer.setText(
+                _SECOND_LABELS[elapsed]
+                if 0 <= elapsed < len(_SECOND_LABELS)
+                else f"{elapsed}s"
+            )
+        bar = self.ui.progressBar
         if total > 0:
-            self.ui.progressBar.setMaximum(total)
-            self.ui.progressBar.setValue(elapsed)
-        else:
-            self.ui.progressBar.setMaximum(0)  # indeterminate
+            if bar.maximum() != total:
+                bar.setMaximum(total)
+            # Only move the bar once it advances by at least one pixel — on
+            # long runs most 1 s ticks would otherwise repaint an unchanged bar.
+            px = elapsed * bar.width() // total
+            if px != self._progress_px or elapsed >= total:
+                self._progress_px = px
+                bar.setValue(elapsed)
+        elif bar.maximum() != 0:
+            bar.setMaximum(0)  # indeterminate
 
     def _on_reconnect_succeeded(self) -> None:
-        self.ui.buttonStart.setEnabled(True)
+        self._apply_button_state(start=True)
         self._set_status_indicator("Verbunden", "green")
 
     def _on_connection_lost_terminal(self) -> None:
@@ -532,8 +578,6 @@ class MainWindow(QMainWindow):
         self._ctrl.stop_measurement()
 
     def _handle_save(self) -> None:
-        from ...infrastructure.save_service import write_export
-
         interval = self._active_interval_tab
         if self._interval_session and interval is not None and interval.has_data():
             # ── Interval save: summary CSV + per-interval CSVs ────────────
@@ -584,8 +628,7 @@ class MainWindow(QMainWindow):
             self._save_state.mark_saved()
             self._ctrl.finalize_journal()
 
-            self.ui.buttonSave.setEnabled(False)
-            self.ui.buttonStart.setEnabled(True)
+            self._apply_button_state(start=True, save=False)
             n = len(per_interval)
             self._status_bar.show_message(
                 f"Zusammenfassung gespeichert. {ok_count}/{n} Intervall-CSV(s) exportiert.",
@@ -655,8 +698,7 @@ class MainWindow(QMainWindow):
             self._save_state.mark_saved()
             self._ctrl.finalize_journal()
 
-            self.ui.buttonSave.setEnabled(False)
-            self.ui.buttonStart.setEnabled(True)
+            self._apply_button_state(start=True, save=False)
             n = len(individual)
             self._status_bar.show_message(
                 f"Zusammenfassung gespeichert. {ok_count}/{n} Einzelmessung(en) exportiert.",
@@ -679,19 +721,20 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            extra = {"gui_version": gmcounter.__version__}
-            openbis = self.ui.cOpenbis.text()
+            ui = self.ui
+            extra = {"gui_version": _GUI_VERSION}
+            openbis = ui.cOpenbis.text()
             if openbis and openbis != "unknown":
                 extra["counter_openbis_code"] = openbis
-            fw = self.ui.cVersion.text()
+            fw = ui.cVersion.text()
             if fw and fw != "unknown":
                 extra["counter_firmware_version"] = fw
             if export.rows:
                 extra["total_count"] = len(export.rows)
-            detector = self.ui.detectorCode.currentText().strip()
+            detector = ui.detectorCode.currentText().strip()
             if detector:
                 extra["detector_code"] = detector
-            global_dist = self.ui.distanceGlobalDistance.value()
+            global_dist = ui.distanceGlobalDistance.value()
             if global_dist > 0.0:
                 extra["sample_distance_cm"] = global_dist
             export.metadata.update(extra)
@@ -699,15 +742,14 @@ class MainWindow(QMainWindow):
             saved = self._file_dialog_manager.manual_save_export(
                 self,
                 export,
-                self.ui.radSample.currentText(),
-                self.ui.groupLetter.currentText(),
-                self.ui.suffix.text().strip(),
+                ui.radSample.currentText(),
+                ui.groupLetter.currentText(),
+                ui.suffix.text().strip(),
             )
             if saved and saved.exists():
                 self._save_state.mark_saved()
                 self._ctrl.finalize_journal()
-                self.ui.buttonSave.setEnabled(False)
-                self.ui.buttonStart.setEnabled(True)
+                self._apply_button_state(start=True, save=False)
                 self._status_bar.show_message("Gespeichert.", duration=3000)
             else:
                 MessageHelper.show_error(self, "Fehler beim Speichern.", "Fehler")
@@ -722,9 +764,7 @@ class MainWindow(QMainWindow):
             if interval is not None and interval.has_data():
                 if not MessageHelper.ask_question(
                     self,
-                    CONFIG.get("messages", {}).get(
-                        "unsaved_data", "Messdaten verwerfen?"
-                    ),
+                    _MESSAGES.get("unsaved_data", "Messdaten verwerfen?"),
                     "Warnung",
                 ):
                     return
@@ -735,8 +775,7 @@ class MainWindow(QMainWindow):
             self._set_sweep_lock(False)
             self._gm_tab.set_high_speed_autoswitch(True)
             self._save_state.mark_saved()
-            self.ui.buttonSave.setEnabled(False)
-            self.ui.buttonStart.setEnabled(True)
+            self._apply_button_state(start=True, save=False)
             self._set_status_indicator("Bereit", "green")
             return
 
@@ -746,9 +785,7 @@ class MainWindow(QMainWindow):
             if sweep is not None and sweep.has_data():
                 if not MessageHelper.ask_question(
                     self,
-                    CONFIG.get("messages", {}).get(
-                        "unsaved_data", "Messdaten verwerfen?"
-                    ),
+                    _MESSAGES.get("unsaved_data", "Messdaten verwerfen?"),
                     "Warnung",
                 ):
                     return
@@ -762,22 +799,21 @@ class MainWindow(QMainWindow):
             if self._save_state.has_unsaved():
                 if not MessageHelper.ask_question(
                     self,
-                    CONFIG.get("messages", {}).get("unsaved_data", "Daten verwerfen?"),
+                    _MESSAGES.get("unsaved_data", "Daten verwerfen?"),
                     "Warnung",
                 ):
                     return
 
         self._gm_tab.on_reset()
         self._save_state.mark_saved()
-        self.ui.buttonSave.setEnabled(False)
-        self.ui.buttonStart.setEnabled(True)
+        self._apply_button_state(start=True, save=False)
         self._set_status_indicator("Bereit", "green")
 
     def _handle_apply_settings(self) -> None:
         # Bug fix §6: read repeat from sModeMulti radio (not the broken cMode.text() check)
         repeat = self.ui.sModeMulti.isChecked()
         # Bug fix §6: auto-query enabled end-to-end via sQModeAuto radio
-        auto_query = hasattr(self.ui, "sQModeAuto") and self.ui.sQModeAuto.isChecked()
+        auto_query = self.ui.sQModeAuto.isChecked()
         self._ctrl.apply_settings(
             voltage=int(self.ui.sVoltage.value()),
             counting_time=0,  # always infinite — host controls duration via delta accumulation
@@ -805,55 +841,101 @@ class MainWindow(QMainWindow):
         self.ui.autoScroll.setChecked(True)
 
     def _on_plot_user_interaction(self) -> None:
+        # The plot has already left auto-scroll/auto-range itself; only the
+        # checkbox needs to follow, silently, so _on_auto_scroll_toggled does
+        # not call set_auto_scroll(False) on it a second time.
         if self.ui.autoScroll.isChecked():
-            self.ui.autoScroll.setChecked(False)
+            with QSignalBlocker(self.ui.autoScroll):
+                self.ui.autoScroll.setChecked(False)
 
     def _on_auto_save_toggled(self, checked: bool) -> None:
         msg = (
-            CONFIG.get("messages", {}).get("auto_save_enabled", "Auto-Backup aktiviert")
+            _MESSAGES.get("auto_save_enabled", "Auto-Backup aktiviert")
             if checked
-            else CONFIG.get("messages", {}).get(
-                "auto_save_disabled", "Auto-Backup deaktiviert"
-            )
+            else _MESSAGES.get("auto_save_disabled", "Auto-Backup deaktiviert")
         )
         self._status_bar.show_message(msg, duration=1000)
 
     def _on_voltage_changed(self, value: int) -> None:
-        threshold = CONFIG.get("gm_counter", {}).get("voltage_warning_threshold", 650)
+        threshold = _GM_CFG.get("voltage_warning_threshold", 650)
         if value > threshold:
             self.ui.sVoltage.setStyleSheet("background-color: orange;")
             self._status_bar.show_message(
-                CONFIG.get("messages", {})
-                .get("voltage_warning", "Achtung: {0} V")
-                .format(value),
+                _MESSAGES.get("voltage_warning", "Achtung: {0} V").format(value),
                 duration=3000,
             )
         else:
             self.ui.sVoltage.setStyleSheet("")
 
     # ------------------------------------------------------------------
-    # Status indicator
+    # Button / status indicator
+
+    def _apply_button_state(
+        self,
+        start: Optional[bool] = None,
+        stop: Optional[bool] = None,
+        save: Optional[bool] = None,
+        reset: Optional[bool] = None,
+        setting: Optional[bool] = None,
+        inputs: Optional[bool] = None,
+    ) -> None:
+        """Enable/disable the measurement buttons; None leaves a button as is.
+
+        setEnabled() re-polishes and repaints even when the value is unchanged,
+        so each widget is only touched on an actual transition.  *inputs*
+        covers the device-settings inputs that are locked while measuring;
+        all changes land in the same event-loop pass, so Qt paints them once.
+        """
+        pairs = [
+            (self.ui.buttonStart, start),
+            (self.ui.buttonStop, stop),
+            (self.ui.buttonSave, save),
+            (self.ui.buttonReset, reset),
+            (self.ui.buttonSetting, setting),
+        ]
+        if inputs is not None:
+            pairs.extend((widget, inputs) for widget in self._setting_inputs)
+        for widget, enabled in pairs:
+            if enabled is not None and widget.isEnabled() != enabled:
+                widget.setEnabled(enabled)
 
     def _set_status_indicator(self, status: str, color: str) -> None:
-        led_color = _LED_COLORS.get(color, _LED_COLORS["gray"])
-        self.ui.statusLED.setStyleSheet(
-            f"background-color: {led_color}; border: 0px; padding: 4px; border-radius: 10px"
-        )
+        # setStyleSheet() re-parses the QSS and re-polishes the LED even for
+        # an identical sheet, so repeated states (e.g. "Bereit") are skipped.
+        if (status, color) == self._status_indicator:
+            return
+        self._status_indicator = (status, color)
+        self.ui.statusLED.setStyleSheet(_LED_STYLES.get(color, _LED_STYLES["gray"]))
         self.ui.statusText.setText(status)
 
     # ------------------------------------------------------------------
     # Window lifecycle
 
     def closeEvent(self, event) -> None:
+        if self._shutdown_done:
+            event.accept()
+            return
+        if self._shutting_down:
+            event.ignore()
+            return
         if self._save_state.has_unsaved():
             if not MessageHelper.ask_question(
                 self,
-                CONFIG.get("messages", {}).get(
+                _MESSAGES.get(
                     "unsaved_data_end", "Daten nicht gespeichert. Trotzdem schließen?"
                 ),
                 "Warnung",
             ):
                 event.ignore()
                 return
-        self._ctrl.cleanup()
-        event.accept()
+        # Thread joins and the serial close run off the GUI thread; the window
+        # stays painted (but inert) and closes for real once they are done.
+        self._shutting_down = True
+        self.setEnabled(False)
+        self._set_status_indicator("Beenden...", "gray")
+        event.ignore()
+        self._ctrl.cleanup_async(self._on_shutdown_finished)
+
+    def _on_shutdown_finished(self) -> None:
+        self._shutdown_done = True
+        self.close()
@@ -79,3 +79,9 @@ def test_multi_batch_accumulation_continuity():
     assert len(kept2) == 1
     assert kept2[0] == (2, 100.0)
     assert reached2 is True
+
+
+def test_untrimmed_batch_is_passed_on_without_copy():
+    points = [(0, 100.0), (1, 200.0)]
+    assert accumulate_and_trim(points, 0.0, 0.0)[0] is points
+    assert accumulate_and_trim(points, 0.0, 1000.0)[0] is points
@@ -3,7 +3,12 @@
 from datetime import datetime
 from pathlib import Path
 from gmcounter.core.models import MeasurementPoint, MeasurementSession
-from gmcounter.core.export import TabExport, build_gm_tab_export, compose_save_path
+from gmcounter.core.export import (
+    TabExport,
+    build_gm_tab_export,
+    compose_save_path,
+    save_stamp,
+)
 
 
 def _make_session() -> MeasurementSession:
@@ -80,3 +85,10 @@ def test_tab_export_round_trip():
     for row in export.rows:
         for cell in row:
             assert isinstance(cell, str)
+
+
+def test_compose_save_path_uses_given_stamp():
+    export = TabExport(filename_hint="gm_timing", columns=[], rows=[], metadata={})
+    path = compose_save_path(export, Path("/data"), index=2, stamp="2024_01_31")
+    assert path.name == "2024_01_31-02-gm_timing.csv"
+    assert save_stamp(datetime(2024, 1, 31, 23, 59)) == "2024_01_31"
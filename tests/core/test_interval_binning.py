@@ -93,3 +93,20 @@ def test_bins_snapshot_is_copy():
     _feed(b, [100_000.0])
     snap2 = b.bins
     assert snap1.counts[0] != snap2.counts[0] or snap1.cum_us != snap2.cum_us
+
+
+def test_counts_and_cum_us_match_the_bins_snapshot():
+    b = IntervalBinner(width_us=1_000_000.0, repeats=3)
+    _feed(b, [400_000.0, 800_000.0, 900_000.0])
+    snap = b.bins
+    assert b.counts == snap.counts
+    assert b.cum_us == snap.cum_us
+    b.counts[0] = 99  # a copy, not the live list
+    assert b.counts == snap.counts
+
+
+def test_running_total_and_touched_bins_across_feeds():
+    b = IntervalBinner(width_us=1_000_000.0, repeats=3)
+    assert b.feed([(1, 400_000.0), (2, 300_000.0), (3, 800_000.0)]) == [0, 1]
+    assert b.feed([(4, 900_000.0), (5, 2_000_000.0)]) == [2]  # 2nd is past window
+    assert b.total_count() == sum(b.counts) == 5
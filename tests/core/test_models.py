@@ -41,6 +41,12 @@ def test_frame_is_frozen():
         pass
 
 
+def test_frame_fields_by_name_and_position():
+    f = Frame(3, 12.5, "12:00:00.000")
+    assert (f.index, f.value, f.timestamp) == (3, 12.5, "12:00:00.000")
+    assert f == Frame(index=3, value=12.5, timestamp="12:00:00.000")
+
+
 def test_desired_state_to_device_settings():
     ds = DesiredState(voltage=550, counting_time=2, repeat=True, stream=4)
     settings = ds.to_device_settings()
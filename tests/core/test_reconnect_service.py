@@ -73,3 +73,20 @@ def test_retry_service_abort_flag():
     svc = ConnectionRetryService(max_attempts=5, initial_delay_ms=1)
     result = svc.attempt_reconnect(lambda: False, abort_flag=abort)
     assert result is False
+
+
+def test_retry_service_abort_during_backoff_skips_attempt():
+    aborted = []
+    calls = []
+
+    def wait(_seconds):
+        aborted.append(True)  # caller aborts while we are backing off
+
+    svc = ConnectionRetryService(max_attempts=3, initial_delay_ms=10_000)
+    result = svc.attempt_reconnect(
+        lambda: calls.append(1) or True,
+        abort_flag=lambda: bool(aborted),
+        wait=wait,
+    )
+    assert result is False
+    assert calls == []
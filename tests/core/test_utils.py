@@ -1,10 +1,15 @@
 """Tests for core/utils.py — no Qt required."""
 
+import time
+from datetime import datetime
+
 import pytest
 from gmcounter.core.utils import (
     sanitize_subterm_for_folder,
     create_group_name,
     calculate_statistics,
+    RunningStatistics,
+    TimeOfDayStamper,
 )
 
 
@@ -47,6 +52,52 @@ def test_calculate_statistics_single():
     assert stats["std"] == 0.0
 
 
+def test_running_statistics_matches_batch():
+    values = [1500.0, 1490.5, 1502.25, 1499.0, 1800.0, 1200.0]
+    rs = RunningStatistics()
+    rs.extend(values[:2])
+    rs.extend(values[2:])
+    expected = calculate_statistics(values)
+    got = rs.as_dict()
+    assert got["count"] == expected["count"]
+    assert got["min"] == expected["min"]
+    assert got["max"] == expected["max"]
+    assert got["mean"] == pytest.approx(expected["mean"])
+    assert got["std"] == pytest.approx(expected["std"])
+
+
+def test_running_statistics_merge_matches_extend():
+    values = [1500.0, 1490.5, 1502.25, 1499.0, 1800.0, 1200.0, 1650.0]
+    batch = values[3:]
+    bmean = sum(batch) / len(batch)
+    bm2 = sum((v - bmean) ** 2 for v in batch)
+
+    merged = RunningStatistics()
+    merged.merge(0, 0.0, 0.0, 0.0, 0.0)  # empty batch is a no-op
+    merged.extend(values[:3])
+    merged.merge(len(batch), bmean, bm2, min(batch), max(batch))
+    expected = calculate_statistics(values)
+    got = merged.as_dict()
+    assert got["count"] == expected["count"]
+    assert got["min"] == expected["min"] and got["max"] == expected["max"]
+    assert got["mean"] == pytest.approx(expected["mean"])
+    assert got["std"] == pytest.approx(expected["std"])
+
+    fresh = RunningStatistics()
+    fresh.merge(len(batch), bmean, bm2, min(batch), max(batch))
+    assert fresh.as_dict()["min"] == min(batch)
+
+
+def test_running_statistics_reset():
+    rs = RunningStatistics()
+    rs.extend([1.0, 2.0])
+    rs.reset()
+    assert rs.as_dict() == calculate_statistics([])
+    rs.extend([5.0])
+    assert rs.as_dict()["min"] == 5.0
+    assert rs.as_dict()["std"] == 0.0
+
+
 def test_create_group_name_valid():
     name = create_group_name("A")
     assert "A" in name
@@ -56,3 +107,14 @@ def test_create_group_name_valid():
 def test_create_group_name_invalid():
     name = create_group_name("1")
     assert name == "Ungültige Gruppe"
+
+
+def test_time_of_day_stamper_matches_strftime():
+    stamp = TimeOfDayStamper()
+    base_ns = time.time_ns()
+    for offset_ms in (0, 1, 999, 1000, 61_250):
+        now_ns = base_ns + offset_ms * 1_000_000
+        expected = datetime.fromtimestamp(now_ns // 1000 / 1e6).strftime("%H:%M:%S.%f")[
+            :-3
+        ]
+        assert stamp(now_ns) == expected
@@ -0,0 +1,60 @@
+# Tests for infrastructure.logging.Debug — deferred debug formatting.
+
+import logging
+
+from gmcounter.infrastructure.logging import Debug
+
+
+class _Loud:
+    """Argument whose __str__ records that it was formatted."""
+
+    def __init__(self) -> None:
+        self.formatted = False
+
+    def __str__(self) -> str:
+        self.formatted = True
+        return "loud"
+
+
+def test_debug_args_not_formatted_when_disabled(monkeypatch):
+    monkeypatch.setattr(Debug, "enabled_debug", False)
+    arg = _Loud()
+    Debug.debug("value: %s", arg)
+    assert not arg.formatted
+
+
+def test_debug_args_formatted_when_enabled(monkeypatch, capsys):
+    monkeypatch.setattr(Debug, "enabled_debug", True)
+    monkeypatch.setattr(Debug, "DEBUG_LEVEL", Debug.DEBUG_INFO)
+    monkeypatch.setattr(Debug, "logger", None)
+    arg = _Loud()
+    Debug.debug("value: %s", arg)
+    assert arg.formatted
+
+
+def test_init_sets_enabled_debug(tmp_path, monkeypatch):
+    for attr in ("enabled_debug", "DEBUG_LEVEL", "LOG_FILE", "logger"):
+        monkeypatch.setattr(Debug, attr, getattr(Debug, attr))
+    root = logging.getLogger("gmcounter")
+    monkeypatch.setattr(root, "handlers", list(root.handlers))
+    monkeypatch.setattr(root, "propagate", root.propagate)
+    monkeypatch.setattr(root, "level", root.level)
+
+    Debug.init(debug_level=Debug.DEBUG_OFF)
+    assert Debug.enabled_debug is False
+    Debug.init(debug_level=Debug.DEBUG_INFO, log_dir=str(tmp_path))
+    assert Debug.enabled_debug is True
+    for handler in root.handlers:
+        handler.close()
+
+
+class _Caller:
+    def log(self):
+        Debug.info("hello")
+
+
+def test_verbose_prefix_names_calling_method(monkeypatch, capsys):
+    monkeypatch.setattr(Debug, "DEBUG_LEVEL", Debug.DEBUG_VERBOSE)
+    monkeypatch.setattr(Debug, "logger", None)
+    _Caller().log()
+    assert "[_Caller.log] hello" in capsys.readouterr().out
@@ -140,3 +140,39 @@ def test_eop_does_not_consume_following_data():
     # No data packets should be decoded from the same pass (parsing stops at EOP).
     # The residual bytes stay in the buffer for a potential subsequent feed.
     assert out == []
+
+
+def test_bulk_decode_matches_bytewise_feed():
+    """Large chunks (bulk path) decode exactly like one-byte feeds (scalar path)."""
+    body = b"".join(_packet(t) for t in range(1, 40))
+    stream = MARKER + body + b"\x00\xaa\x55" + body + EOP
+
+    bulk = PacketParser(ticks_per_us=48)
+    out_bulk = bulk.feed(stream)
+
+    bytewise = PacketParser(ticks_per_us=48)
+    out_bytes = []
+    for b in stream:
+        out_bytes.extend(bytewise.feed(bytes([b])))
+
+    assert out_bulk == out_bytes
+    assert len(out_bulk) == 78
+    assert bulk.end_of_period and bytewise.end_of_period
+
+
+def test_bulk_run_longer_than_max_run():
+    p = PacketParser(ticks_per_us=1)
+    p.feed(MARKER)
+    n = PacketParser.MAX_RUN * 2 + 3
+    out = p.feed(b"".join(_packet(t) for t in range(n)))
+    assert [v for _, v in out] == [float(t) for t in range(n)]
+    assert out[-1][0] == n
+
+
+def test_bulk_decode_every_run_length():
+    # Runs are decoded in power-of-two blocks; cover every bit pattern up to 2**7
+    for run in range(1, 129):
+        p = PacketParser(ticks_per_us=1)
+        p.feed(MARKER)
+        out = p.feed(b"".join(_packet(t * 7) for t in range(run)))
+        assert out == [(t + 1, float(t * 7)) for t in range(run)]
@@ -0,0 +1,19 @@
+"""Tests for the ReconnectWorker QThread wrapper."""
+
+import pytest
+
+pytest.importorskip("PySide6", reason="ReconnectWorker requires PySide6 / QThread")
+
+from gmcounter.infrastructure.qt_threads import ReconnectWorker
+
+
+def test_abort_interrupts_backoff_wait():
+    """abort() wakes the worker out of a long backoff delay."""
+    worker = ReconnectWorker(
+        reconnect_fn=lambda: False,
+        max_attempts=3,
+        initial_delay_ms=30_000,
+    )
+    worker.start()
+    worker.abort()
+    assert worker.wait(2000), "worker still sleeping through its backoff"
@@ -39,6 +39,18 @@ def test_save_csv_content(tmp_path):
     assert lines[1] == "1,100.0,12:00:00"
 
 
+def test_save_csv_quotes_and_line_endings(tmp_path):
+    svc = SaveService(base_dir=tmp_path)
+    export = TabExport(
+        filename_hint="gm",
+        columns=["A", "B"],
+        rows=[["1", "x,y"], ["2", "z"]],
+        metadata={},
+    )
+    path = svc.save(export)
+    assert path.read_bytes() == b'A,B\r\n1,"x,y"\r\n2,z\r\n'
+
+
 def test_save_index_increments(tmp_path):
     svc = SaveService(base_dir=tmp_path)
     export = TabExport(filename_hint="x", columns=[], rows=[], metadata={})
@@ -0,0 +1,71 @@
+"""Tests for infrastructure.serial_device.SerialDevice read paths."""
+
+import pytest
+
+pytest.importorskip("serial", reason="SerialDevice requires pyserial")
+
+from gmcounter.infrastructure.serial_device import SerialDevice
+
+
+class _FakePort:
+    """Minimal pyserial stand-in that counts timeout reconfigurations."""
+
+    is_open = True
+
+    def __init__(self, data: bytes = b"", timeout: float = 1.0) -> None:
+        self._data = bytearray(data)
+        self._timeout = timeout
+        self.timeout_sets = 0
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        self._timeout = value
+        self.timeout_sets += 1
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._data)
+
+    def read(self, size: int = 1) -> bytes:
+        out = bytes(self._data[:size])
+        del self._data[:size]
+        return out
+
+    def readline(self) -> bytes:
+        pos = self._data.find(b"\n")
+        return self.read(len(self._data) if pos == -1 else pos + 1)
+
+
+def _device(port: _FakePort) -> SerialDevice:
+    dev = SerialDevice("/dev/null", timeout=1.0)
+    dev.serial = port
+    dev.connected = True
+    return dev
+
+
+def test_repeated_fast_reads_reconfigure_timeout_once():
+    port = _FakePort(b"\xaa" * 30)
+    dev = _device(port)
+    for _ in range(3):
+        assert dev.read_fast(max_bytes=10, timeout_ms=50) == b"\xaa" * 10
+    assert port.timeout_sets == 1
+    assert port.timeout == pytest.approx(0.05)
+
+
+def test_line_read_restores_default_timeout():
+    port = _FakePort(b"ok\n")
+    dev = _device(port)
+    dev.read_fast(max_bytes=0, timeout_ms=50)
+    assert dev.read_value(timeout=0.1) == "ok"
+    assert port.timeout == 1.0
+
+
+def test_delimiter_read_stops_at_delimiter():
+    port = _FakePort(b"abc\r\ndef")
+    dev = _device(port)
+    assert dev.read_fast(max_bytes=64, delimiter=b"\r\n") == b"abc\r\n"
+    assert port.in_waiting == 3
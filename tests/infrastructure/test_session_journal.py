@@ -32,6 +32,25 @@ def test_journal_record_appends_row(tmp_path):
     assert float(rows[1][3]) == pytest.approx(123.5)
 
 
+def test_journal_record_batch_is_written_in_order_before_markers(tmp_path):
+    journal = SessionJournal(session_dir=tmp_path / "sess")
+    journal.record_batch([(1, 1.5), (2, 2.5)])
+    journal.mark_gap()
+    journal.record_batch([(3, 3.5)])
+    journal.finalize()
+    journal.close()
+    rows = list(csv.reader(open(journal.path, encoding="utf-8")))
+    assert [(r[1], r[2]) for r in rows[1:]] == [
+        ("data", "1"),
+        ("data", "2"),
+        ("gap", ""),
+        ("data", "3"),
+        ("finalized", ""),
+    ]
+    # One timestamp per batch
+    assert rows[1][0] == rows[2][0]
+
+
 def test_journal_mark_gap(tmp_path):
     journal = SessionJournal(session_dir=tmp_path / "sess")
     journal.mark_gap()
@@ -50,6 +69,38 @@ def test_journal_finalize_writes_marker(tmp_path):
     assert "finalized" in kinds
 
 
+def test_journal_flush_thread_writes_when_rows_arrive(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "gmcounter.infrastructure.session_journal.FSYNC_INTERVAL_S", 0.01
+    )
+    journal = SessionJournal(session_dir=tmp_path / "sess")
+    journal.record_batch([(1, 1.5)])
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline:
+        if "data" in journal.path.read_text(encoding="utf-8"):
+            break
+        time.sleep(0.01)
+    else:
+        pytest.fail("queued batch never reached the journal file")
+    journal.close()
+    journal._flush_thread.join(timeout=2.0)
+    assert not journal._flush_thread.is_alive()
+
+
+def test_journal_drops_batches_after_finalize(tmp_path):
+    journal = SessionJournal(session_dir=tmp_path / "sess")
+    journal.record_batch([(1, 1.5)])
+    journal.finalize()
+    journal._flush_thread.join(timeout=2.0)
+    assert not journal._flush_thread.is_alive()
+
+    journal.record_batch([(2, 2.5)])
+    assert not journal._pending
+    journal.close()
+    rows = list(csv.reader(open(journal.path, encoding="utf-8")))
+    assert [(r[1], r[2]) for r in rows[1:]] == [("data", "1"), ("finalized", "")]
+
+
 def test_journal_path_property(tmp_path):
     journal = SessionJournal(session_dir=tmp_path / "sess")
     assert journal.path == tmp_path / "sess" / "journal.csv"
@@ -95,3 +146,16 @@ def test_find_orphan_journals_ignores_finalized(tmp_path, monkeypatch):
 
     orphans = find_orphan_journals()
     assert orphans == []
+
+
+def test_find_orphan_journals_ignores_header_only_journal(tmp_path, monkeypatch):
+    from datetime import datetime
+
+    monkeypatch.setattr(
+        "gmcounter.infrastructure.session_journal.JOURNAL_DIR", tmp_path / "sessions"
+    )
+    today = datetime.now().strftime("%Y%m%d")
+    journal = SessionJournal(session_dir=tmp_path / "sessions" / f"{today}_140000")
+    journal.close()
+
+    assert find_orphan_journals() == []
@@ -0,0 +1,43 @@
+"""Tests for StatePollerThread's change-only state emission."""
+
+import pytest
+
+pytest.importorskip("PySide6", reason="StatePollerThread requires PySide6 / QThread")
+
+from unittest.mock import Mock
+
+from gmcounter.infrastructure.qt_threads import StatePollerThread
+
+
+def _make_poller():
+    poller = StatePollerThread(Mock())
+    emitted = []
+    poller.data_ready.connect(emitted.append)
+    return poller, emitted
+
+
+def test_unchanged_state_is_only_emitted_as_heartbeat():
+    poller, emitted = _make_poller()
+    state = {"count": 5, "voltage": 400}
+
+    # Poll 1 emits; the heartbeat lands _HEARTBEAT_POLLS polls after it
+    for _ in range(StatePollerThread._HEARTBEAT_POLLS):
+        poller._publish(dict(state))
+    assert len(emitted) == 1
+    poller._publish(dict(state))
+    assert len(emitted) == 2  # first poll + heartbeat
+
+    poller._publish({"count": 6, "voltage": 400})
+    assert emitted[-1]["count"] == 6
+
+
+def test_forced_poll_and_resume_always_emit():
+    poller, emitted = _make_poller()
+    state = {"count": 1}
+    poller._publish(state)
+    poller._publish(state, forced=True)
+    assert len(emitted) == 2
+
+    poller.resume()
+    poller._publish(state)
+    assert len(emitted) == 3
@@ -42,5 +42,63 @@ def test_index_reset():
     assert not thread._parser.synced
 
 
+def test_short_reads_are_coalesced_into_one_batch():
+    """Small reads are held back until emit_min_points are pending."""
+    mock_manager = Mock()
+    mock_manager.measurement_state = MeasurementStateService()
+    thread = DataAcquisitionThread(mock_manager)
+    thread._emit_min_points = 4
+    thread._emit_interval_s = 60.0
+    signals = []
+    thread.data_available.connect(lambda: signals.append(True))
+
+    thread._flush_pending()  # nothing pending: no signal
+    for i in range(3):
+        thread._queue_points([(i, 1.0)])
+    assert signals == [] and thread.drain() == []
+    thread._queue_points([(3, 1.0)])
+    assert len(signals) == 1
+    assert thread.drain() == [(0, 1.0), (1, 1.0), (2, 1.0), (3, 1.0)]
+
+
+def test_ready_queue_signals_once_until_drained():
+    """Only the first batch after a drain raises data_available."""
+    mock_manager = Mock()
+    mock_manager.measurement_state = MeasurementStateService()
+    thread = DataAcquisitionThread(mock_manager)
+    signals = []
+    thread.data_available.connect(lambda: signals.append(True))
+
+    for i in range(3):
+        thread._pending = [(i, 2.0)]
+        thread._flush_pending()
+    assert len(signals) == 1
+    assert thread.drain() == [(0, 2.0), (1, 2.0), (2, 2.0)]
+
+    thread._pending = [(3, 2.0)]
+    thread._flush_pending()
+    assert len(signals) == 2
+    assert thread.drain() == [(3, 2.0)]
+
+
+def test_discard_drops_ready_batches_and_rearms_signal():
+    """discard() empties the ready queue so the next batch signals again."""
+    mock_manager = Mock()
+    mock_manager.measurement_state = MeasurementStateService()
+    thread = DataAcquisitionThread(mock_manager)
+    signals = []
+    thread.data_available.connect(lambda: signals.append(True))
+
+    thread._pending = [(0, 2.0)]
+    thread._flush_pending()
+    thread.discard()
+    assert thread.drain() == []
+
+    thread._pending = [(1, 2.0)]
+    thread._flush_pending()
+    assert len(signals) == 2
+    assert thread.drain() == [(1, 2.0)]
+
+
 if __name__ == "__main__":
     test_index_reset()
@@ -29,10 +29,7 @@ def _make_controller():
     with (
         patch("gmcounter.ui.controllers.app_controller.DataAcquisitionThread"),
         patch("gmcounter.ui.controllers.app_controller.StatePollerThread"),
-        patch(
-            "gmcounter.ui.controllers.app_controller.find_orphan_journals",
-            return_value=[],
-        ),
+        patch("gmcounter.ui.controllers.app_controller.OrphanJournalScanWorker"),
     ):
         ctrl = AppController(dm, status_bar=status_bar)
     return ctrl
@@ -69,3 +66,115 @@ def test_app_controller_set_active_tab():
     ctrl.set_active_tab(mock_tab)
     assert ctrl._active_tab is mock_tab
     ctrl.cleanup()
+
+
+def test_emit_statistics_skips_when_no_new_frames():
+    ctrl = _make_controller()
+    mock_tab = MagicMock()
+    mock_tab.get_statistics.return_value = {"count": 3}
+    ctrl.set_active_tab(mock_tab)
+
+    ctrl._emit_statistics()
+    ctrl._emit_statistics()
+    assert mock_tab.get_statistics.call_count == 1
+
+    ctrl._is_measuring = True
+    ctrl._on_data_batch([(0, 10.0), (1, 12.0)])
+    ctrl._emit_statistics()
+    assert mock_tab.get_statistics.call_count == 2
+    ctrl.cleanup()
+
+
+def test_cleanup_async_runs_shutdown_off_thread_and_calls_back():
+    ctrl = _make_controller()
+    done = []
+    ctrl.cleanup_async(lambda: done.append(True))
+    assert ctrl._shutdown_worker.wait(5000)
+    _app.processEvents()
+    assert done == [True]
+    ctrl.device_manager.disconnect_device.assert_called_once()
+
+
+def test_ui_tick_drives_progress_and_periodic_statistics():
+    ctrl = _make_controller()
+    ctrl._stats_every = 2
+    ctrl._ui_ticks = 0
+    progress = []
+    ctrl.progress_updated.connect(lambda e, t: progress.append((e, t)))
+    ctrl._emit_statistics = MagicMock()
+
+    ctrl._is_measuring = True
+    ctrl._target_us = 10e6
+    ctrl._accum_us = 1.2e6
+    ctrl._on_ui_tick()
+    ctrl._on_ui_tick()  # same whole second: no repeat emit
+    assert progress == [(1, 10)]
+    assert ctrl._emit_statistics.call_count == 1
+
+    ctrl._accum_us = 2.0e6
+    ctrl._on_ui_tick()
+    assert progress == [(1, 10), (2, 10)]
+
+    ctrl._is_measuring = False
+    ctrl._accum_us = 3.0e6
+    ctrl._on_ui_tick()
+    assert progress[-1] == (2, 10)
+    assert ctrl._emit_statistics.call_count == 2
+    ctrl.cleanup()
+
+
+def test_state_poller_paused_for_the_reconnect_attempt():
+    ctrl = _make_controller()
+    poller = ctrl._state_poller
+    with patch("gmcounter.ui.controllers.app_controller.ReconnectWorker"):
+        ctrl._on_acquire_connection_lost()
+    poller.pause.assert_called_once()
+    poller.resume.assert_not_called()
+
+    ctrl._on_reconnect_succeeded()
+    poller.resume.assert_called_once()
+    poller.force_poll_soon.assert_called()
+    ctrl.cleanup()
+
+
+def test_set_active_tab_routes_frames_to_one_tab_only():
+    ctrl = _make_controller()
+    first, second = MagicMock(), MagicMock()
+    ctrl.set_active_tab(first)
+    ctrl.set_active_tab(first)  # no-op: no duplicate connection
+    ctrl.frames_ready.emit([])
+    assert first.on_frames.call_count == 1
+
+    ctrl.set_active_tab(second)
+    ctrl.frames_ready.emit([])
+    ctrl.measurement_stopped.emit()
+    assert first.on_frames.call_count == 1
+    assert second.on_frames.call_count == 1
+    first.on_measurement_stopped.assert_not_called()
+    second.on_measurement_stopped.assert_called_once()
+    ctrl.cleanup()
+
+
+def test_apply_settings_polls_device_state_immediately():
+    ctrl = _make_controller()
+    ctrl.device_manager.device = MagicMock()
+    ctrl.device_manager.apply_device_settings.return_value = {}
+
+    ctrl.apply_settings(voltage=500, counting_time=0, repeat=False)
+
+    ctrl._state_poller.force_poll_soon.assert_called_once_with()
+    ctrl.cleanup()
+
+
+def test_drain_discards_queued_points_between_measurements():
+    ctrl = _make_controller()
+    thread = ctrl._acquire_thread
+    ctrl._drain_acquisition()
+    thread.discard.assert_called_once_with()
+    thread.drain.assert_not_called()
+
+    thread.drain.return_value = []
+    ctrl._is_measuring = True
+    ctrl._drain_acquisition()
+    thread.drain.assert_called_once_with()
+    ctrl.cleanup()
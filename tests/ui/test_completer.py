@@ -0,0 +1,89 @@
+"""Tests for ui.common.completer — substring filter and lazy installation."""
+
+import gc
+import sys
+import pytest
+
+pytest.importorskip("PySide6", reason="completer requires PySide6")
+
+from PySide6.QtCore import QEvent
+from PySide6.QtGui import QFocusEvent
+from PySide6.QtWidgets import QApplication, QComboBox
+
+from gmcounter.ui.common.completer import (
+    ContainsFilterProxyModel,
+    install_contains_completer,
+)
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+_SAMPLES = ["BACKGROUND", "E87198", "Cs-137", "Co-60", "Am-241"]
+
+
+def _visible(proxy):
+    return [proxy.index(r, 0).data() for r in range(proxy.rowCount())]
+
+
+def test_empty_needle_accepts_everything():
+    proxy = ContainsFilterProxyModel(_SAMPLES)
+    assert _visible(proxy) == _SAMPLES
+
+
+def test_needle_matches_substring_case_insensitively():
+    proxy = ContainsFilterProxyModel(_SAMPLES)
+    proxy.set_needle("c")
+    assert _visible(proxy) == ["BACKGROUND", "Cs-137", "Co-60"]
+    proxy.set_needle("-1")
+    assert _visible(proxy) == ["Cs-137"]
+    proxy.set_needle("xyz")
+    assert _visible(proxy) == []
+
+
+def test_completer_is_built_on_first_focus():
+    combo = QComboBox()
+    combo.setEditable(True)
+    install_contains_completer(combo, _SAMPLES)
+    assert not isinstance(combo.completer().model(), ContainsFilterProxyModel)
+
+    QApplication.sendEvent(combo, QFocusEvent(QEvent.Type.FocusIn))
+    assert isinstance(combo.completer().model(), ContainsFilterProxyModel)
+
+
+def test_installer_cleanup_survives_dropped_combo():
+    """The installer's deleteLater() must not free its parent combo mid-delete."""
+
+    def focus_and_drop():
+        combo = QComboBox()
+        combo.setEditable(True)
+        install_contains_completer(combo, _SAMPLES)
+        QApplication.sendEvent(combo, QFocusEvent(QEvent.Type.FocusIn))
+
+    gc.disable()
+    try:
+        focus_and_drop()
+        QApplication.processEvents()  # runs the pending DeferredDelete
+    finally:
+        gc.enable()
+
+
+def test_trigram_prefilter_agrees_with_substring_scan():
+    items = [f"Sample-{i:04d}-{'abc'[i % 3]}" for i in range(300)] + _SAMPLES
+    proxy = ContainsFilterProxyModel(items)
+    for needle in ("sam", "ple-01", "0042-a", "-c", "cs-1", "zzz", "round"):
+        proxy.set_needle(needle)
+        assert _visible(proxy) == [s for s in items if needle in s.lower()]
+
+
+def test_typing_on_narrows_previous_matches_and_casefolds():
+    items = ["Straße 1", "STRASSE 2", "Strand", "Cs-137"]
+    proxy = ContainsFilterProxyModel(items)
+    proxy.set_needle("s")
+    assert _visible(proxy) == items
+    proxy.set_needle("str")
+    assert _visible(proxy) == ["Straße 1", "STRASSE 2", "Strand"]
+    proxy.set_needle("strass")
+    assert _visible(proxy) == ["Straße 1", "STRASSE 2"]
+    proxy.set_needle("stran")  # not an extension: falls back to the index
+    assert _visible(proxy) == ["Strand"]
+    proxy.set_needle("")
+    assert _visible(proxy) == items
@@ -0,0 +1,45 @@
+"""Tests for ui.widgets.event_log_panel.EventLogPanel."""
+
+import sys
+import pytest
+
+pytest.importorskip("PySide6", reason="EventLogPanel requires PySide6")
+
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QApplication, QMainWindow
+
+from gmcounter.ui.widgets import event_log_panel
+from gmcounter.ui.widgets.event_log_panel import EventLogPanel
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+
+def test_newest_entry_last_and_bounded(monkeypatch):
+    monkeypatch.setattr(event_log_panel, "_MAX_ENTRIES", 3)
+    window = QMainWindow()  # keeps the dock (and its view) alive
+    panel = EventLogPanel(window)
+    for i in range(5):
+        panel.append(f"msg {i}", "green")
+
+    lines = panel._view.toPlainText().split("\n")
+    assert len(lines) == 3
+    assert lines[0].endswith("msg 2")
+    assert lines[-1].endswith("msg 4")
+
+
+def test_entry_keeps_its_colour():
+    window = QMainWindow()
+    panel = EventLogPanel(window)
+    panel.append("fehler", "red")
+    cursor = QTextCursor(panel._view.document().lastBlock())
+    cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock)
+    assert cursor.charFormat().foreground().color().name() == "#cc2222"
+
+
+def test_clear_log_empties_view():
+    window = QMainWindow()
+    panel = EventLogPanel(window)
+    panel.append("<b>not markup</b>")
+    assert "<b>not markup</b>" in panel._view.toPlainText()
+    panel.clear_log()
+    assert panel._view.toPlainText() == ""
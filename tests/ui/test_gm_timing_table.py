@@ -0,0 +1,204 @@
+"""Tests for the GMTimingTab sample store, history table, histogram, statistics and embedding."""
+
+import sys
+import pytest
+
+pytest.importorskip("PySide6", reason="GMTimingTab requires PySide6")
+
+import numpy as np
+
+from PySide6.QtWidgets import QApplication, QTabWidget, QTableView, QWidget
+
+from gmcounter.core.models import Frame
+from gmcounter.core.utils import calculate_statistics
+from gmcounter.ui.tabs.base import PlotTabBase
+from gmcounter.ui.tabs.gm_timing_tab import (
+    GMTimingTab,
+    _HistoryTableModel,
+    _SampleColumns,
+)
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _column(model, col):
+    return [model.index(r, col).data() for r in range(model.rowCount())]
+
+
+def _batch(indices):
+    idx = np.array(list(indices))
+    return idx, idx.astype(float), [""] * len(idx)
+
+
+def test_append_rows_inserts_once_per_batch():
+    model = _HistoryTableModel(limit=10)
+    inserted = []
+    model.rowsInserted.connect(lambda _p, first, last: inserted.append((first, last)))
+
+    model.append_rows(
+        np.array([0, 1, 2]), np.array([1.5, 2.5, 3.5]), ["t0", "t1", "t2"]
+    )
+
+    assert inserted == [(0, 2)]
+    assert _column(model, 0) == ["0", "1", "2"]
+    assert model.index(1, 1).data() == "2.5"
+    assert model.index(2, 2).data() == "t2"
+
+
+def test_append_rows_trims_oldest_beyond_limit():
+    model = _HistoryTableModel(limit=4)
+    removed = []
+    model.rowsRemoved.connect(lambda _p, first, last: removed.append((first, last)))
+
+    model.append_rows(*_batch(range(3)))
+    model.append_rows(*_batch(range(3, 6)))
+    assert removed == [(0, 1)]
+    assert _column(model, 0) == ["2", "3", "4", "5"]
+
+    # A batch larger than the limit keeps only its own tail
+    model.append_rows(*_batch(range(6, 16)))
+    assert _column(model, 0) == ["12", "13", "14", "15"]
+
+    model.clear()
+    assert model.rowCount() == 0
+
+
+def test_sample_columns_grow_and_format_rows():
+    store = _SampleColumns(capacity=2)
+    store.extend([1, 2, 3], [10.5, 20.0, 30.25], ["a", "a", "b"])
+    store.extend([4], [40.0], ["c"])
+
+    assert len(store) == 4
+    assert store.values().tolist() == [10.5, 20.0, 30.25, 40.0]
+    assert store.values(last=2).tolist() == [30.25, 40.0]
+    assert store.csv_rows() == [
+        ["1", "10.5", "a"],
+        ["2", "20.0", "a"],
+        ["3", "30.25", "b"],
+        ["4", "40.0", "c"],
+    ]
+
+    store.clear()
+    assert len(store) == 0 and store.csv_rows() == []
+
+
+def test_row_view_formats_a_snapshot_lazily():
+    store = _SampleColumns()
+    store.extend([1, 2, 3], [10.5, 20.0, 30.25], ["a", "a", "b"])
+    rows = store.row_view()
+    expected = store.csv_rows()
+
+    store.clear()
+    store.extend([7], [1.0], ["z"])
+
+    assert len(rows) == 3 and rows
+    assert [list(r) for r in rows] == expected
+    assert rows[1] == ["2", "20.0", "a"]
+
+
+def test_histogram_is_built_when_its_tab_is_shown():
+    tabs = QTabWidget()
+    plot_page, hist_page = QWidget(), QWidget()
+    tabs.addTab(plot_page, "Zeitverlauf")
+    tabs.addTab(hist_page, "Histogramm")
+    tab = GMTimingTab()
+    tab.inject_ui_containers(plot_page, hist_page, QTableView(), tab_widget=tabs)
+    tab.build()
+
+    assert tab._histogram is None
+    tabs.setCurrentIndex(1)
+    assert tab._histogram is not None
+    assert hist_page.layout().indexOf(tab._histogram) == 0
+    tab.on_measurement_stopped()
+
+
+def test_embed_twice_reuses_the_container_layout():
+    container, first, second = QWidget(), QWidget(), QWidget()
+    PlotTabBase._embed(container, first)
+    layout = container.layout()
+
+    PlotTabBase._embed(container, second)
+
+    assert container.layout() is layout
+    assert layout.count() == 1
+    assert layout.itemAt(0).widget() is second
+
+
+def test_statistics_follow_frames_and_reset():
+    tab = GMTimingTab()
+    values = [120.0, 80.5, 300.25, 95.0]
+    tab.on_frames([Frame(index=i, value=v, timestamp="") for i, v in enumerate(values)])
+
+    expected = calculate_statistics(values)
+    stats = tab.get_statistics()
+    assert stats["count"] == len(values) + 1
+    assert stats["min"] == expected["min"] and stats["max"] == expected["max"]
+    assert stats["avg"] == pytest.approx(expected["mean"])
+    assert stats["stdev"] == pytest.approx(expected["std"])
+
+    tab.on_reset()
+    assert tab.get_statistics() == {}
+
+
+def test_large_deliveries_use_the_vectorized_statistics_path():
+    tab = GMTimingTab()
+    values = [float(100 + (i * 37) % 250) for i in range(200)]
+    tab.on_frames([Frame(index=i, value=v, timestamp="") for i, v in enumerate(values)])
+    tab.on_frames([Frame(index=200, value=50.0, timestamp="")])
+
+    expected = calculate_statistics(values + [50.0])
+    stats = tab.get_statistics()
+    assert stats["min"] == 50.0 and stats["max"] == expected["max"]
+    assert stats["avg"] == pytest.approx(expected["mean"])
+    assert stats["stdev"] == pytest.approx(expected["std"])
+    assert tab._cum_us == pytest.approx(sum(values) + 50.0)
+
+
+def test_repeated_reset_leaves_empty_views_alone():
+    tab = GMTimingTab()
+    tab.inject_ui_containers(QWidget(), QWidget(), QTableView())
+    tab.build()
+    resets = []
+    tab._table_model.modelReset.connect(lambda: resets.append(True))
+
+    tab.on_frames([Frame(index=1, value=10.0, timestamp="")])
+    tab.on_reset()
+    tab.on_reset()
+    assert len(resets) == 1
+    tab.on_measurement_stopped()
+
+
+def test_gui_tick_shows_only_rows_added_since_the_last_tick():
+    tab = GMTimingTab()
+    tab.inject_ui_containers(QWidget(), QWidget(), QTableView())
+    tab.build()
+    model = tab._table_model
+
+    tab.on_frames([Frame(index=i, value=float(i), timestamp=f"t{i}") for i in (1, 2)])
+    tab._process_queue()
+    tab._process_queue()  # nothing new — no second insert
+    tab.on_frames([Frame(index=3, value=3.0, timestamp="t3")])
+    tab._process_queue()
+
+    assert _column(model, 0) == ["1", "2", "3"]
+    assert _column(model, 2) == ["t1", "t2", "t3"]
+    tab.on_measurement_stopped()
+
+
+def test_hidden_histogram_is_not_rebinned_until_shown():
+    tabs = QTabWidget()
+    plot_page, hist_page = QWidget(), QWidget()
+    tabs.addTab(plot_page, "Zeitverlauf")
+    tabs.addTab(hist_page, "Histogramm")
+    tab = GMTimingTab()
+    tab.inject_ui_containers(plot_page, hist_page, QTableView(), tab_widget=tabs)
+    tab.build()
+
+    for i in range(12):
+        tab.on_frames([Frame(index=i, value=float(10 + i), timestamp="")])
+        tab._process_queue()
+    assert tab._histogram is None
+
+    tabs.setCurrentIndex(1)
+    assert tab._histogram is not None
+    tab.on_measurement_stopped()
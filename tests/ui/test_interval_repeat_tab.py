@@ -0,0 +1,77 @@
+"""Tests for ui.tabs.interval_repeat_tab.IntervalRepeatTab live refresh."""
+
+import sys
+import pytest
+
+pytest.importorskip("PySide6", reason="IntervalRepeatTab requires PySide6")
+
+from PySide6.QtWidgets import (
+    QApplication,
+    QDoubleSpinBox,
+    QLabel,
+    QSpinBox,
+    QTableView,
+    QWidget,
+)
+
+from gmcounter.core.models import Frame
+from gmcounter.ui.tabs.interval_repeat_tab import IntervalRepeatTab
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _make_tab():
+    width, repeats = QDoubleSpinBox(), QSpinBox()
+    width.setValue(1.0)
+    repeats.setValue(3)
+    tab = IntervalRepeatTab()
+    tab.inject_ui(QWidget(), QTableView(), width, repeats, QLabel())
+    tab.build()
+    tab.on_reset()
+    return tab
+
+
+def _frames(values):
+    return [Frame(index=i, value=v, timestamp="") for i, v in enumerate(values)]
+
+
+def test_frames_only_mark_bins_until_the_refresh_fires():
+    tab = _make_tab()
+    tab.on_frames(_frames([400_000.0]))
+    tab.on_frames(_frames([800_000.0]))
+
+    assert tab._table_model.rowCount() == 0
+    assert tab._dirty_bins == {0, 1}
+    assert tab._refresh_timer.isActive()
+
+    tab._flush_refresh()
+    assert tab._table_model.rowCount() == 2
+    assert tab._table_model.item(1, 1).text() == "1"
+    assert not tab._dirty_bins and not tab._refresh_timer.isActive()
+
+
+def test_stop_flushes_pending_bins_and_reset_drops_them():
+    tab = _make_tab()
+    tab.on_frames(_frames([400_000.0]))
+    tab.on_measurement_stopped()
+    assert tab._table_model.item(0, 1).text() == "2"
+
+    tab.on_frames(_frames([900_000.0]))
+    tab.on_reset()
+    assert not tab._dirty_bins and not tab._refresh_timer.isActive()
+    assert tab._table_model.rowCount() == 0
+
+
+def test_refresh_reuses_the_row_items():
+    tab = _make_tab()
+    tab.on_frames(_frames([2_500_000.0]))  # touches bins 0 (seed) and 2
+    tab._flush_refresh()
+    model = tab._table_model
+    assert model.rowCount() == 3
+    assert [model.item(1, c).text() for c in range(5)] == ["0"] * 5
+    item = model.item(2, 1)
+
+    tab.on_frames(_frames([100_000.0]))
+    tab._flush_refresh()
+    assert model.item(2, 1) is item
+    assert item.text() == "2"
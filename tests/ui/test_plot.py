@@ -0,0 +1,36 @@
+"""Tests for ui.widgets.plot histogram binning."""
+
+import pytest
+
+pytest.importorskip("PySide6", reason="ui.widgets.plot requires PySide6")
+pytest.importorskip("pyqtgraph", reason="ui.widgets.plot requires pyqtgraph")
+
+import numpy as np
+
+from gmcounter.ui.widgets.plot import _equal_width_histogram
+
+
+@pytest.mark.parametrize("bins", [1, 7, 10, 50])
+def test_equal_width_histogram_matches_numpy_on_integer_data(bins):
+    rng = np.random.default_rng(0)
+    data = rng.integers(100, 255, size=5000).astype(np.float64)
+    counts, edges = _equal_width_histogram(data, bins)
+    ref_counts, ref_edges = np.histogram(data, bins=bins)
+    np.testing.assert_array_equal(counts, ref_counts)
+    np.testing.assert_array_equal(edges, ref_edges)
+
+
+def test_equal_width_histogram_matches_numpy_on_edge_values():
+    # Range 154 over 10 bins: lo + 77 sits exactly on the edge of bin 5
+    data = np.array([100.0, 177.0, 254.0] + [100 + 15.4 * k for k in range(11)])
+    for src in (data, data.astype(np.float32)):
+        counts, _ = _equal_width_histogram(src, 10)
+        ref, _ = np.histogram(src.astype(np.float64), bins=10)
+        np.testing.assert_array_equal(counts, ref)
+
+
+def test_equal_width_histogram_widens_constant_data():
+    counts, edges = _equal_width_histogram(np.full(4, 3.0), 2)
+    ref_counts, ref_edges = np.histogram(np.full(4, 3.0), bins=2)
+    np.testing.assert_array_equal(counts, ref_counts)
+    np.testing.assert_array_equal(edges, ref_edges)
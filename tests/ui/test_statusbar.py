@@ -0,0 +1,37 @@
+"""Tests for ui.common.statusbar.StatusBarManager."""
+
+import sys
+import pytest
+
+pytest.importorskip("PySide6", reason="StatusBarManager requires PySide6")
+
+from unittest.mock import patch
+from PySide6.QtWidgets import QApplication, QStatusBar
+
+from gmcounter.ui.common.statusbar import StatusBarManager
+
+_app = QApplication.instance() or QApplication(sys.argv)
+
+
+def test_identical_messages_in_a_burst_are_dropped():
+    bar = QStatusBar()
+    manager = StatusBarManager(bar)
+    with patch.object(bar, "showMessage", wraps=bar.showMessage) as show:
+        manager.show_message("Verbinde...", "orange")
+        manager.show_message("Verbinde...", "orange")
+        assert show.call_count == 1
+
+        manager.show_message("Verbunden", "green")
+        assert show.call_count == 2
+        assert bar.currentMessage() == "Verbunden"
+        assert "background-color: green;" in bar.styleSheet()
+
+
+def test_repeat_after_dedupe_window_is_shown_again():
+    bar = QStatusBar()
+    manager = StatusBarManager(bar)
+    manager.show_message("Bereit")
+    manager._since_last.invalidate()  # as if the window had elapsed
+    with patch.object(bar, "showMessage") as show:
+        manager.show_message("Bereit")
+    show.assert_called_once_with("Bereit")